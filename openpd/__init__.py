@@ -36,20 +36,24 @@ from openpd.utils import *
 from openpd.element import *
 from openpd.loader import Loader, PDBLoader, SequenceLoader
 
-from openpd.force import Force
+from openpd.force import Force, LookupTable, NeighborList
+from openpd.force import loadForceFieldTables, clearForceFieldCache
+from openpd.force import getForceFieldCacheSize, getForceFieldCacheLimit, setForceFieldCacheLimit
 from openpd.force import PDFFNonBondedForceField, PDFFNonBondedForce
 from openpd.force import PDFFBondForceField, PDFFBondForce
 from openpd.force import PDFFTorsionForceField, PDFFTorsionForce
+from openpd.force import PDFFHydroFieldForceField, PDFFHydroFieldForce
 from openpd.force import CenterConstraintForce
 
 from openpd.ensemble import Ensemble
 from openpd.forceEncoder import ForceEncoder
 
-from openpd.integrator import Integrator
-from openpd.integrator import VerletIntegrator, LeapFrogIntegrator, VelocityVerletIntegrator
-from openpd.integrator import BrownianIntegrator, MCMCIntegrator
+from openpd.integrator import WorkerPool, Integrator
+from openpd.integrator import VerletIntegrator, LeapFrogIntegrator, VelocityVerletIntegrator, RESPAIntegrator
+from openpd.integrator import BrownianIntegrator, LangevinIntegrator, MCMCIntegrator
 
 from openpd.dumper import Dumper, LogDumper, SnapshotDumper, PDBDumper, XYZDumper
+from openpd.dumper import TrajectoryDumper, TrajectoryFile, convertPDSToPDT, convertPDTToPDS
 
 from openpd.simulation import Simulation
 
@@ -60,17 +64,21 @@ import openpd.benchmark as benchmark
 __all__ = [
     'Atom', 'Peptide', 'Chain', 'System', 'Topology',
     'Loader', 'PDBLoader', 'SequenceLoader',
-    'Force',
+    'Force', 'LookupTable', 'NeighborList',
+    'loadForceFieldTables', 'clearForceFieldCache',
+    'getForceFieldCacheSize', 'getForceFieldCacheLimit', 'setForceFieldCacheLimit',
     'PDFFNonBondedForceField', 'PDFFNonBondedForce',
     'PDFFBondForceField', 'PDFFBondForce',
     'PDFFTorsionForceField', 'PDFFTorsionForce',
+    'PDFFHydroFieldForceField', 'PDFFHydroFieldForce',
     'CenterConstraintForce',
     'ForceEncoder',
     'Ensemble',
-    'Integrator',
-    'VerletIntegrator', 'LeapFrogIntegrator', 'VelocityVerletIntegrator',
-    'BrownianIntegrator', 'MCMCIntegrator',
+    'WorkerPool', 'Integrator',
+    'VerletIntegrator', 'LeapFrogIntegrator', 'VelocityVerletIntegrator', 'RESPAIntegrator',
+    'BrownianIntegrator', 'LangevinIntegrator', 'MCMCIntegrator',
     'Dumper', 'LogDumper', 'SnapshotDumper', 'PDBDumper', 'XYZDumper',
+    'TrajectoryDumper', 'TrajectoryFile', 'convertPDSToPDT', 'convertPDTToPDS',
     'Simulation',
     'SystemVisualizer', 'SnapshotVisualizer'
 ]
\ No newline at end of file
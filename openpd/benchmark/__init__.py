@@ -5,7 +5,8 @@ __copyright__ = "Copyright 2021-2021, Southeast University and Zhenyu Wei"
 __license__ = "GPLv3"
 
 from .downloader import PDBDownloader
+from .unitModeBenchmark import UnitModeBenchmark
 
 __all__ = [
-    'PDBDownloader'
+    'PDBDownloader', 'UnitModeBenchmark'
 ]
\ No newline at end of file
@@ -0,0 +1,157 @@
+import os, time
+import numpy as np
+from .. import PDBLoader, ForceEncoder, VelocityVerletIntegrator
+from ..unit import *
+from ..unit import QuantityArray
+from ..exceptions import NotincludedInteractionError
+
+class _UnitModeVelocityVerletIntegrator(VelocityVerletIntegrator):
+    def _calculateForces(self, force_group=[0]):
+        # Forces come from the Quantity API of each force, atom by atom, instead of the reduced kernels of Ensemble
+        forces = np.zeros([self._system.num_atoms, 3])
+        for atom_id in range(self._system.num_atoms):
+            atom_force = QuantityArray(np.zeros([3]), kilojoule_permol_over_angstrom)
+            for force in self._ensemble.getForcesByGroup(force_group):
+                atom_force += force.calculateAtomForce(atom_id)
+            forces[atom_id, :] = atom_force / kilojoule_permol_over_angstrom
+        return forces
+
+class UnitModeBenchmark:
+    def __init__(self, pdb_file_path, sim_interval=1, temperature=300, seed=None) -> None:
+        """
+        Parameters
+        ----------
+        pdb_file_path : str
+            the path of the ``.pdb`` file of the benchmark system
+        sim_interval : int or float, optional
+            the step interval of ``VelocityVerletIntegrator``, by default ``1 * femtosecond``
+        temperature : int or float, optional
+            the initial temperature of the system, by default ``300 * kelvin``
+        seed : int, optional
+            the seed of the random number generator of initial velocity, by default None, 
+            which means a random seed shared by both modes
+        """
+        self._pdb_file_path = pdb_file_path
+        self._system = PDBLoader(pdb_file_path).createSystem()
+        self._ensemble = ForceEncoder(self._system).createEnsemble()
+        self._sim_interval = sim_interval
+        self._temperature = temperature
+        # Both modes use the same seed, so that they integrate the same trajectory
+        self._seed = np.random.SeedSequence(seed).generate_state(1)[0]
+        self._origin_coordinate = self._system.coordinate_array.copy()
+
+    def __repr__(self) -> str:
+        return (
+            '<UnitModeBenchmark object: %s, %d atoms, at 0x%x>'
+            %(os.path.basename(self._pdb_file_path), self._system.num_atoms, id(self))
+        )
+
+    __str__ = __repr__
+
+    def _run(self, integrator, num_steps, calculate_energy):
+        self._system.coordinate_array[:, :] = self._origin_coordinate
+        self._system.updateCoordinateVersion()
+        # Initial velocity is set at bind time by the seeded integrator
+        integrator._bindEnsemble(self._ensemble)
+        energies = []
+        start_time = time.perf_counter()
+        for _ in range(num_steps):
+            integrator.step(1)
+            energies.append(calculate_energy())
+        return time.perf_counter() - start_time, self._system.coordinate_array.copy(), energies
+
+    def runReducedMode(self, num_steps):
+        """
+        runReducedMode integrates ``num_steps`` steps with ``VelocityVerletIntegrator`` 
+        and the reduced kernels of ``Ensemble`` in the internal unit system
+
+        The potential energy of each step is recorded, as a minimizer or a dumper would do
+
+        Returns
+        -------
+        tuple(float, np.ndarray, list)
+            - The wall time in second
+            - (num_atoms, 3) final coordinate, in unit of ``angstrom``
+            - The potential energy of each step, in unit of ``kilojoule_permol``
+        """
+        integrator = VelocityVerletIntegrator(self._sim_interval, self._temperature, seed=self._seed)
+        return self._run(integrator, num_steps, self._ensemble.calculateReducedPotentialEnergy)
+
+    def _calculateUnitEnergy(self):
+        energy = 0 * kilojoule_permol
+        for force in self._ensemble.forces:
+            energy += force.calculatePotentialEnergy()
+        return energy / kilojoule_permol
+
+    def runUnitMode(self, num_steps):
+        """
+        runUnitMode integrates ``num_steps`` steps with ``VelocityVerletIntegrator`` 
+        and ``Quantity`` attached to every force evaluation
+
+        Forces and the potential energy of each step come from ``calculateAtomForce()`` 
+        and ``calculatePotentialEnergy()`` of each ``Force``, neither the reduced kernels of ``Ensemble`` nor its cache are used
+
+        Returns
+        -------
+        tuple(float, np.ndarray, list)
+            - The wall time in second
+            - (num_atoms, 3) final coordinate, in unit of ``angstrom``
+            - The potential energy of each step, in unit of ``kilojoule_permol``
+        """
+        integrator = _UnitModeVelocityVerletIntegrator(self._sim_interval, self._temperature, seed=self._seed)
+        return self._run(integrator, num_steps, self._calculateUnitEnergy)
+
+    def run(self, num_steps=100):
+        """
+        run runs both modes from the same initial state and compares them
+
+        Parameters
+        ----------
+        num_steps : int, optional
+            the number of steps of each mode, by default 100
+
+        Returns
+        -------
+        dict
+            ``reduced_time`` and ``unit_time`` in second, the ``speedup`` of reduced mode,
+            the ``max_deviation`` of final coordinates in angstrom 
+            and the ``max_energy_deviation`` of potential energies in kilojoule_permol
+        """
+        reduced_time, reduced_coord, reduced_energies = self.runReducedMode(num_steps)
+        unit_time, unit_coord, unit_energies = self.runUnitMode(num_steps)
+        return {
+            'reduced_time': reduced_time,
+            'unit_time': unit_time,
+            'speedup': unit_time / reduced_time,
+            'max_deviation': np.abs(reduced_coord - unit_coord).max(),
+            'max_energy_deviation': np.abs(np.array(reduced_energies) - np.array(unit_energies)).max()
+        }
+
+    @property
+    def system(self):
+        """
+        system gets the benchmark ``System``
+
+        Returns
+        -------
+        System
+            the benchmark ``System``
+        """
+        return self._system
+
+if __name__ == '__main__':
+    data_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'tests/data')
+    for file_name in ['normal.pdb', 'multiChain.pdb']:
+        try:
+            benchmark = UnitModeBenchmark(os.path.join(data_dir, file_name), seed=0)
+        except NotincludedInteractionError as error:
+            print('%-16s skipped: %s' %(file_name, error))
+            continue
+        result = benchmark.run(100)
+        print(
+            '%-16s %4d atoms: reduced %.3f s, unit %.3f s, speedup %.1fx, max deviation %.2e A, %.2e kj/mol'
+            %(
+                file_name, benchmark.system.num_atoms, result['reduced_time'], result['unit_time'], 
+                result['speedup'], result['max_deviation'], result['max_energy_deviation']
+            )
+        )
@@ -9,11 +9,17 @@ from .logDumper import LogDumper
 from .snapshotDumper import SnapshotDumper
 from .pdbDumper import PDBDumper
 from .xyzDumper import XYZDumper
+from .trajectoryDumper import TrajectoryDumper
+from .trajectoryFile import TrajectoryFile, convertPDSToPDT, convertPDTToPDS
 
 __all__ = [
     'Dumper',
     'LogDumper',
     'SnapshotDumper',
     'PDBDumper',
-    'XYZDumper'
+    'XYZDumper',
+    'TrajectoryDumper',
+    'TrajectoryFile',
+    'convertPDSToPDT',
+    'convertPDTToPDS'
 ]
\ No newline at end of file
@@ -1,29 +1,206 @@
+import atexit, queue, threading
 from ..exceptions import NonboundError, RebindError
 
+# Put into the queue to stop the writer thread
+_STOP_WRITER = object()
+
+# Dumpers with an open file handle. References are held until close(), so that a dumper dropped
+# without close() is not garbage collected with its buffered tail unwritten
+_OPEN_DUMPERS = set()
+
+@atexit.register
+def _closeDumpers():
+    # Registered once by atexit, so that the tail of buffer is written when interpreter exits
+    for dumper in list(_OPEN_DUMPERS):
+        dumper.close()
+
 class Dumper:
-    def __init__(self, output_file, dump_interval:int, is_overwrite=True) -> None:
+    def __init__(
+        self, output_file, dump_interval:int, is_overwrite=True,
+        buffer_size=65536, is_background=False, max_queue_size=64
+    ) -> None:
+        """
+        Parameters
+        ----------
+        output_file : str
+            the path of output file
+        dump_interval : int
+            the number of steps between two dumps
+        is_overwrite : bool, optional
+            overwrite the existing file, by default True
+        buffer_size : int, optional
+            the size in bytes of the in-memory buffer of the file handle, by default 65536
+        is_background : bool, optional
+            format and write in a background thread, by default False.
+            ``dump()`` only takes a snapshot of state and puts it into a bounded queue
+        max_queue_size : int, optional
+            the maximum number of snapshots waiting in the queue, by default 64.
+            ``dump()`` blocks when the queue is full
+        """
         self._output_file = output_file
         if is_overwrite:
             io = open(self._output_file, 'w')
             io.close()
         self._dump_interval = dump_interval
+        self._buffer_size = buffer_size
+        self._is_background = is_background
+        self._max_queue_size = max_queue_size
         self._is_bound = False
-        
+        self._io = None
+        self._queue = None
+        self._writer = None
+        self._writer_error = None
+
     def _test_bound(self):
         if not self._is_bound:
             raise NonboundError(
                 'Dumper has not been bound to any Simulation!'
             )
-            
+
     def bindSimulation(self, simulation):
+        """
+        bindSimulation binds ``self`` to a ``Simulation`` and opens the persistent file handle
+
+        Raises
+        ------
+        openpd.exceptions.RebindError
+            When ``self`` is bound multi-times
+        """
         if self._is_bound == True:
             raise RebindError('Dumper has been bound to %s' %(self._simulation))
         self._simulation = simulation
         self._is_bound = True
-        
-    def dump(self):
+        self._io = open(self._output_file, 'ab', buffering=self._buffer_size)
+        if self._is_background:
+            self._queue = queue.Queue(maxsize=self._max_queue_size)
+            self._writer = threading.Thread(target=self._runWriter, daemon=True)
+            self._writer.start()
+        _OPEN_DUMPERS.add(self)
+
+    def _runWriter(self):
+        while True:
+            snapshot = self._queue.get()
+            try:
+                if snapshot is _STOP_WRITER:
+                    return
+                if self._writer_error is None:
+                    self._write(self._formatSnapshot(snapshot))
+            except BaseException as error:
+                self._writer_error = error
+            finally:
+                self._queue.task_done()
+
+    def _raiseWriterError(self):
+        if self._writer_error is not None:
+            error, self._writer_error = self._writer_error, None
+            raise error
+
+    def _write(self, data):
+        if isinstance(data, str):
+            data = data.encode()
+        self._io.write(data)
+
+    def _takeSnapshot(self):
+        """
+        _takeSnapshot copies the state needed by ``_formatSnapshot()`` on the simulation thread
+
+        This method needs to be overloaded for all subclass
+
+        Raises
+        ------
+        NotImplementedError
+            When the subclass does not overload this method
+        """
         raise NotImplementedError('dump() method has not been overloaded yet!')
-    
+
+    def _formatSnapshot(self, snapshot):
+        """
+        _formatSnapshot formats a snapshot into the content of file, which may run in the background thread
+
+        This method needs to be overloaded for all subclass
+
+        Raises
+        ------
+        NotImplementedError
+            When the subclass does not overload this method
+        """
+        raise NotImplementedError('dump() method has not been overloaded yet!')
+
+    def dump(self):
+        """
+        dump takes a snapshot of the bound ``Simulation`` and writes it
+
+        When ``is_background=True``, the snapshot is formatted and written by the background thread
+
+        Raises
+        ------
+        openpd.exceptions.NonboundError
+            When ``self`` has not been bound to any ``Simulation``
+        """
+        self._test_bound()
+        self._raiseWriterError()
+        snapshot = self._takeSnapshot()
+        if self._is_background:
+            self._queue.put(snapshot)
+        else:
+            self._write(self._formatSnapshot(snapshot))
+
+    def flush(self):
+        """
+        flush waits for the queued snapshots and writes the buffer to file
+
+        Raises
+        ------
+        Exception
+            The error raised by the background thread, if any
+        """
+        if self._io is None or self._io.closed:
+            return
+        if self._is_background:
+            self._queue.join()
+        self._io.flush()
+        self._raiseWriterError()
+
+    def close(self):
+        """
+        close flushes ``self``, stops the background thread and closes the file handle
+        """
+        _OPEN_DUMPERS.discard(self)
+        if self._io is None or self._io.closed:
+            return
+        try:
+            self.flush()
+        finally:
+            if self._writer is not None:
+                self._queue.put(_STOP_WRITER)
+                self._writer.join()
+                self._writer = None
+            self._io.close()
+
     @property
     def dump_interval(self):
-        return self._dump_interval
\ No newline at end of file
+        return self._dump_interval
+
+    @property
+    def buffer_size(self):
+        """
+        buffer_size gets the size in bytes of the in-memory buffer
+
+        Returns
+        -------
+        int
+            the size of buffer
+        """
+        return self._buffer_size
+
+    @property
+    def is_background(self):
+        """
+        is_background gets whether snapshots are formatted and written in a background thread
+
+        Returns
+        -------
+        bool
+            True if a background writer thread is used
+        """
+        return self._is_background
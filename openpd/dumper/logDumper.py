@@ -17,8 +17,15 @@ class LogDumper(Dumper):
         get_torsion_energy=False,
         get_total_energy=False,
         get_mass_center=False,
+        get_force_time=False,
+        buffer_size=65536,
+        is_background=False,
+        max_queue_size=64
     ) -> None:
-        super().__init__(output_file, dump_interval, is_overwrite)
+        super().__init__(
+            output_file, dump_interval, is_overwrite,
+            buffer_size=buffer_size, is_background=is_background, max_queue_size=max_queue_size
+        )
         self.flag_dict = {
             "Steps": [get_steps, 10, self._getSteps],
             "Elapsed Time": [get_elapsed_time, 20, self._getElapsedTime],
@@ -30,7 +37,8 @@ class LogDumper(Dumper):
             "Nonbonded Energy (kj/mol)": [get_nonbonded_energy, 27, self._getNonBondedEnergy],
             "Torsion Energy (kj/mol)": [get_torsion_energy, 25, self._getTorsionEnergy],
             "Total Energy (kj/mol)": [get_total_energy, 23, self._getTotalEnergy],
-            "Mass Center": [get_mass_center, 30, self._getMassCenter]
+            "Mass Center": [get_mass_center, 30, self._getMassCenter],
+            "Force Time (s)": [get_force_time, 40, self._getForceTime]
         }
         
     def __repr__(self):
@@ -80,8 +88,9 @@ class LogDumper(Dumper):
             '{:<%d}' %self.flag_dict["Potential Energy (kj/mol)"][1]
         ).format(
             '%.5f' %(
-                self._simulation._ensemble.calculatePotentialEnergy() / 
-                kilojoule_permol
+                self._simulation._ensemble.calculateReducedPotentialEnergy(
+                    self._simulation._ensemble.force_groups
+                )
             )
         )
     
@@ -102,11 +111,10 @@ class LogDumper(Dumper):
                 nonbonded_force = force
                 break
         return(
-            '{:<%d}' %self.flag_dict["Torsion Energy (kj/mol)"][1]
+            '{:<%d}' %self.flag_dict["Nonbonded Energy (kj/mol)"][1]
         ).format(
             '%.5f' %(
-                nonbonded_force.calculatePotentialEnergy() / 
-                kilojoule_permol
+                self._simulation._ensemble.calculateReducedForceEnergyAndForces(nonbonded_force.force_id)[0]
             )
         )
         
@@ -117,35 +125,30 @@ class LogDumper(Dumper):
                 torsion_force = force
                 break
         return(
-            '{:<%d}' %self.flag_dict["Nonbonded Energy (kj/mol)"][1]
+            '{:<%d}' %self.flag_dict["Torsion Energy (kj/mol)"][1]
         ).format(
             '%.5f' %(
-                torsion_force.calculatePotentialEnergy() / 
-                kilojoule_permol
+                self._simulation._ensemble.calculateReducedForceEnergyAndForces(torsion_force.force_id)[0]
             )
         )
         
     def _getTotalEnergy(self):
         return(
-            '{:<%d}' %self.flag_dict["Potential Energy (kj/mol)"][1]
+            '{:<%d}' %self.flag_dict["Total Energy (kj/mol)"][1]
         ).format(
             '%.5f' %(
-                (
-                    self._simulation._ensemble.calculatePotentialEnergy() +
-                    self._simulation._integrator.calculateKineticEnergy()
-                ) / kilojoule_permol
+                self._simulation._ensemble.calculateReducedPotentialEnergy(
+                    self._simulation._ensemble.force_groups
+                ) +
+                self._simulation._integrator.calculateKineticEnergy() / kilojoule_permol
             )
         )
 
     def _getMassCenter(self):
-        mass_center = np.zeros(3) * angstrom * amu
-        total_mass = 0 * amu
-        for atom in self._simulation._ensemble.system.atoms:
-            mass_center += atom.coordinate * atom.mass
-            total_mass += atom.mass
-        mass_center /= total_mass * angstrom
+        system = self._simulation._ensemble.system
+        mass_center = (system.coordinate_array * system.mass_array).sum(0) / system.mass_array.sum()
         return(
-            '{:<%d}' %self.flag_dict["Potential Energy (kj/mol)"][1]
+            '{:<%d}' %self.flag_dict["Mass Center"][1]
         ).format(
             '%.3f %.3f %.3f' %(
                 mass_center[0],
@@ -154,6 +157,18 @@ class LogDumper(Dumper):
             )
         )
     
+    def _getForceTime(self):
+        # Cumulative time of each force ordered by force_id, recorded by the profile of Ensemble
+        profile = self._simulation._ensemble._profile['forces']
+        return(
+            '{:<%d}' %self.flag_dict["Force Time (s)"][1]
+        ).format(
+            ' '.join([
+                '%.3f' %(profile[force.force_id]['time'] if force.force_id in profile else 0)
+                for force in self._simulation._ensemble.forces
+            ])
+        )
+    
     def _setTitle(self):
         if self._is_bound:
             self.title = '# Log file created by OpenPD at %s\n' %self._simulation._start_time
@@ -166,20 +181,19 @@ class LogDumper(Dumper):
     
     def bindSimulation(self, simulation):
         super().bindSimulation(simulation)
+        if self.flag_dict["Force Time (s)"][0]:
+            self._simulation._ensemble.enableProfiling()
         self._setTitle()
-        io = open(self._output_file, 'a')
-        print(self.title, file=io)
-        io.close()
-            
-    def dump(self):
-        self._test_bound()
+        self._write(self.title + '\n')
+
+    def _takeSnapshot(self):
+        # Energies depend on the current state, so the line is assembled on the simulation thread
         self.info = ''
         for _, value in list(self.flag_dict.items()):
             if value[0]:
                 # Call the third element which is a _getXxx methods to get the information
                 self.info += value[2]() 
-    
-        io = open(self._output_file, 'a')
-        print(self.info, file=io)
-        io.close()
-            
\ No newline at end of file
+        return self.info
+
+    def _formatSnapshot(self, snapshot):
+        return snapshot + '\n'
@@ -1,11 +1,21 @@
+import numpy as np
 from . import Dumper
 from ..unit import *
 
+PDS_ATOM_FORMAT = 'ATOM {:<6}{:<5}{:<6}{:<6}{:<6}{:<13}{:<13}{:<13}'
+PDS_BOND_FORMAT = 'BOND {:<6}{:<13}{:<13}{:<13}{:<13}{:<13}{:<13}'
+
 class SnapshotDumper(Dumper):
-    def __init__(self, output_file, dump_interval:int, is_overwrite=True) -> None:
+    def __init__(
+        self, output_file, dump_interval:int, is_overwrite=True,
+        buffer_size=65536, is_background=False, max_queue_size=64
+    ) -> None:
         if not output_file.endswith('.pds'):
             raise ValueError('The snapshot file should endwith .pds!')
-        super().__init__(output_file, dump_interval, is_overwrite)
+        super().__init__(
+            output_file, dump_interval, is_overwrite,
+            buffer_size=buffer_size, is_background=is_background, max_queue_size=max_queue_size
+        )
         self.cur_frame = 0
         
     def __repr__(self):
@@ -30,58 +40,39 @@ class SnapshotDumper(Dumper):
     def bindSimulation(self, simulation):
         super().bindSimulation(simulation)
         self._setTitle()
-        io = open(self._output_file, 'a')
-        print(self.title, file=io)
-        io.close()
-        
-    def dump(self):
-        io = open(self._output_file, 'a')
-        self._test_bound()
-        self._dumpFrame(io)
-        self._dumpSimulationTime(io)
-        self._dumpAtom(io)
-        self._dumpBond(io)
-        self._dumpEndFrame(io)
-        self.cur_frame += 1
-        io.close()
-    
-    def _dumpFrame(self, io):
-        info = 'FRAME %d' %self.cur_frame
-        print(info, file=io)
-        
-    def _dumpSimulationTime(self, io):
-        info = 'SIMTIME %.6f NS' %(
-            self._simulation._cur_step * self._simulation._integrator.sim_interval / nanosecond
-        )
-        print(info, file=io)
-        
-    def _dumpAtom(self, io):
-        info = ''
-        for chain in self._simulation._ensemble._system.chains:
-            for peptide in chain.peptides:
+        self._write(self.title + '\n')
+        # Topology is fixed during simulation, only coordinates are copied at each dump
+        system = self._simulation._ensemble._system
+        self._atoms = []
+        for chain in system.chains:
+            for peptide in chain.molecules:
                 for atom in peptide.atoms:
-                    coord = atom.coordinate / angstrom
-                    info += (
-                        'ATOM {:<6}{:<5}{:<6}{:<6}{:<6}{:<13}{:<13}{:<13}\n'
-                    ).format(
-                        atom.atom_id, atom.atom_type, peptide.peptide_id, atom.peptide_type, chain.chain_id,
-                        '%.6f' %coord[0], '%.6f' %coord[1], '%.6f' %coord[2]
-                    )
-        print(info[:-1], file=io) # Get rid of the final \n
-        
-    def _dumpBond(self, io):
-        info = ''
-        for i, bond in enumerate(self._simulation._ensemble._system.topology.bonds):
-            coord0 = bond[0].coordinate / angstrom
-            coord1 = bond[1].coordinate / angstrom
-            info += (
-                'BOND {:<6}{:<13}{:<13}{:<13}{:<13}{:<13}{:<13}\n'
-            ).format(
-                i, '%.6f' %coord0[0], '%.6f' %coord0[1], '%.6f' %coord0[2],
-                '%.6f' %coord1[0], '%.6f' %coord1[1], '%.6f' %coord1[2]
-            )
-        print(info[:-1], file=io) # Get rid of the final \n
-        
-    def _dumpEndFrame(self, io):
-        info = 'ENDFRAME'
-        print(info, file=io)
\ No newline at end of file
+                    self._atoms.append([
+                        atom.atom_id, atom.atom_type, peptide.peptide_id, atom.peptide_type, chain.chain_id
+                    ])
+        self._bond_index = np.array(
+            [[bond[0].atom_id, bond[1].atom_id] for bond in system.topology.bonds], dtype=np.int64
+        ).reshape(-1, 2)
+
+    def _takeSnapshot(self):
+        snapshot = (
+            self.cur_frame,
+            self._simulation._cur_step * self._simulation._integrator.sim_interval / nanosecond,
+            self._simulation._ensemble._system.coordinate_array.copy()
+        )
+        self.cur_frame += 1
+        return snapshot
+
+    def _formatSnapshot(self, snapshot):
+        cur_frame, sim_time, coord = snapshot
+        lines = ['FRAME %d' %cur_frame, 'SIMTIME %.6f NS' %sim_time]
+        for atom in self._atoms:
+            lines.append(PDS_ATOM_FORMAT.format(
+                *atom, *['%.6f' %value for value in coord[atom[0], :]]
+            ))
+        for bond_id, bond in enumerate(self._bond_index):
+            lines.append(PDS_BOND_FORMAT.format(
+                bond_id, *['%.6f' %value for value in coord[bond, :].flatten()]
+            ))
+        lines.append('ENDFRAME\n')
+        return '\n'.join(lines)
@@ -0,0 +1,132 @@
+import os
+import numpy as np
+from . import Dumper
+from .trajectoryFile import getFrameDtype, createPDTHeader, readPDTHeader, PDT_PRECISIONS
+from ..unit import *
+
+class TrajectoryDumper(Dumper):
+    def __init__(
+        self, output_file, dump_interval:int, is_overwrite=True, precision='float32',
+        buffer_size=65536, is_background=False, max_queue_size=64
+    ) -> None:
+        """
+        Parameters
+        ----------
+        output_file : str
+            the path of ``.pdt`` file
+        dump_interval : int
+            the number of steps between two frames
+        is_overwrite : bool, optional
+            overwrite the existing file, by default True.
+            Otherwise frames are appended to the file, which should contain the same number of atoms
+        precision : str, optional
+            the precision of coordinate, ``'float32'`` or ``'float64'``, by default 'float32'
+        buffer_size : int, optional
+            the size in bytes of the in-memory buffer of the file handle, by default 65536
+        is_background : bool, optional
+            write frames in a background thread, by default False
+        max_queue_size : int, optional
+            the maximum number of frames waiting in the queue, by default 64
+
+        Raises
+        ------
+        ValueError
+            When ``output_file`` does not end with ``.pdt`` or ``precision`` is not in ``PDT_PRECISIONS``
+        """
+        if not output_file.endswith('.pdt'):
+            raise ValueError('The trajectory file should endwith .pdt!')
+        if not precision in PDT_PRECISIONS:
+            raise ValueError(
+                'Precision %s is not supported. Choose from \n %s'
+                %(precision, PDT_PRECISIONS)
+            )
+        super().__init__(
+            output_file, dump_interval, is_overwrite,
+            buffer_size=buffer_size, is_background=is_background, max_queue_size=max_queue_size
+        )
+        self._precision = precision
+        self.cur_frame = 0
+
+    def __repr__(self):
+        if self._is_bound:
+            return (
+                '<TrajectoryDumper object: dump every %d step(s), binding with simulation at 0x%x>'
+                %(self._dump_interval, id(self._simulation))
+            )
+        else:
+            return (
+                '<TrajectoryDumper object: unbounded!>'
+            )
+
+    __str__ = __repr__
+
+    def _createTopology(self):
+        system = self._simulation._ensemble._system
+        atoms = []
+        for chain in system.chains:
+            for peptide in chain.molecules:
+                for atom in peptide.atoms:
+                    atoms.append([
+                        atom.atom_id, atom.atom_type, peptide.peptide_id, atom.peptide_type, chain.chain_id
+                    ])
+        return {
+            'num_atoms': system.num_atoms,
+            'precision': self._precision,
+            'created_time': str(self._simulation._start_time),
+            'atoms': atoms,
+            'bonds': [[bond[0].atom_id, bond[1].atom_id] for bond in system.topology.bonds]
+        }
+
+    def bindSimulation(self, simulation):
+        """
+        bindSimulation binds ``self`` to a ``Simulation`` and writes the header with topology once
+
+        When appending to an existing file, the header is kept and ``cur_frame`` continues from the last complete frame
+
+        Raises
+        ------
+        ValueError
+            When appending to a file with different number of atoms or precision
+        """
+        super().bindSimulation(simulation)
+        num_atoms = self._simulation._ensemble._system.num_atoms
+        self._frame_dtype = getFrameDtype(num_atoms, self._precision)
+        if os.path.getsize(self._output_file) == 0:
+            with open(self._output_file, 'wb') as io:
+                io.write(createPDTHeader(self._createTopology()))
+        else:
+            topology, offset = readPDTHeader(self._output_file)
+            if topology['num_atoms'] != num_atoms or topology['precision'] != self._precision:
+                raise ValueError(
+                    '%s contains %d atoms in %s, can not append %d atoms in %s'
+                    %(self._output_file, topology['num_atoms'], topology['precision'], num_atoms, self._precision)
+                )
+            self.cur_frame = (os.path.getsize(self._output_file) - offset) // self._frame_dtype.itemsize
+            # Drop the incomplete frame of a crashed run
+            with open(self._output_file, 'r+b') as io:
+                io.truncate(offset + self.cur_frame * self._frame_dtype.itemsize)
+        self._frame = np.zeros(1, dtype=self._frame_dtype)
+
+    def _takeSnapshot(self):
+        # The frame is converted to bytes here, so the snapshot is a copy and formatting is free
+        self._frame['sim_time'] = (
+            self._simulation._cur_step * self._simulation._integrator.sim_interval / nanosecond
+        )
+        self._frame['coordinate'][0] = self._simulation._ensemble._system.coordinate_array
+        self.cur_frame += 1
+        return self._frame.tobytes()
+
+    def _formatSnapshot(self, snapshot):
+        return snapshot
+
+    @property
+    def precision(self):
+        """
+        precision gets the precision of coordinate
+
+        Returns
+        -------
+        str
+            ``'float32'`` or ``'float64'``
+        """
+        return self._precision
@@ -0,0 +1,351 @@
+import os, json, struct
+import numpy as np
+from .snapshotDumper import PDS_ATOM_FORMAT, PDS_BOND_FORMAT
+
+# Layout of .pdt file:
+# - 16 bytes head: magic, format version, length of the topology json
+# - topology json padded by space to 8 bytes
+# - fixed-size frames of float64 sim time in nanosecond followed by (num_atoms, 3) coordinate in angstrom
+PDT_MAGIC = b'OPENPDTR'
+PDT_VERSION = 1
+PDT_HEAD_FORMAT = '<8sII'
+PDT_PRECISIONS = ['float32', 'float64']
+PDS_BOND_MATCH_TOLERANCE = 1e-6 # Coordinates in .pds are written with 6 decimals
+
+def getFrameDtype(num_atoms, precision='float32'):
+    """
+    getFrameDtype gets the numpy dtype of a single frame in ``.pdt`` file
+
+    Parameters
+    ----------
+    num_atoms : int
+        the number of atoms
+    precision : str, optional
+        the precision of coordinate, ``'float32'`` or ``'float64'``, by default 'float32'
+
+    Returns
+    -------
+    np.dtype
+        structured dtype with field ``sim_time`` and ``coordinate``
+    """
+    return np.dtype([
+        ('sim_time', '<f8'), ('coordinate', np.dtype(precision).newbyteorder('<'), (num_atoms, 3))
+    ])
+
+def createPDTHeader(topology:dict):
+    """
+    createPDTHeader creates the header bytes of ``.pdt`` file
+
+    Parameters
+    ----------
+    topology : dict
+        topology information, containing ``num_atoms``, ``precision``, ``atoms`` and ``bonds``
+
+    Returns
+    -------
+    bytes
+        the header, its length is a multiple of 8
+    """
+    info = json.dumps(topology).encode()
+    info += b' ' * (-len(info) % 8)
+    return struct.pack(PDT_HEAD_FORMAT, PDT_MAGIC, PDT_VERSION, len(info)) + info
+
+def readPDTHeader(pdt_file):
+    """
+    readPDTHeader reads the topology and the frame offset of ``.pdt`` file
+
+    Parameters
+    ----------
+    pdt_file : str
+        the path of ``.pdt`` file
+
+    Returns
+    -------
+    tuple(dict, int)
+        - topology information
+        - the offset of the first frame in bytes
+
+    Raises
+    ------
+    ValueError
+        When the file is not a ``.pdt`` file or the version is not supported
+    """
+    with open(pdt_file, 'rb') as io:
+        head = io.read(struct.calcsize(PDT_HEAD_FORMAT))
+        if len(head) != struct.calcsize(PDT_HEAD_FORMAT) or head[:8] != PDT_MAGIC:
+            raise ValueError('%s is not an OpenPD trajectory file' %(pdt_file))
+        _, version, info_length = struct.unpack(PDT_HEAD_FORMAT, head)
+        if version != PDT_VERSION:
+            raise ValueError('Version %d of .pdt file is not supported' %(version))
+        topology = json.loads(io.read(info_length).decode())
+    return topology, struct.calcsize(PDT_HEAD_FORMAT) + info_length
+
+class TrajectoryFile:
+    def __init__(self, pdt_file) -> None:
+        """
+        Parameters
+        ----------
+        pdt_file : str
+            the path of ``.pdt`` file
+
+        Raises
+        ------
+        ValueError
+            When ``pdt_file`` does not end with ``.pdt``
+        """
+        if not pdt_file.endswith('.pdt'):
+            raise ValueError('The trajectory file should endwith .pdt!')
+        self._pdt_file = pdt_file
+        self._topology, self._offset = readPDTHeader(pdt_file)
+        self._num_atoms = self._topology['num_atoms']
+        self._frame_dtype = getFrameDtype(self._num_atoms, self._topology['precision'])
+        self._frames = None
+        self._num_frames = 0
+        self.reload()
+
+    def __repr__(self) -> str:
+        return (
+            '<TrajectoryFile object: %d frames, %d atoms of %s at 0x%x>'
+            %(self._num_frames, self._num_atoms, self._pdt_file, id(self))
+        )
+
+    __str__ = __repr__
+
+    def reload(self):
+        """
+        reload maps the frames of file again, frames appended after the last mapping become visible
+
+        An incomplete frame at the end of file, like the tail of a crashed run, is ignored
+        """
+        self._num_frames = (os.path.getsize(self._pdt_file) - self._offset) // self._frame_dtype.itemsize
+        if self._num_frames == 0:
+            self._frames = np.zeros(0, dtype=self._frame_dtype)
+        else:
+            self._frames = np.memmap(
+                self._pdt_file, dtype=self._frame_dtype, mode='r',
+                offset=self._offset, shape=(self._num_frames, )
+            )
+
+    def getFrame(self, frame):
+        """
+        getFrame gets the coordinate of a single frame without reading other frames
+
+        Parameters
+        ----------
+        frame : int
+            the index of frame, negative index is supported
+
+        Returns
+        -------
+        np.ndarray
+            (num_atoms, 3) coordinate, in unit of angstrom
+        """
+        return np.array(self._frames[frame]['coordinate'])
+
+    @property
+    def pdt_file(self):
+        """
+        pdt_file gets the path of ``.pdt`` file
+
+        Returns
+        -------
+        str
+            the path of ``.pdt`` file
+        """
+        return self._pdt_file
+
+    @property
+    def num_frames(self):
+        """
+        num_frames gets the number of complete frames
+
+        Returns
+        -------
+        int
+            the number of frames
+        """
+        return self._num_frames
+
+    @property
+    def num_atoms(self):
+        """
+        num_atoms gets the number of atoms
+
+        Returns
+        -------
+        int
+            the number of atoms
+        """
+        return self._num_atoms
+
+    @property
+    def num_bonds(self):
+        """
+        num_bonds gets the number of bonds
+
+        Returns
+        -------
+        int
+            the number of bonds
+        """
+        return len(self._topology['bonds'])
+
+    @property
+    def precision(self):
+        """
+        precision gets the precision of coordinate
+
+        Returns
+        -------
+        str
+            ``'float32'`` or ``'float64'``
+        """
+        return self._topology['precision']
+
+    @property
+    def atoms(self):
+        """
+        atoms gets the information of atoms
+
+        Returns
+        -------
+        list
+            ``[atom_id, atom_type, peptide_id, peptide_type, chain_id]`` of each atom
+        """
+        return self._topology['atoms']
+
+    @property
+    def bond_index(self):
+        """
+        bond_index gets the atom ids of bonds
+
+        Returns
+        -------
+        np.ndarray
+            (num_bonds, 2) atom ids of each bond
+        """
+        return np.array(self._topology['bonds'], dtype=np.int64).reshape(-1, 2)
+
+    @property
+    def sim_time(self):
+        """
+        sim_time gets the simulation time of all frames
+
+        Returns
+        -------
+        np.ndarray
+            (num_frames, ) simulation time, in unit of nanosecond
+        """
+        return np.array(self._frames['sim_time'])
+
+    @property
+    def coordinate(self):
+        """
+        coordinate gets the memory-mapped coordinate of all frames
+
+        Returns
+        -------
+        np.ndarray
+            read-only (num_frames, num_atoms, 3) coordinate, in unit of angstrom
+        """
+        return self._frames['coordinate']
+
+def convertPDSToPDT(pds_file, pdt_file, precision='float32'):
+    """
+    convertPDSToPDT converts a ``.pds`` snapshot file to a ``.pdt`` trajectory file
+
+    Parameters
+    ----------
+    pds_file : str
+        the path of ``.pds`` file
+    pdt_file : str
+        the path of ``.pdt`` file
+    precision : str, optional
+        the precision of coordinate, by default 'float32'
+
+    Returns
+    -------
+    int
+        the number of converted frames
+
+    Raises
+    ------
+    ValueError
+        When the precision is not supported
+
+    ValueError
+        When the coordinate of a bond atom does not match exactly one atom in the first frame
+    """
+    if not precision in PDT_PRECISIONS:
+        raise ValueError('Precision %s is not supported. Choose from \n %s' %(precision, PDT_PRECISIONS))
+    atoms, bond_coord, sim_time, coordinate = [], [], [], []
+    with open(pds_file, 'r') as io:
+        for line in io:
+            if line.startswith('SIMTIME'):
+                sim_time.append(float(line.split()[1]))
+                coordinate.append([])
+            elif line.startswith('ATOM'):
+                data = line.split()
+                if len(sim_time) == 1:
+                    atoms.append([int(data[1]), data[2], int(data[3]), data[4], int(data[5])])
+                coordinate[-1].append([float(i) for i in data[6:9]])
+            elif line.startswith('BOND') and len(sim_time) == 1:
+                bond_coord.append([float(i) for i in line.split()[2:8]])
+    coordinate = np.array(coordinate, dtype=np.float64).reshape(len(sim_time), len(atoms), 3)
+    # .pds stores bonds by coordinate, atom ids are recovered from the first frame.
+    # Bond and atom coordinates are written with the same format, so the match should be exact
+    bonds = []
+    for bond_id, bond in enumerate(np.array(bond_coord).reshape(-1, 2, 3)):
+        bonds.append([])
+        for atom_coord in bond:
+            atom_id = np.nonzero(np.abs(coordinate[0] - atom_coord).max(1) <= PDS_BOND_MATCH_TOLERANCE)[0]
+            if atom_id.shape[0] != 1:
+                raise ValueError(
+                    'Bond %d of %s matches %d atoms at %s, atom ids of bond can not be recovered'
+                    %(bond_id, pds_file, atom_id.shape[0], atom_coord)
+                )
+            bonds[-1].append(int(atom_id[0]))
+    topology = {'num_atoms': len(atoms), 'precision': precision, 'atoms': atoms, 'bonds': bonds}
+    frames = np.zeros(len(sim_time), dtype=getFrameDtype(len(atoms), precision))
+    frames['sim_time'] = sim_time
+    frames['coordinate'] = coordinate
+    with open(pdt_file, 'wb') as io:
+        io.write(createPDTHeader(topology))
+        io.write(frames.tobytes())
+    return len(sim_time)
+
+def convertPDTToPDS(pdt_file, pds_file):
+    """
+    convertPDTToPDS converts a ``.pdt`` trajectory file to a ``.pds`` snapshot file
+
+    Parameters
+    ----------
+    pdt_file : str
+        the path of ``.pdt`` file
+    pds_file : str
+        the path of ``.pds`` file
+
+    Returns
+    -------
+    int
+        the number of converted frames
+    """
+    trajectory = TrajectoryFile(pdt_file)
+    bond_index = trajectory.bond_index
+    sim_time = trajectory.sim_time
+    with open(pds_file, 'w') as io:
+        print('# OpenPD snapshot file converted from %s' %(os.path.basename(pdt_file)), file=io)
+        for frame in range(trajectory.num_frames):
+            coord = trajectory.getFrame(frame).astype(np.float64)
+            lines = ['FRAME %d' %frame, 'SIMTIME %.6f NS' %sim_time[frame]]
+            for atom in trajectory.atoms:
+                lines.append(PDS_ATOM_FORMAT.format(
+                    *atom, *['%.6f' %value for value in coord[atom[0], :]]
+                ))
+            for bond_id, bond in enumerate(bond_index):
+                lines.append(PDS_BOND_FORMAT.format(
+                    bond_id, *['%.6f' %value for value in coord[bond, :].flatten()]
+                ))
+            lines.append('ENDFRAME')
+            print('\n'.join(lines), file=io)
+    return trajectory.num_frames
@@ -10,14 +10,21 @@ contact : zhenyuwei99@gmail.com
 copyright : (C)Copyright 2021-2021, Zhenyu Wei and Southeast University
 '''
 
+import numpy as np
 from . import Dumper
 from ..unit import *
 
 class XYZDumper(Dumper):
-    def __init__(self, output_file, dump_interval: int, is_overwrite=True) -> None:
+    def __init__(
+        self, output_file, dump_interval: int, is_overwrite=True,
+        buffer_size=65536, is_background=False, max_queue_size=64
+    ) -> None:
         if not output_file.endswith('.xyz'):
             raise ValueError('The XYZ file should endwith .xyz!')
-        super().__init__(output_file, dump_interval, is_overwrite=is_overwrite)
+        super().__init__(
+            output_file, dump_interval, is_overwrite=is_overwrite,
+            buffer_size=buffer_size, is_background=is_background, max_queue_size=max_queue_size
+        )
         self.cur_frame = 0
     
     def __repr__(self):
@@ -49,31 +56,22 @@ class XYZDumper(Dumper):
         # io = open(self._output_file, 'a')
         # print(self.title, file=io)
         # io.close()
+        atoms = self._simulation._ensemble._system.atoms
+        self._atom_types = [atom.atom_type for atom in atoms]
+        self._atom_ids = np.array([atom.atom_id for atom in atoms], dtype=np.int64)
 
-    def dump(self):
-        io = open(self._output_file, 'a')
-        self._test_bound()
-        self._dumpNumAtom(io)
-        self._dumpFrame(io)
-        self._dumpXYZ(io)
+    def _takeSnapshot(self):
+        snapshot = (self.cur_frame, self._simulation._ensemble._system.coordinate_array[self._atom_ids, :])
         self.cur_frame += 1
-        io.close()
+        return snapshot
 
-    def _dumpNumAtom(self, io):
-        info = '%d' %self._simulation._ensemble._system.num_atoms
-        print(info, file=io)
-
-    def _dumpFrame(self, io):
-        info = 'Frame %d' %self.cur_frame
-        print(info, file=io)
-
-    def _dumpXYZ(self, io):
-        info = ''
-        for atom in self._simulation._ensemble._system.atoms:
-            coord = atom.coordinate / angstrom
-            info += (
-                '{:<5}{:<13}{:<13}{:<13}\n'
+    def _formatSnapshot(self, snapshot):
+        cur_frame, coord = snapshot
+        lines = ['%d' %len(self._atom_types), 'Frame %d' %cur_frame]
+        for atom_type, atom_coord in zip(self._atom_types, coord):
+            lines.append((
+                '{:<5}{:<13}{:<13}{:<13}'
             ).format(
-                atom.atom_type, '%.6f' %coord[0], '%.6f' %coord[1], '%.6f' %coord[2]
-            )
-        print(info[:-1], file=io) # Get rid of the final \n
\ No newline at end of file
+                atom_type, '%.6f' %atom_coord[0], '%.6f' %atom_coord[1], '%.6f' %atom_coord[2]
+            ))
+        return '\n'.join(lines) + '\n'
@@ -3,7 +3,7 @@
 '''
 file: atom.py
 created time : 2021/02/03
-last edit time : 2021/04/13
+last edit time : 2021/04/20
 author : Zhenyu Wei 
 version : 1.0
 contact : zhenyuwei99@gmail.com
@@ -14,7 +14,7 @@ import numpy as np
 
 import openpd.unit as unit
 from ..unit import *
-from ..unit import Quantity
+from ..unit import Quantity, QuantityArray
 from ..exceptions import *
 
 
@@ -41,15 +41,19 @@ class Atom:
             mass = mass * amu
         self._mass = mass
         self._parent_molecule = None
-        self._coordinate = np.zeros([3]) * angstrom
-        self._velocity = np.zeros([3]) * angstrom / femtosecond
+        # note: coordinate, velocity and force are stored as raw float arrays in the internal units 
+        # (angstrom, angstrom/femtosecond and kilojoule_permol_over_angstrom). 
+        # After the atom is added to a System, they become views of the System's state buffers
+        self._coordinate = np.zeros([3])
+        self._velocity = np.zeros([3])
+        self._force = np.zeros([3])
+        self._coordinate_version = np.zeros([1], dtype=np.int64)
         self._kinetic_energy = 0 * kilojoule_permol
         self._potential_energy = 0 * kilojoule_permol
-        self._force = np.zeros([3]) * kilojoule_permol / angstrom
 
     def __repr__(self) -> str:
-        return ('<Atom object: id %d, type %s, of peptide %s at 0x%x>'
-            %(self._atom_id, self._atom_type, self._peptide_type, id(self)))
+        return ('<Atom object: id %d, type %s, at 0x%x>'
+            %(self._atom_id, self._atom_type, id(self)))
 
     __str__ = __repr__ 
     
@@ -145,6 +149,55 @@ class Atom:
             )     
         return self._parent_molecule.molecule_id
 
+    @property
+    def peptide_type(self):
+        """
+        peptide_type gets the type of parent peptide, an alias of ``molecule_name``
+
+        Returns
+        -------
+        str
+            type of the parent peptide
+        """        
+        return self.molecule_name
+
+    @property
+    def peptide_id(self):
+        """
+        peptide_id gets the id of parent peptide, an alias of ``molecule_id``
+
+        Returns
+        -------
+        int
+            id of the parent peptide
+        """        
+        return self.molecule_id
+
+    def _bindState(self, coordinate, velocity, force, coordinate_version):
+        """
+        _bindState replaces the state arrays of ``self`` with views of ``System`` state buffers
+
+        This will only called by ``System`` instance
+
+        Parameters
+        ----------
+        coordinate : np.ndarray
+            a (3, ) view of the coordinate buffer
+        velocity : np.ndarray
+            a (3, ) view of the velocity buffer
+        force : np.ndarray
+            a (3, ) view of the force buffer
+        coordinate_version : np.ndarray
+            the (1, ) coordinate version counter of ``System``, increased when coordinate of ``self`` is set
+        """        
+        coordinate[:] = self._coordinate
+        velocity[:] = self._velocity
+        force[:] = self._force
+        self._coordinate = coordinate
+        self._velocity = velocity
+        self._force = force
+        self._coordinate_version = coordinate_version
+
     @property
     def coordinate(self):
         """
@@ -154,10 +207,10 @@ class Atom:
 
         Returns
         -------
-        np.ndarray(dtype=Quantity)
+        QuantityArray
             coordinate
         """        
-        return np.copy(self._coordinate)
+        return QuantityArray(self._coordinate, angstrom)
 
     @coordinate.setter
     def coordinate(self, coordinate):
@@ -166,7 +219,7 @@ class Atom:
 
         Parameters
         ----------
-        coordinate : np.ndarry or list
+        coordinate : np.ndarry or list or QuantityArray
             atom's coordinate, Unit default to be ``angstrom`` if float list or array is provided
 
         Raises
@@ -179,6 +232,8 @@ class Atom:
         """           
         if len(coordinate) != 3:
             raise ValueError('Length of coordinate vector should be 3')
+        elif isinstance(coordinate, QuantityArray) and coordinate.unit.base_dimension == unit.length:
+            coordinate = coordinate.convertTo(angstrom).value
         elif isinstance(coordinate[0], Quantity):
             if coordinate[0].unit.base_dimension != unit.length:
                 raise ValueError(
@@ -186,12 +241,9 @@ class Atom:
                     %(coordinate[0].unit.base_dimension)
                 )
             else:
-                coordinate = coordinate / angstrom * angstrom
-        else:
-            coordinate = coordinate * angstrom
-
-        for (i, j) in enumerate(coordinate):
-            self._coordinate[i] = j
+                coordinate = [i / angstrom for i in coordinate]
+        self._coordinate[:] = coordinate
+        self._coordinate_version[0] += 1
         
     @property
     def velocity(self):
@@ -202,10 +254,10 @@ class Atom:
 
         Returns
         -------
-        np.ndarray(dtype=Quantity)
+        QuantityArray
             velocity
         """    
-        return np.copy(self._velocity)
+        return QuantityArray(self._velocity, angstrom / femtosecond)
 
     @velocity.setter
     def velocity(self, velocity):
@@ -214,7 +266,7 @@ class Atom:
 
         Parameters
         ----------
-        velocity : np.ndarry or list
+        velocity : np.ndarry or list or QuantityArray
             atom's velocity, Unit default to be ``angstrom/femtosecond`` if float list or array is provided
 
         Raises
@@ -227,6 +279,8 @@ class Atom:
         """           
         if len(velocity) != 3:
             raise ValueError('Length of velocity vector should be 3')
+        elif isinstance(velocity, QuantityArray) and velocity.unit.base_dimension == unit.velocity:
+            velocity = velocity.convertTo((angstrom/femtosecond)).value
         elif isinstance(velocity[0], Quantity):
             if velocity[0].unit.base_dimension != unit.velocity:
                 raise ValueError(
@@ -234,12 +288,8 @@ class Atom:
                     %(velocity[0].unit.base_dimension)
                 )
             else:
-                velocity = velocity / (angstrom/femtosecond) * (angstrom/femtosecond)
-        else:
-            velocity = velocity * angstrom / femtosecond
-
-        for (i, j) in enumerate(velocity):
-            self._velocity[i] = j
+                velocity = [i / (angstrom/femtosecond) for i in velocity]
+        self._velocity[:] = velocity
 
     @property
     def force(self):
@@ -250,10 +300,10 @@ class Atom:
 
         Returns
         -------
-        np.ndarray(dtype=Quantity)
+        QuantityArray
             force
         """    
-        return np.copy(self._force)
+        return QuantityArray(self._force, kilojoule_permol_over_angstrom)
 
     @force.setter
     def force(self, force):
@@ -262,7 +312,7 @@ class Atom:
 
         Parameters
         ----------
-        force : np.ndarry or list
+        force : np.ndarry or list or QuantityArray
             atom's force, Unit default to be ``kilojoule_permol_over_angstrom`` if float list or array is provided
 
         Raises
@@ -275,6 +325,8 @@ class Atom:
         """           
         if len(force) != 3:
             raise ValueError('Length of velocity vector should be 3')
+        elif isinstance(force, QuantityArray) and force.unit.base_dimension == unit.force:
+            force = force.convertTo(kilojoule_permol_over_angstrom).value
         elif isinstance(force[0], Quantity):
             if force[0].unit.base_dimension != unit.force:
                 raise ValueError(
@@ -282,12 +334,8 @@ class Atom:
                     %(unit.force, force[0].unit.base_dimension)
                 )
             else:
-                force = force / (kilojoule_permol_over_angstrom) * (kilojoule_permol_over_angstrom)
-        else:
-            force = force * kilojoule_permol_over_angstrom
-
-        for (i, j) in enumerate(force):
-            self._force[i] = j
+                force = [i / kilojoule_permol_over_angstrom for i in force]
+        self._force[:] = force
 
     @property
     def potential_energy(self):
@@ -3,7 +3,7 @@
 '''
 file: system.py
 created time : 2021/02/03
-last edit time : 2021/04/14
+last edit time : 2021/04/20
 author : Zhenyu Wei 
 version : 1.0
 contact : zhenyuwei99@gmail.com
@@ -13,19 +13,34 @@ copyright : (C)Copyright 2021-2021, Zhenyu Wei and Southeast University
 import numpy as np
 from copy import deepcopy
 
+import openpd.unit as unit
 from . import Chain, Topology
 from .. import isArrayEqual
-from ..unit import Quantity
+from ..unit import *
+from ..unit import Quantity, QuantityArray
+from ..exceptions import DismatchedDimensionError
 
 class System:
     def __init__(self) -> None:
         self._chains = []
+        self._atoms = []
         self._topology = Topology()
     
         self._num_atoms = 0
         self._num_molecules = 0
         self._num_chains = 0
 
+        # note: State buffers of all atoms, in unit of angstrom, angstrom/femtosecond, 
+        # kilojoule_permol_over_angstrom and amu respectively. Atom.coordinate, Atom.velocity 
+        # and Atom.force are views of the corresponding row in these buffers
+        self._coordinate = np.zeros([0, 3])
+        self._velocity = np.zeros([0, 3])
+        self._force = np.zeros([0, 3])
+        self._mass = np.zeros([0, 1])
+        # note: Increased whenever the coordinate buffer is modified, used by forces to cache
+        # quantities depending only on coordinate. Shared with all atoms as a (1, ) array
+        self._coordinate_version = np.zeros([1], dtype=np.int64)
+
     def __repr__(self) -> str:
         return ('<System object: %d chains, %d molecules, %d atoms at 0x0x%x>' 
             %(self._num_chains, self._num_molecules, self._num_atoms, id(self)))
@@ -40,8 +55,10 @@ class System:
             self._num_molecules += 1
         for atom in self._chains[-1].atoms:
             atom.atom_id = self._num_atoms
+            self._atoms.append(atom)
             self._num_atoms += 1
         self._num_chains += 1
+        self._topology._addChain(self._chains[-1])
 
     def addChains(self, *chains):
         """
@@ -54,6 +71,77 @@ class System:
         """  
         for chain in chains:
             self._addChain(chain)
+        self._allocateStateBuffer()
+
+    def _allocateStateBuffer(self):
+        """
+        _allocateStateBuffer allocates state buffers for all atoms and binds atoms to them
+        """        
+        self._coordinate = np.zeros([self._num_atoms, 3])
+        self._velocity = np.zeros([self._num_atoms, 3])
+        self._force = np.zeros([self._num_atoms, 3])
+        self._mass = np.zeros([self._num_atoms, 1])
+        for i, atom in enumerate(self._atoms):
+            atom._bindState(
+                self._coordinate[i, :], self._velocity[i, :], self._force[i, :], self._coordinate_version
+            )
+            self._mass[i, 0] = atom.mass / amu
+        self.updateCoordinateVersion()
+
+    def updateCoordinateVersion(self):
+        """
+        updateCoordinateVersion increases the coordinate version of ``self``
+
+        This should be called after modifying ``self.coordinate_array`` in place,
+        setting ``System.coordinate`` or ``Atom.coordinate`` calls it automatically
+        """
+        self._coordinate_version[0] += 1
+
+    def _parseStateArray(self, value, target_unit, target_dimension):
+        """
+        _parseStateArray converts input array to a float array with the shape of state buffers
+
+        Parameters
+        ----------
+        value : np.ndarray or list or QuantityArray
+            input array, Unit default to be ``target_unit`` if float array or list is provided
+        target_unit : Quantity
+            the internal unit of corresponding state buffer
+        target_dimension : BaseDimension
+            the dimension of corresponding state buffer
+
+        Returns
+        -------
+        np.ndarray
+            float array in unit of ``target_unit``
+
+        Raises
+        ------
+        ValueError
+            When the shape of ``value`` is different from shape of state buffer
+
+        DismatchedDimensionError
+            When the dimension of input ``value`` is Quantity and != ``target_dimension``
+        """        
+        if isinstance(value, QuantityArray):
+            if value.unit.base_dimension != target_dimension:
+                raise DismatchedDimensionError(
+                    'Dimension of input should be %s instead of %s' 
+                    %(target_dimension, value.unit.base_dimension)
+                )
+            value = value.convertTo(target_unit).value
+        value = np.array(value)
+        if not isArrayEqual(list(value.shape), [self._num_atoms, 3]):
+            raise ValueError('Dimension of input %s is different from dimension of coordinate matrix %s' 
+                %(value.shape, [self._num_atoms, 3]))
+        if value.size != 0 and isinstance(value[0, 0], Quantity):
+            if value[0, 0].unit.base_dimension != target_dimension:
+                raise DismatchedDimensionError(
+                    'Dimension of input should be %s instead of %s' 
+                    %(target_dimension, value[0, 0].unit.base_dimension)
+                )
+            value = value / target_unit
+        return np.array(value, dtype=np.float64)
 
     @property
     def num_atoms(self):
@@ -77,10 +165,7 @@ class System:
         list(Atom)
             list contain all atoms in the system
         """    
-        atoms = []
-        for chain in self._chains:
-            atoms.extend(chain.atoms)
-        return atoms
+        return self._atoms
         
     @property
     def num_molecules(self):
@@ -148,17 +233,14 @@ class System:
     @property
     def mass(self):
         """
-        mass gets the velocity of all atoms in the system
+        mass gets the mass of all atoms in the system
 
         Returns
         -------
-        np.ndarray
+        QuantityArray
             the mass of all atoms in the system
         """        
-        mass = np.zeros([self.num_atoms, 1], dtype=Quantity)
-        for i, atom in enumerate(self.atoms):
-            mass[i] = atom.mass
-        return mass
+        return QuantityArray(self._mass, amu)
 
     @property
     def coordinate(self):
@@ -167,23 +249,15 @@ class System:
 
         Returns
         -------
-        np.ndarray
+        QuantityArray
             the coordinate of all atoms in the system
         """        
-        coord = np.zeros([self.num_atoms, 3], dtype=Quantity)
-        for i, atom in enumerate(self.atoms):
-            coord[i, :] = atom.coordinate
-        return coord
+        return QuantityArray(self._coordinate, angstrom)
 
     @coordinate.setter
     def coordinate(self, coord):
-        coord = np.array(coord)
-        if not isArrayEqual(list(coord.shape), [self._num_atoms, 3]):
-            raise ValueError('Dimension of input %s is different from dimension of coordinate matrix %s' 
-                %(coord.shape, [self._num_atoms, 3]))
-
-        for i, atom in enumerate(self.atoms):
-            atom.coordinate = coord[i, :]
+        self._coordinate[:, :] = self._parseStateArray(coord, angstrom, unit.length)
+        self.updateCoordinateVersion()
             
     @property
     def velocity(self):
@@ -192,45 +266,96 @@ class System:
 
         Returns
         -------
-        np.ndarray
+        QuantityArray
             the velocity of all atoms in the system
         """        
-        velocity = np.zeros([self.num_atoms, 3], dtype=Quantity)
-        for i, atom in enumerate(self.atoms):
-            velocity[i, :] = atom.velocity
-        return velocity
+        return QuantityArray(self._velocity, angstrom / femtosecond)
 
     @velocity.setter
     def velocity(self, velocity):
-        velocity = np.array(velocity)
-        if not isArrayEqual(list(velocity.shape), [self._num_atoms, 3]):
-            raise ValueError('Dimension of input %s is different from dimension of coordinate matrix %s' 
-                %(velocity.shape, [self._num_atoms, 3]))
-
-        for i, atom in enumerate(self.atoms):
-            atom.velocity = velocity[i, :]
+        self._velocity[:, :] = self._parseStateArray(velocity, angstrom/femtosecond, unit.velocity)
             
     @property
     def force(self):
         """
-        force gets the velocity of all atoms in the system
+        force gets the force of all atoms in the system
 
         Returns
         -------
-        np.ndarray
+        QuantityArray
             the force of all atoms in the system
         """        
-        force = np.zeros([self.num_atoms, 3], dtype=Quantity)
-        for i, atom in enumerate(self.atoms):
-            force[i, :] = atom.force
-        return force
+        return QuantityArray(self._force, kilojoule_permol_over_angstrom)
 
     @force.setter
     def force(self, force):
-        force = np.array(force)
-        if not isArrayEqual(list(force.shape), [self._num_atoms, 3]):
-            raise ValueError('Dimension of input %s is different from dimension of coordinate matrix %s' 
-                %(force.shape, [self._num_atoms, 3]))
+        self._force[:, :] = self._parseStateArray(force, kilojoule_permol_over_angstrom, unit.force)
+
+    @property
+    def mass_array(self):
+        """
+        mass_array gets the mass buffer of all atoms in the system
+
+        Returns
+        -------
+        np.ndarray
+            (num_atoms, 1) float array of mass, in unit of ``amu``
+        """        
+        return self._mass
+
+    @property
+    def coordinate_array(self):
+        """
+        coordinate_array gets the coordinate buffer of all atoms in the system
 
-        for i, atom in enumerate(self.atoms):
-            atom.force = force[i, :]
+        The returned array shares memory with all atoms, modifying it in place changes ``Atom.coordinate``
+
+        Returns
+        -------
+        np.ndarray
+            (num_atoms, 3) float array of coordinate, in unit of ``angstrom``
+        """        
+        return self._coordinate
+
+    @property
+    def coordinate_version(self):
+        """
+        coordinate_version gets the coordinate version of ``self``
+
+        The version is increased whenever the coordinate is modified through ``System`` or ``Atom``,
+        or ``updateCoordinateVersion()`` is called after modifying ``self.coordinate_array`` in place
+
+        Returns
+        -------
+        int
+            the coordinate version
+        """
+        return int(self._coordinate_version[0])
+
+    @property
+    def velocity_array(self):
+        """
+        velocity_array gets the velocity buffer of all atoms in the system
+
+        The returned array shares memory with all atoms, modifying it in place changes ``Atom.velocity``
+
+        Returns
+        -------
+        np.ndarray
+            (num_atoms, 3) float array of velocity, in unit of ``angstrom/femtosecond``
+        """        
+        return self._velocity
+
+    @property
+    def force_array(self):
+        """
+        force_array gets the force buffer of all atoms in the system
+
+        The returned array shares memory with all atoms, modifying it in place changes ``Atom.force``
+
+        Returns
+        -------
+        np.ndarray
+            (num_atoms, 3) float array of force, in unit of ``kilojoule_permol_over_angstrom``
+        """        
+        return self._force
\ No newline at end of file
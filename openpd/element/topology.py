@@ -3,7 +3,7 @@
 '''
 file: topology.py
 created time : 2021/02/03
-last edit time : 2021/04/13
+last edit time : 2021/04/20
 author : Zhenyu Wei 
 version : 1.0
 contact : zhenyuwei99@gmail.com
@@ -29,6 +29,37 @@ class Topology:
 
     __str__ = __repr__
     
+    # note: Topology only record the topology information, didn't change any instance attributes
+    def _addChain(self, chain: Chain):
+        """
+        _addChain adds the coarse-grained topology of ``chain``
+
+        The first two atoms of each molecule are treated as :math:`C_{\\alpha}` and SC. 
+        Bonds, angles and torsions are only added when every molecule of ``chain`` contains both of them
+
+        This will only called by ``System`` instance
+
+        Parameters
+        ----------
+        chain : Chain
+            the ``Chain`` instance to be added
+        """        
+        molecules = chain.molecules
+        if chain.num_molecules != 0 and min([molecule.num_atoms for molecule in molecules]) >= 2:
+            for i, molecule in enumerate(molecules[:-1]):
+                next_molecule = molecules[i+1]
+                self.addBond(molecule.atoms[0], molecule.atoms[1]) # Ca - SC bond
+                self.addBond(molecule.atoms[0], next_molecule.atoms[0]) # Ca - Ca bond
+                self.addAngle(molecule.atoms[1], molecule.atoms[0], next_molecule.atoms[0]) # SC - Ca - Ca
+                self.addAngle(molecule.atoms[0], next_molecule.atoms[0], next_molecule.atoms[1]) # Ca - Ca - SC
+                self.addTorsion(
+                    molecule.atoms[1], molecule.atoms[0], 
+                    next_molecule.atoms[0], next_molecule.atoms[1]
+                ) # SC - Ca - Ca - SC
+            self.addBond(molecules[-1].atoms[0], molecules[-1].atoms[1])
+        for atom in chain.atoms:
+            self.addAtom(atom)
+
     def addAtom(self, atom: Atom):
         self._atoms.append(atom)
         self._num_atoms += 1
@@ -1,8 +1,11 @@
+import time, copy
 import numpy as np
 
 from .force import *
 from . import System
+from . import getTorsionAndGradient
 from .unit import *
+from .unit import QuantityArray
 
 # note: Ensemble contains all force for a simulation, creating from a System. When call _addForce(), Ensemble will call force.bindEnsemble to bind and activate the Force
 class Ensemble:   
@@ -10,6 +13,12 @@ class Ensemble:
         self._system = system
         self._forces = []
         self._num_forces = 0      
+        # note: key -> (coordinate version, value). Values are recalculated once the coordinate version of System changes
+        self._cache = {}
+        self._bond_index = None
+        self._torsion_index = None
+        self._is_profiling = False
+        self.resetProfile()
 
     # note: transits force directly to ensemble
     def _addForce(self, force:Force):
@@ -22,17 +31,206 @@ class Ensemble:
         for force in forces:
             self._addForce(force)
     
+    def enableProfiling(self):
+        """
+        enableProfiling starts recording the wall time and call counts of each ``Force`` and of simulation phases
+        """
+        self._is_profiling = True
+
+    def disableProfiling(self):
+        """
+        disableProfiling stops recording, the recorded profile is kept
+        """
+        self._is_profiling = False
+
+    def resetProfile(self):
+        """
+        resetProfile clears the recorded profile
+        """
+        self._profile = {'forces': {}, 'phases': {}}
+
+    def getProfile(self):
+        """
+        getProfile gets a copy of the recorded profile
+
+        Forces evaluated by the workers of ``WorkerPool`` are not recorded. 
+        The time of ``'integrator'`` phase includes the time of forces calculated during integration
+
+        Returns
+        -------
+        dict
+            - ``'forces'``: ``force_id`` to a dict of ``name``, ``force_group``, ``num_calls``, ``time`` in second, 
+              ``num_interactions`` (bonds, torsions or pairs processed), ``num_cache_hits``, ``num_local_calls`` and ``local_time``
+            - ``'phases'``: phase name, like ``'integrator'`` and ``'LogDumper 0'``, to a dict of ``num_calls`` and ``time`` in second
+        """
+        return copy.deepcopy(self._profile)
+
+    def _getForceProfile(self, force):
+        profile = self._profile['forces'].get(force.force_id, None)
+        if profile is None:
+            profile = {
+                'name': type(force).__name__, 'force_group': force.force_group,
+                'num_calls': 0, 'time': 0., 'num_interactions': 0, 'num_cache_hits': 0,
+                'num_local_calls': 0, 'local_time': 0.
+            }
+            self._profile['forces'][force.force_id] = profile
+        return profile
+
+    def _recordPhase(self, name, elapsed_time):
+        profile = self._profile['phases'].setdefault(name, {'num_calls': 0, 'time': 0.})
+        profile['num_calls'] += 1
+        profile['time'] += elapsed_time
+
+    def _getCachedValue(self, key, calculate):
+        version = self._system.coordinate_version
+        cache = self._cache.get(key, None)
+        if cache is None or cache[0] != version:
+            cache = (version, calculate())
+            self._cache[key] = cache
+        return cache[1]
+
+    def clearCache(self):
+        """
+        clearCache drops all cached energies, forces and geometries
+
+        Cached values are invalidated automatically by ``System.coordinate_version``. 
+        This method is only needed after modifying ``System.coordinate_array`` in place without ``System.updateCoordinateVersion()``
+        """
+        self._cache = {}
+
     def calculatePotentialEnergy(self, force_group=[0]):
+        return self.calculateReducedPotentialEnergy(force_group) * kilojoule_permol
+    
+    def calculateAtomForce(self, atom_id, force_group=[0]):
+        return QuantityArray(
+            self.calculateReducedEnergyAndForces(force_group)[1][atom_id, :], kilojoule_permol_over_angstrom
+        )
+
+    def calculateEnergyAndForces(self, force_group=[0]):
+        energy, forces = self.calculateReducedEnergyAndForces(force_group)
+        return energy * kilojoule_permol, forces
+
+    def calculateForces(self, force_group=[0]):
+        return self.calculateReducedEnergyAndForces(force_group)[1]
+
+    # note: Reduced methods work in the internal unit system (angstrom, femtosecond, amu, kilojoule_permol) without Quantity
+    def calculateReducedForceEnergyAndForces(self, force_id):
+        """
+        calculateReducedForceEnergyAndForces calculates the potential energy and forces of a single ``Force``
+
+        The result is cached until the coordinate version of ``System`` changes, 
+        so dumpers, minimizers and integrators evaluating the same coordinate share one calculation
+
+        Parameters
+        ----------
+        force_id : int
+            the ``force_id`` of ``Force``
+
+        Returns
+        -------
+        tuple(float, np.ndarray)
+            - The potential energy of ``Force``, in unit of ``kilojoule_permol``
+            - read-only (num_atoms, 3) float array of force acts on each atom, in unit of ``kilojoule_permol_over_angstrom``
+        """
+        force = self._forces[force_id]
+        if not self._is_profiling:
+            return self._getCachedValue(('force', force_id), lambda: self._calculateForce(force))
+        profile = self._getForceProfile(force)
+        num_calls = profile['num_calls']
+        result = self._getCachedValue(('force', force_id), lambda: self._calculateForce(force, profile))
+        if profile['num_calls'] == num_calls:
+            profile['num_cache_hits'] += 1
+        return result
+
+    @staticmethod
+    def _calculateForce(force, profile=None):
+        start_time = time.perf_counter()
+        energy, forces = force.calculateReducedEnergyAndForces()
+        forces = np.array(forces, dtype=np.float64)
+        forces.flags.writeable = False
+        if profile is not None:
+            profile['num_calls'] += 1
+            profile['time'] += time.perf_counter() - start_time
+            profile['num_interactions'] += force.num_interactions
+        return energy, forces
+
+    def calculateReducedEnergyAndForces(self, force_group=[0]):
         potential_energy = 0
+        forces = np.zeros([self._system.num_atoms, 3])
         for force in self.getForcesByGroup(force_group):
-            potential_energy += force.calculatePotentialEnergy()
+            energy, force_array = self.calculateReducedForceEnergyAndForces(force.force_id)
+            potential_energy += energy
+            forces += force_array
+        return potential_energy, forces
+
+    def calculateReducedPotentialEnergy(self, force_group=[0]):
+        potential_energy = 0
+        for force in self.getForcesByGroup(force_group):
+            potential_energy += self.calculateReducedForceEnergyAndForces(force.force_id)[0]
         return potential_energy
-    
-    def calculateAtomForce(self, atom_id, force_group=[0]):
-        atom_force = np.zeros([3]) * kilojoule_permol_over_angstrom
+
+    def calculateBondGeometry(self):
+        """
+        calculateBondGeometry calculates the vector and length of all bonds in ``System.topology``
+
+        The result is cached until the coordinate version of ``System`` changes
+
+        Returns
+        -------
+        tuple(np.ndarray, np.ndarray)
+            - read-only (num_bonds, 3) vector from the second atom to the first atom of each bond, in unit of ``angstrom``
+            - read-only (num_bonds, ) length of each bond, in unit of ``angstrom``
+        """
+        if self._bond_index is None:
+            self._bond_index = np.array(
+                [[bond[0].atom_id, bond[1].atom_id] for bond in self._system.topology.bonds], dtype=np.int64
+            ).reshape(-1, 2)
+        def calculate():
+            coord = self._system.coordinate_array
+            vec = coord[self._bond_index[:, 0], :] - coord[self._bond_index[:, 1], :]
+            bond_length = np.sqrt((vec**2).sum(1))
+            vec.flags.writeable = False
+            bond_length.flags.writeable = False
+            return vec, bond_length
+        return self._getCachedValue('bond', calculate)
+
+    def calculateTorsionGeometry(self):
+        """
+        calculateTorsionGeometry calculates the angle and the gradient of all torsions in ``System.topology``
+
+        The result is cached until the coordinate version of ``System`` changes
+
+        Returns
+        -------
+        tuple(np.ndarray, np.ndarray)
+            - read-only (num_torsions, ) torsion angle, in the range of [-pi, pi]
+            - read-only (num_torsions, 4, 3) gradient of torsion angle to the coordinate of each atom of the torsion
+        """
+        if self._torsion_index is None:
+            self._torsion_index = np.array(
+                [[atom.atom_id for atom in torsion] for torsion in self._system.topology.torsions], dtype=np.int64
+            ).reshape(-1, 4)
+        def calculate():
+            torsion_angle, gradient = getTorsionAndGradient(self._system.coordinate_array, self._torsion_index)
+            torsion_angle.flags.writeable = False
+            gradient.flags.writeable = False
+            return torsion_angle, gradient
+        return self._getCachedValue('torsion', calculate)
+
+    # note: Only terms involving atom_ids are summed, the difference before and after moving atom_ids equals the difference of total energy
+    def calculateReducedLocalEnergy(self, atom_ids, force_group=[0]):
+        atom_ids = np.asarray(atom_ids)
+        local_energy = 0
         for force in self.getForcesByGroup(force_group):
-            atom_force += force.calculateAtomForce(atom_id)
-        return atom_force
+            if self._is_profiling:
+                start_time = time.perf_counter()
+                local_energy += force.calculateReducedLocalEnergy(atom_ids)
+                profile = self._getForceProfile(force)
+                profile['num_local_calls'] += 1
+                profile['local_time'] += time.perf_counter() - start_time
+            else:
+                local_energy += force.calculateReducedLocalEnergy(atom_ids)
+        return local_energy
 
     def getForcesByGroup(self, force_group=[0]):
         return [force for force in self._forces if force.force_group in force_group]
@@ -50,4 +248,23 @@ class Ensemble:
 
     @property
     def num_forces(self):
-        return self._num_forces
\ No newline at end of file
+        return self._num_forces
+
+    @property
+    def force_groups(self):
+        """
+        force_groups gets the sorted list of force groups of all ``Force``
+
+        Pass it as ``force_group`` to evaluate the whole potential, 
+        as the default ``[0]`` drops forces put into other groups, like bonded forces for ``RESPAIntegrator``
+
+        Returns
+        -------
+        list
+            the force groups contained in ``self``
+        """
+        return sorted(set([force.force_group for force in self._forces]))
+
+    @property
+    def is_profiling(self):
+        return self._is_profiling
\ No newline at end of file
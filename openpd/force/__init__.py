@@ -5,15 +5,23 @@ __copyright__ = "Copyright 2021-2021, Southeast University and Zhenyu Wei"
 __license__ = "GPLv3"
 
 from .force import Force
+from .lookupTable import LookupTable
+from .neighborList import NeighborList
+from .forceFieldCache import loadForceFieldTables, clearForceFieldCache
+from .forceFieldCache import getForceFieldCacheSize, getForceFieldCacheLimit, setForceFieldCacheLimit
 from .pdffNonBondedForce import PDFFNonBondedForceField, PDFFNonBondedForce
 from .pdffBondForce import PDFFBondForceField, PDFFBondForce
 from .pdffTorsionForce import PDFFTorsionForceField, PDFFTorsionForce
+from .pdffHydroFieldForce import PDFFHydroFieldForceField, PDFFHydroFieldForce
 from .centerConstraintForce import CenterConstraintForce
 
 __all__ = [
-    'Force', 
+    'Force', 'LookupTable', 'NeighborList',
+    'loadForceFieldTables', 'clearForceFieldCache',
+    'getForceFieldCacheSize', 'getForceFieldCacheLimit', 'setForceFieldCacheLimit',
     'PDFFNonBondedForceField', 'PDFFNonBondedForce',
     'PDFFBondForceField', 'PDFFBondForce', 
     'PDFFTorsionForceField', 'PDFFTorsionForce',
+    'PDFFHydroFieldForceField', 'PDFFHydroFieldForce',
     'CenterConstraintForce'
 ]
\ No newline at end of file
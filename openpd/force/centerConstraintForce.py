@@ -1,8 +1,7 @@
 import numpy as np
 from . import Force
-from .. import getBond, getUnitVec
 from ..unit import *
-from ..unit import Quantity
+from ..unit import Quantity, QuantityArray
 from ..exceptions import RebindError
 
 class CenterConstraintForce(Force):
@@ -18,7 +17,7 @@ class CenterConstraintForce(Force):
             the id of force, by default 0
         force_group : int, optional
             the group of force, by default 0
-        origin_center : ndarray, optional
+        origin_center : ndarray or QuantityArray, optional
             the origin center of CenterConstraintForce, by default None
             If None, the mass center of initial conformation will be chosen to be the ``origin_center``
         elastic_constant : int or float or Quantity, optional
@@ -29,12 +28,14 @@ class CenterConstraintForce(Force):
         # origin_center == None means extract current center coord as the origin point
         # This can be only done after or during calling bindEnsemble
         self._is_extract_center = False
-        if origin_center == None:
+        if origin_center is None:
             self._is_extract_center = True
+        elif isinstance(origin_center, QuantityArray):
+            origin_center = origin_center.convertTo(angstrom)
         elif isinstance(origin_center[0], Quantity):
-            origin_center = np.array([i.convertTo(angstrom) for i in origin_center])
+            origin_center = QuantityArray.fromQuantities(origin_center, angstrom)
         else:
-            origin_center = np.array(origin_center * angstrom)
+            origin_center = QuantityArray(origin_center, angstrom)
         self._origin_center = origin_center
 
         if isinstance(elastic_constant, Quantity):
@@ -42,6 +43,7 @@ class CenterConstraintForce(Force):
         else:
             elastic_constant = elastic_constant * kilojoule_permol/angstrom**2
         self._elastic_constant = elastic_constant
+        self._reduced_elastic_constant = elastic_constant / (kilojoule_permol / angstrom**2) # Used in the inner loop
         self._num_atoms = 0
         self._potential_energy = 0
 
@@ -81,23 +83,46 @@ class CenterConstraintForce(Force):
         self._total_mass = 0 * amu
         for atom in self._atoms:
             self._total_mass += atom.mass
+        mass = self._ensemble.system.mass_array
+        self._mass_ratio = mass / mass.sum() # (num_atoms, 1), the share of each atom in the force
+        self._mass_center = np.zeros([3])
+        self._mass_center_version = None
         if self._is_extract_center:
             self._origin_center = self.calculateMassCenter()
+
+    def _updateMassCenter(self, is_forced=False):
+        """
+        _updateMassCenter recalculates the mass center only when the coordinate version of ``System`` has changed
+
+        Parameters
+        ----------
+        is_forced : bool, optional
+            recalculate regardless of the coordinate version, by default False
+
+        Returns
+        -------
+        np.ndarray
+            (3, ) mass center, in unit of ``angstrom``
+        """
+        system = self._ensemble.system
+        if is_forced or self._mass_center_version != system.coordinate_version:
+            self._mass_center = (system.coordinate_array * self._mass_ratio).sum(0)
+            self._mass_center_version = system.coordinate_version
+        return self._mass_center
     
     def calculateMassCenter(self):
         """
         calculateMassCenter calculates the mass center of bounded ``ensemble``
 
+        The mass center is cached until the coordinate version of ``System`` changes
+
         Returns
         -------
-        ndarray(dtype=Quantity)
+        QuantityArray
             the mass center of bounded ``ensemble``
         """        
         self._testBound()
-        mass_center = np.zeros(3) * angstrom * amu
-        for atom in self._atoms:
-            mass_center += atom.coordinate * atom.mass
-        return mass_center / self._total_mass
+        return QuantityArray(self._updateMassCenter(), angstrom)
 
     def calculatePotentialEnergy(self):
         """
@@ -109,14 +134,51 @@ class CenterConstraintForce(Force):
             The potential energy of ``CenterConstraintForce``
         """      
         self._testBound()
-        cur_center = self.calculateMassCenter()
-        self._potential_energy = (
-            0.5 * self._elastic_constant * getBond(
-                cur_center , self._origin_center
-            )**2
-        )
+        vec = self._origin_center.value - self._updateMassCenter()
+        self._potential_energy = 0.5 * self._elastic_constant * (vec**2).sum() * angstrom**2
         return self._potential_energy
 
+    def calculateReducedEnergyAndForces(self):
+        """
+        calculateReducedEnergyAndForces calculates the potential energy of ``CenterConstraintForce`` and the force acts on all atoms in one pass
+
+        The mass center is recalculated once per call, as in-place modification of ``System.coordinate_array`` 
+        may not update the coordinate version, and the force of each atom is proportional to its mass
+
+        Returns
+        -------
+        tuple(float, np.ndarray)
+            - The potential energy of ``CenterConstraintForce``, in unit of ``kilojoule_permol``
+            - (num_atoms, 3) float array of force acts on each atom, in unit of ``kilojoule_permol_over_angstrom``
+        """        
+        self._testBound()
+        elastic_constant = self._reduced_elastic_constant
+        vec = self._origin_center.value - self._updateMassCenter(is_forced=True)
+        energy = 0.5 * elastic_constant * (vec**2).sum()
+        forces = elastic_constant * self._mass_ratio * vec
+        self._potential_energy = energy * kilojoule_permol
+        return energy, forces
+
+    def calculateReducedLocalEnergy(self, atom_ids):
+        """
+        calculateReducedLocalEnergy overloads ``Force.calculateReducedLocalEnergy()``
+
+        Moving any atom shifts the mass center, so the whole potential energy is returned without calculating forces
+
+        Parameters
+        ----------
+        atom_ids : np.ndarray
+            the id of atoms
+
+        Returns
+        -------
+        float
+            The potential energy of ``CenterConstraintForce``, in unit of ``kilojoule_permol``
+        """
+        self._testBound()
+        vec = self._origin_center.value - self._updateMassCenter(is_forced=True)
+        return 0.5 * self._reduced_elastic_constant * (vec**2).sum()
+
     def calculateAtomForce(self, atom_id):
         """
         calculateAtomForce calculates the force acts on atom
@@ -126,21 +188,19 @@ class CenterConstraintForce(Force):
         atom_id : int
             The id of atom
 
+        The cached mass center is used, so calculating forces of all atoms is O(N)
+
         Returns
         -------
-        Quantity
+        QuantityArray
             the force acts on atom
         """        
         self._testBound()
-        atom = self._atoms[atom_id]
-        cur_center = self.calculateMassCenter()
-        force = (
-            self._elastic_constant * getBond(
-                cur_center, self._origin_center
-            ) * atom.mass / self._total_mass
+        vec = self._origin_center.value - self._updateMassCenter()
+        return QuantityArray(
+            self._reduced_elastic_constant * self._mass_ratio[atom_id, 0] * vec, 
+            kilojoule_permol_over_angstrom
         )
-        vec = getUnitVec(self._origin_center - cur_center)
-        return force * vec
 
     @property
     def num_atoms(self):
@@ -161,7 +221,7 @@ class CenterConstraintForce(Force):
 
         Returns
         -------
-        ndarray(dtype=Quantity)
+        QuantityArray
             the origin center of ``CenterConstraintForce``
         """        
         return self._origin_center
@@ -177,7 +237,7 @@ class CenterConstraintForce(Force):
             The potential energy of ``CenterConstraintForce``
         """     
         try:
-            self.calculatePotentialEnergy()
+            self._ensemble.calculateReducedForceEnergyAndForces(self._force_id)
             return self._potential_energy
         except:
             return self._potential_energy
\ No newline at end of file
@@ -1,3 +1,5 @@
+import numpy as np
+from ..unit import *
 from ..exceptions import NonboundError
 # note: Evergy force has a force_id and an affiliated force_group
 class Force(object):
@@ -32,6 +34,100 @@ class Force(object):
             When this method is not overloaded by subclass
         """        
         raise NotImplementedError('bindEnsemble() method has not been overloaded yet!')
+
+    def calculatePotentialEnergy(self):
+        """
+        calculatePotentialEnergy calculates the potential energy of ``Force``
+
+        Raises
+        ------
+        NotImplementedError
+            When this method is not overloaded by subclass
+        """        
+        raise NotImplementedError('calculatePotentialEnergy() method has not been overloaded yet!')
+
+    def calculateAtomForce(self, atom_id):
+        """
+        calculateAtomForce calculates the force acts on atom
+
+        Parameters
+        ----------
+        atom_id : int
+            The id of atom
+
+        Raises
+        ------
+        NotImplementedError
+            When this method is not overloaded by subclass
+        """        
+        raise NotImplementedError('calculateAtomForce() method has not been overloaded yet!')
+
+    def calculateEnergyAndForces(self):
+        """
+        calculateEnergyAndForces calculates the potential energy and the force acts on all atoms in one call
+
+        Unit is only attached to the result of ``calculateReducedEnergyAndForces()``
+
+        Returns
+        -------
+        tuple(Quantity, np.ndarray)
+            - The potential energy of ``Force``
+            - (num_atoms, 3) float array of force acts on each atom, in unit of ``kilojoule_permol_over_angstrom``
+        """        
+        energy, forces = self.calculateReducedEnergyAndForces()
+        return energy * kilojoule_permol, forces
+
+    def calculateReducedEnergyAndForces(self):
+        """
+        calculateReducedEnergyAndForces calculates the potential energy and the force acts on all atoms in the internal unit system
+
+        The internal unit system is angstrom, femtosecond, amu and kilojoule_permol, results are raw floats without ``Quantity``. 
+        This default implementation calls ``calculatePotentialEnergy()`` and ``calculateAtomForce()`` of every atom. 
+        Subclass should overload it to share intermediate geometry between atoms
+
+        Returns
+        -------
+        tuple(float, np.ndarray)
+            - The potential energy of ``Force``, in unit of ``kilojoule_permol``
+            - (num_atoms, 3) float array of force acts on each atom, in unit of ``kilojoule_permol_over_angstrom``
+        """        
+        self._testBound()
+        forces = np.zeros([self._ensemble.system.num_atoms, 3])
+        for atom_id in range(self._ensemble.system.num_atoms):
+            forces[atom_id, :] = self.calculateAtomForce(atom_id) / kilojoule_permol_over_angstrom
+        return self.calculatePotentialEnergy() / kilojoule_permol, forces
+
+    def calculateReducedLocalEnergy(self, atom_ids):
+        """
+        calculateReducedLocalEnergy calculates the potential energy of the terms involving any of ``atom_ids``
+
+        The difference of local energy before and after moving ``atom_ids`` equals the difference of total energy, 
+        which is used by Monte Carlo moves to avoid a full evaluation. 
+        This default implementation returns the total energy. 
+        Subclass should overload it to calculate only the affected terms
+
+        Parameters
+        ----------
+        atom_ids : np.ndarray
+            the id of atoms
+
+        Returns
+        -------
+        float
+            The local potential energy, in unit of ``kilojoule_permol``
+        """
+        return self.calculateReducedEnergyAndForces()[0]
+
+    def calculateForces(self):
+        """
+        calculateForces calculates the force acts on all atoms in one call
+
+        Returns
+        -------
+        np.ndarray
+            (num_atoms, 3) float array of force acts on each atom, in unit of ``kilojoule_permol_over_angstrom``
+        """        
+        return self.calculateReducedEnergyAndForces()[1]
     
     def _testBound(self):
         if self._is_bound == False:
@@ -39,6 +135,22 @@ class Force(object):
                 'Force has not been bound to any Ensemble!'
             )
 
+    @property
+    def num_interactions(self):
+        """
+        num_interactions gets the number of interactions processed by a full calculation, used by the profile of ``Ensemble``
+
+        This default implementation returns the number of atoms. 
+        Subclass should overload it to return the number of bonds, torsions or pairs
+
+        Returns
+        -------
+        int
+            the number of interactions
+        """
+        self._testBound()
+        return self._ensemble.system.num_atoms
+
     @property
     def force_id(self):
         """
@@ -0,0 +1,112 @@
+import os
+import numpy as np
+from collections import OrderedDict
+from .lookupTable import LookupTable
+
+# note: Process-wide cache shared by all force fields, forces and ensembles. Key: (file_path, period)
+_force_field_cache = OrderedDict()
+_force_field_cache_limit = None
+
+def loadForceFieldTables(file_path, period=None):
+    """
+    loadForceFieldTables loads the tabulated data in ``file_path`` and fits the energy and force ``LookupTable``
+
+    Each file is loaded and fitted only once, later calls return the cached objects,
+    which should be treated as read-only
+
+    Parameters
+    ----------
+    file_path : str
+        the path of ``.npz`` file containing ``energy_coord``, ``energy_data``, ``force_coord`` and ``force_data``
+    period : float, optional
+        the period of the tables, by default None, which means the tables are not periodic
+
+    Returns
+    -------
+    tuple(dict, LookupTable, LookupTable)
+        - The origin data of the file
+        - The energy table
+        - The force table
+
+    Raises
+    ------
+    FileNotFoundError
+        When ``file_path`` does not exist
+    """
+    key = (os.path.abspath(file_path), period)
+    if key in _force_field_cache:
+        _force_field_cache.move_to_end(key)
+        return _force_field_cache[key]
+    with np.load(file_path) as npz_file:
+        origin_data = {name: npz_file[name] for name in npz_file.files}
+    # Out of range, force is kept constant and energy is extrapolated along the force, keeping force = -dE/dr
+    force_table = LookupTable(origin_data['force_coord'], origin_data['force_data'], period=period)
+    energy_table = LookupTable(
+        origin_data['energy_coord'], origin_data['energy_data'], period=period,
+        edge_slopes=None if period != None else -force_table.edge_values
+    )
+    tables = (origin_data, energy_table, force_table)
+    _force_field_cache[key] = tables
+    _shrinkForceFieldCache()
+    return tables
+
+def _shrinkForceFieldCache():
+    if _force_field_cache_limit != None:
+        while len(_force_field_cache) > _force_field_cache_limit:
+            # Least recently used file is dropped first
+            _force_field_cache.popitem(last=False)
+
+def clearForceFieldCache():
+    """
+    clearForceFieldCache removes all cached force field tables
+
+    Force fields created before calling keep their own references to the tables
+    """
+    _force_field_cache.clear()
+
+def getForceFieldCacheSize():
+    """
+    getForceFieldCacheSize gets the number of cached force field files
+
+    Returns
+    -------
+    int
+        the number of cached force field files
+    """
+    return len(_force_field_cache)
+
+def getForceFieldCacheLimit():
+    """
+    getForceFieldCacheLimit gets the maximum number of cached force field files
+
+    Returns
+    -------
+    int or None
+        the maximum number of cached force field files, None means unlimited
+    """
+    return _force_field_cache_limit
+
+def setForceFieldCacheLimit(limit):
+    """
+    setForceFieldCacheLimit sets the maximum number of cached force field files
+
+    Least recently used files are dropped when the number of cached files exceeds ``limit``
+
+    Parameters
+    ----------
+    limit : int or None
+        the maximum number of cached force field files, None means unlimited
+
+    Raises
+    ------
+    ValueError
+        When ``limit`` is less than 1
+    """
+    global _force_field_cache_limit
+    if limit != None and limit < 1:
+        raise ValueError(
+            'Limit of force field cache should be greater than 0 or None, instead of %s'
+            %(limit)
+        )
+    _force_field_cache_limit = limit
+    _shrinkForceFieldCache()
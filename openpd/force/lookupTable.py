@@ -0,0 +1,173 @@
+import numpy as np
+from scipy.interpolate import interp1d, CubicSpline
+
+class LookupTable:
+    def __init__(self, coord, data, spacing=None, period=None, edge_slopes=None) -> None:
+        """
+        Parameters
+        ----------
+        coord : list or np.ndarray
+            The coordinate of the tabulated curve, in ascending order
+        data : list or np.ndarray
+            The value of the tabulated curve at ``coord``
+        spacing : float, optional
+            The spacing of the uniform grid, by default None, which means the median spacing of ``coord``
+        period : float, optional
+            The period of the curve, by default None, which means the curve is not periodic.
+            Periodic curve starts from ``coord[0]`` and will be wrapped into ``[coord[0], coord[0]+period)``
+        edge_slopes : list or np.ndarray, optional
+            The slopes used to extrapolate below and above a non-periodic table, 
+            by default None, which means the value at the edge is kept constant out of the range
+
+        Raises
+        ------
+        ValueError
+            When the length of ``coord`` and ``data`` are different
+        """
+        coord = np.array(coord, dtype=np.float64)
+        data = np.array(data, dtype=np.float64)
+        if coord.shape != data.shape:
+            raise ValueError(
+                'The length of coord (%d) and data (%d) are different'
+                %(coord.shape[0], data.shape[0])
+            )
+        if spacing == None:
+            spacing = np.median(np.diff(coord))
+        self._period = period
+        if period == None:
+            # Grid is aligned to the last coordinate, so that uniformly tabulated tails keep their own knots
+            self._num_intervals = int(np.ceil((coord[-1] - coord[0]) / spacing - 1e-6))
+            self._spacing = spacing
+            self._start = coord[-1] - self._num_intervals * spacing
+        else:
+            self._num_intervals = int(round(period / spacing))
+            self._spacing = period / self._num_intervals
+            self._start = coord[0]
+        grid = self._start + np.arange(self._num_intervals + 1) * self._spacing
+        grid_data = self._resample(coord, data, grid)
+        if period == None:
+            spline = CubicSpline(grid, grid_data)
+        else:
+            grid_data[-1] = grid_data[0]
+            spline = CubicSpline(grid, grid_data, bc_type='periodic')
+        self._coefficient = np.ascontiguousarray(spline.c)
+        self._edge_slopes = np.zeros(2)
+        if period == None and edge_slopes is not None:
+            self._edge_slopes[:] = edge_slopes
+
+    def __repr__(self) -> str:
+        return (
+            '<LookupTable object: %d intervals, spacing %.2e, at 0x%x>'
+            %(self._num_intervals, self._spacing, id(self))
+        )
+
+    __str__ = __repr__
+
+    def _resample(self, coord, data, grid):
+        """
+        _resample gets the value of the tabulated curve on ``grid``
+
+        Grid points coinciding with ``coord`` take ``data`` directly, 
+        others are interpolated by cubic ``interp1d``
+        """
+        index = np.clip(np.searchsorted(coord, grid), 1, coord.shape[0] - 1)
+        index = np.where(
+            np.abs(coord[index - 1] - grid) < np.abs(coord[index] - grid), index - 1, index
+        )
+        is_knot = np.abs(coord[index] - grid) < 1e-6 * self._spacing
+        grid_data = np.empty(grid.shape)
+        grid_data[is_knot] = data[index[is_knot]]
+        if not is_knot.all():
+            grid_data[~is_knot] = interp1d(
+                coord, data, kind='cubic', bounds_error=False, fill_value='extrapolate'
+            )(grid[~is_knot])
+        return grid_data
+
+    def __call__(self, coord):
+        """
+        __call__ evaluates the table at ``coord``
+
+        Coordinates out of the range of a non-periodic table are extrapolated linearly from the value at the edge 
+        with ``edge_slopes``, or kept constant without ``edge_slopes``, 
+        so that the result never follows the cubic edge polynomials
+
+        Parameters
+        ----------
+        coord : float or list or np.ndarray
+            The coordinate of the wanted value
+
+        Returns
+        -------
+        float or np.ndarray
+            The value at ``coord``
+        """
+        coord = np.asarray(coord, dtype=np.float64) - self._start
+        excess = 0
+        if self._period != None:
+            coord = np.mod(coord, self._period)
+        else:
+            end = self._num_intervals * self._spacing
+            clipped_coord = np.clip(coord, 0, end)
+            excess = coord - clipped_coord
+            coord = clipped_coord
+        index = np.clip(
+            np.floor(coord / self._spacing).astype(np.int64), 0, self._num_intervals - 1
+        )
+        coord = coord - index * self._spacing
+        coefficient = self._coefficient[:, index]
+        value = ((coefficient[0] * coord + coefficient[1]) * coord + coefficient[2]) * coord + coefficient[3]
+        if self._period != None:
+            return value
+        return value + np.where(excess < 0, self._edge_slopes[0], self._edge_slopes[1]) * excess
+
+    @property
+    def spacing(self):
+        """
+        spacing gets the spacing of the uniform grid
+
+        Returns
+        -------
+        float
+            the spacing of the uniform grid
+        """
+        return self._spacing
+
+    @property
+    def num_intervals(self):
+        """
+        num_intervals gets the number of intervals of the uniform grid
+
+        Returns
+        -------
+        int
+            the number of intervals
+        """
+        return self._num_intervals
+
+    @property
+    def edge_values(self):
+        """
+        edge_values gets the values at the lower and upper edges of the uniform grid
+
+        Returns
+        -------
+        np.ndarray
+            (2, ) the values at the edges
+        """
+        last = self._coefficient[:, -1]
+        return np.array([
+            self._coefficient[3, 0],
+            ((last[0] * self._spacing + last[1]) * self._spacing + last[2]) * self._spacing + last[3]
+        ])
+
+    @property
+    def period(self):
+        """
+        period gets the period of the table
+
+        Returns
+        -------
+        float or None
+            the period of the table, None if the table is not periodic
+        """
+        return self._period
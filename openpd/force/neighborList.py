@@ -0,0 +1,230 @@
+import numpy as np
+from ..unit import *
+from ..unit import Quantity
+
+# Offsets of the cell itself and 13 of its 26 neighbor cells, each unordered cell pair is visited once
+HALF_SHELL_OFFSETS = np.array([
+    [i, j, k] for i in [-1, 0, 1] for j in [-1, 0, 1] for k in [-1, 0, 1]
+    if (i, j, k) >= (0, 0, 0)
+])
+
+class NeighborList:
+    def __init__(self, cutoff_radius=12, skin_width=2) -> None:
+        """
+        Parameters
+        ----------
+        cutoff_radius : int or float or Quantity, optional
+            the cutoff radius of the interaction, by default ``12 * angstrom``
+        skin_width : int or float or Quantity, optional
+            the skin width added to ``cutoff_radius`` when building the list, by default ``2 * angstrom``.
+            The list is rebuilt when any particle moves more than half of ``skin_width``
+
+        Raises
+        ------
+        ValueError
+            When ``cutoff_radius`` is not positive or ``skin_width`` is negative
+        """
+        if isinstance(cutoff_radius, Quantity):
+            cutoff_radius = cutoff_radius.convertTo(angstrom) / angstrom
+        if isinstance(skin_width, Quantity):
+            skin_width = skin_width.convertTo(angstrom) / angstrom
+        if cutoff_radius <= 0:
+            raise ValueError('Cutoff radius should be positive, instead of %s' %(cutoff_radius))
+        if skin_width < 0:
+            raise ValueError('Skin width should not be negative, instead of %s' %(skin_width))
+        self._cutoff_radius = cutoff_radius
+        self._skin_width = skin_width
+        self._reference_coordinate = None
+        self._pair_index = np.zeros([2, 0], dtype=np.int64)
+        self.resetStatistics()
+
+    def __repr__(self) -> str:
+        return (
+            '<NeighborList object: %d pairs, %d builds in %d checks, at 0x%x>'
+            %(self.num_pairs, self._num_builds, self._num_checks, id(self))
+        )
+
+    __str__ = __repr__
+
+    def resetStatistics(self):
+        """
+        resetStatistics resets the rebuild statistics of ``self``
+        """
+        self._num_builds = 0
+        self._num_checks = 0
+        self._max_displacement = 0
+
+    def update(self, coordinate):
+        """
+        update rebuilds the list if any particle has moved more than half of ``skin_width`` since the last build
+
+        Parameters
+        ----------
+        coordinate : np.ndarray
+            (num_particles, 3) coordinate of particles, in unit of angstrom
+
+        Returns
+        -------
+        bool
+            True if the list has been rebuilt
+        """
+        self._num_checks += 1
+        if (
+            self._reference_coordinate is None or
+            self._reference_coordinate.shape != coordinate.shape
+        ):
+            self.rebuild(coordinate)
+            return True
+        displacement = np.sqrt(((coordinate - self._reference_coordinate)**2).sum(1)).max()
+        self._max_displacement = max(self._max_displacement, displacement)
+        if 2 * displacement > self._skin_width:
+            self.rebuild(coordinate)
+            return True
+        return False
+
+    def rebuild(self, coordinate):
+        """
+        rebuild builds the list from scratch with a cell list
+
+        Particles are binned into cubic cells with edge length ``cutoff_radius + skin_width``,
+        so only particles in the same or adjacent cells need to be checked
+
+        Parameters
+        ----------
+        coordinate : np.ndarray
+            (num_particles, 3) coordinate of particles, in unit of angstrom
+        """
+        coordinate = np.array(coordinate, dtype=np.float64)
+        list_radius = self._cutoff_radius + self._skin_width
+        cell_index = np.floor((coordinate - coordinate.min(0)) / list_radius).astype(np.int64)
+        num_cells = cell_index.max(0) + 1
+        cell_id = self._getCellId(cell_index, num_cells)
+        order = np.argsort(cell_id, kind='stable')
+        cell_count = np.bincount(cell_id, minlength=num_cells.prod())
+        cell_start = np.cumsum(cell_count) - cell_count
+        index0, index1 = [], []
+        for offset in HALF_SHELL_OFFSETS:
+            neighbor_index = cell_index + offset
+            particles = np.where(np.all((neighbor_index >= 0) & (neighbor_index < num_cells), 1))[0]
+            neighbor_id = self._getCellId(neighbor_index[particles, :], num_cells)
+            counts = cell_count[neighbor_id]
+            # Pair each particle with every particle in its neighbor cell
+            position = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+            index_i = np.repeat(particles, counts)
+            index_j = order[np.repeat(cell_start[neighbor_id], counts) + position]
+            if not offset.any():
+                is_unique = index_i < index_j
+                index_i, index_j = index_i[is_unique], index_j[is_unique]
+            index0.append(index_i)
+            index1.append(index_j)
+        index0, index1 = np.concatenate(index0), np.concatenate(index1)
+        is_close = ((coordinate[index1, :] - coordinate[index0, :])**2).sum(1) <= list_radius**2
+        pair_index = np.array([
+            np.minimum(index0, index1)[is_close], np.maximum(index0, index1)[is_close]
+        ])
+        self._pair_index = pair_index[:, np.lexsort(pair_index[::-1, :])]
+        self._reference_coordinate = coordinate
+        self._num_builds += 1
+
+    @staticmethod
+    def _getCellId(cell_index, num_cells):
+        return (cell_index[:, 0] * num_cells[1] + cell_index[:, 1]) * num_cells[2] + cell_index[:, 2]
+
+    @property
+    def cutoff_radius(self):
+        """
+        cutoff_radius gets the cutoff radius of ``self``
+
+        Returns
+        -------
+        Quantity
+            the cutoff radius
+        """
+        return self._cutoff_radius * angstrom
+
+    @property
+    def skin_width(self):
+        """
+        skin_width gets the skin width of ``self``
+
+        Returns
+        -------
+        Quantity
+            the skin width
+        """
+        return self._skin_width * angstrom
+
+    @property
+    def pair_index(self):
+        """
+        pair_index gets the index of particle pairs within ``cutoff_radius + skin_width`` at the last build
+
+        Returns
+        -------
+        np.ndarray
+            (2, num_pairs) index array, ``pair_index[0, :] < pair_index[1, :]``
+        """
+        return self._pair_index
+
+    @property
+    def num_pairs(self):
+        """
+        num_pairs gets the number of pairs in the list
+
+        Returns
+        -------
+        int
+            the number of pairs
+        """
+        return self._pair_index.shape[1]
+
+    @property
+    def num_builds(self):
+        """
+        num_builds gets the number of builds since the last ``resetStatistics()``
+
+        Returns
+        -------
+        int
+            the number of builds
+        """
+        return self._num_builds
+
+    @property
+    def num_checks(self):
+        """
+        num_checks gets the number of ``update()`` calls since the last ``resetStatistics()``
+
+        Returns
+        -------
+        int
+            the number of checks
+        """
+        return self._num_checks
+
+    @property
+    def build_ratio(self):
+        """
+        build_ratio gets the ratio of ``update()`` calls that triggered a rebuild
+
+        A ratio close to 1 means ``skin_width`` is too small,
+        while a ratio close to 0 with a large ``num_pairs`` means it is too large
+
+        Returns
+        -------
+        float
+            ``num_builds / num_checks``, 0 if ``update()`` has not been called
+        """
+        return self._num_builds / self._num_checks if self._num_checks != 0 else 0
+
+    @property
+    def max_displacement(self):
+        """
+        max_displacement gets the maximum displacement observed by ``update()`` since the last ``resetStatistics()``
+
+        Returns
+        -------
+        Quantity
+            the maximum displacement
+        """
+        return self._max_displacement * angstrom
@@ -1,10 +1,10 @@
 import os
 import numpy as np
-from scipy.interpolate import interp1d
 from . import Force
-from .. import getBond, getUnitVec, isStandardPeptide
+from .forceFieldCache import loadForceFieldTables
+from .. import isStandardPeptide
 from ..unit import *
-from ..unit import Quantity
+from ..unit import Quantity, QuantityArray
 from ..exceptions import RebindError, NotincludedInteractionError
 
 cur_dir = os.path.abspath(os.path.dirname(os.path.abspath(__file__)))
@@ -38,14 +38,14 @@ class PDFFBondForceField:
             self._key = 'CA-CA'
             self._name = peptide_type1 + ' Ca - ' + peptide_type2 + ' Ca bond'
         try:
-            self._origin_data = np.load(os.path.join(force_field_dir, self._key + '.npz'))
+            self._origin_data, self._energy_table, self._force_table = loadForceFieldTables(
+                os.path.join(force_field_dir, self._key + '.npz')
+            )
         except:
             raise NotincludedInteractionError(
                 '%s is not contained in PDFF Bond Force Field' 
                 %(self._name)    
             ) 
-        self._setEnergyInterp()
-        self._setForceInterp()
 
     def __repr__(self) -> str:
         return (
@@ -55,18 +55,6 @@ class PDFFBondForceField:
 
     __str__ = __repr__
 
-    def _setEnergyInterp(self):
-        self._energy_interp = interp1d(
-            self._origin_data['energy_coord'], 
-            self._origin_data['energy_data'], kind='cubic'
-        )
-
-    def _setForceInterp(self):
-        self._force_interp = interp1d(
-            self._origin_data['force_coord'], 
-            self._origin_data['force_data'], kind='cubic'
-        )
-
     def getEnergy(self, coord):
         """
         getEnergy calculates the energy in specific coordinate
@@ -83,7 +71,7 @@ class PDFFBondForceField:
         """        
         if isinstance(coord, Quantity):
             coord = coord.convertTo(angstrom) / angstrom
-        return self._energy_interp(coord) * kilojoule_permol
+        return self._energy_table(coord) * kilojoule_permol
 
     def getForce(self, coord):
         """
@@ -101,7 +89,7 @@ class PDFFBondForceField:
         """        
         if isinstance(coord, Quantity):
             coord = coord.convertTo(angstrom) / angstrom
-        return self._force_interp(coord) * kilojoule_permol_over_angstrom
+        return self._force_table(coord) * kilojoule_permol_over_angstrom
 
     @property
     def name(self):
@@ -116,10 +104,7 @@ class PDFFBondForceField:
         return self._name
 
 class PDFFBondForce(Force):
-    def __init__(
-        self, force_id=0, force_group=0,
-        derivative_width=0.0001
-    ) -> None:
+    def __init__(self, force_id=0, force_group=0) -> None:
         """
         Parameters
         ----------
@@ -127,11 +112,8 @@ class PDFFBondForce(Force):
             the id of force, by default 0
         force_group : int, optional
             the group of force, by default 0
-        derivative_width : float, optional
-            the derivative width used to calculate force, by default 0.0001
         """        
         super().__init__(force_id, force_group)
-        self._derivative_width = derivative_width
         
         self._num_bonds = 0
         self._potential_energy = 0
@@ -174,6 +156,9 @@ class PDFFBondForce(Force):
                 bond[0].peptide_type,
                 bond[1].peptide_type
             ]) # Molecule type of two atoms, if the same, Ca-SC, not Ca-Ca
+        self._bond_index = np.array(
+            [[bond[0].atom_id, bond[1].atom_id] for bond in self._bonds], dtype=np.int64
+        ).reshape(-1, 2)
         self._setForceFieldVector()
 
     def _setForceFieldVector(self):
@@ -184,10 +169,59 @@ class PDFFBondForce(Force):
                 %(self._num_bonds)
             )
         self._force_field_vector = np.zeros(self._num_bonds, dtype=PDFFBondForceField)
+        force_field_dict = {} # Bonds of the same type share one force field
         for i, bond_type in enumerate(self._bond_types):
-            self._force_field_vector[i] = PDFFBondForceField(
-                bond_type[0], bond_type[1]
-            )
+            key = tuple(bond_type)
+            if not key in force_field_dict.keys():
+                force_field_dict[key] = PDFFBondForceField(bond_type[0], bond_type[1])
+            self._force_field_vector[i] = force_field_dict[key]
+        self._setBondGroup()
+
+    def _setBondGroup(self):
+        # Bonds sharing the same tables are grouped, so that each table is evaluated once for the whole group
+        group_dict = {}
+        for bond_id, force_field in enumerate(self._force_field_vector):
+            group_dict.setdefault(id(force_field._energy_table), [force_field, []])[1].append(bond_id)
+        self._group_force_fields = [group[0] for group in group_dict.values()]
+        self._group_bond_index = [np.array(group[1]) for group in group_dict.values()]
+        self._bond_group = np.zeros(self._num_bonds, dtype=np.int64)
+        for group, group_index in enumerate(self._group_bond_index):
+            self._bond_group[group_index] = group
+
+    def _calculateBondEnergyAndForces(self, bond_ids=None):
+        """
+        _calculateBondEnergyAndForces calculates the energy of bonds and the forces acting on their atoms in one vectorized pass
+
+        Parameters
+        ----------
+        bond_ids : np.ndarray, optional
+            the id of bonds to be calculated, by default None, which means all bonds
+
+        Returns
+        -------
+        tuple(float, np.ndarray)
+            - The potential energy of bonds, in unit of ``kilojoule_permol``
+            - (num_atoms, 3) float array of force acts on each atom, in unit of ``kilojoule_permol_over_angstrom``
+        """
+        bond_mask = np.ones(self._num_bonds, dtype=bool)
+        if bond_ids is not None:
+            bond_mask[:] = False
+            bond_mask[bond_ids] = True
+        # Geometry of all bonds is shared through the cache of Ensemble
+        vec, bond_length = self._ensemble.calculateBondGeometry()
+        energy = 0
+        bond_force = np.zeros(self._num_bonds)
+        for force_field, group_index in zip(self._group_force_fields, self._group_bond_index):
+            group_index = group_index[bond_mask[group_index]]
+            if group_index.shape[0] != 0:
+                energy += force_field._energy_table(bond_length[group_index]).sum()
+                bond_force[group_index] = force_field._force_table(bond_length[group_index])
+        # fixme: Need to multiple 0.5 to each force?
+        force = (0.5 * bond_force / bond_length)[:, np.newaxis] * vec
+        forces = np.zeros([self._ensemble.system.num_atoms, 3])
+        np.add.at(forces, self._bond_index[bond_mask, 0], force[bond_mask, :])
+        np.add.at(forces, self._bond_index[bond_mask, 1], -force[bond_mask, :])
+        return energy, forces
 
     def calculateBondEnergy(self, bond_id):
         """
@@ -204,10 +238,7 @@ class PDFFBondForce(Force):
             The potential energy of specific bond
         """   
         self._testBound()
-        bond_length = getBond(
-            self._bonds[bond_id][0].coordinate,
-            self._bonds[bond_id][1].coordinate
-        )
+        bond_length = self._ensemble.calculateBondGeometry()[1][bond_id]
         return self._force_field_vector[bond_id].getEnergy(bond_length)
 
     def calculatePotentialEnergy(self):
@@ -220,15 +251,57 @@ class PDFFBondForce(Force):
             The potential energy of all bonds
         """        
         self._testBound()
-        self._potential_energy = 0
-        for bond_id in range(self._num_bonds):
-            self._potential_energy += self.calculateBondEnergy(bond_id)
+        self._potential_energy = self._calculateBondEnergyAndForces()[0] * kilojoule_permol
         return self._potential_energy
 
+    def calculateReducedEnergyAndForces(self):
+        """
+        calculateReducedEnergyAndForces calculates the potential energy of all bonds and the force acts on all atoms in one pass
+
+        All bond lengths and forces are calculated with one array expression and scattered to the atoms of each bond
+
+        Returns
+        -------
+        tuple(float, np.ndarray)
+            - The potential energy of all bonds, in unit of ``kilojoule_permol``
+            - (num_atoms, 3) float array of force acts on each atom, in unit of ``kilojoule_permol_over_angstrom``
+        """        
+        self._testBound()
+        energy, forces = self._calculateBondEnergyAndForces()
+        self._potential_energy = energy * kilojoule_permol
+        return energy, forces
+
+    def calculateReducedLocalEnergy(self, atom_ids):
+        """
+        calculateReducedLocalEnergy calculates the potential energy of bonds containing any of ``atom_ids``
+
+        Parameters
+        ----------
+        atom_ids : np.ndarray
+            the id of atoms
+
+        Returns
+        -------
+        float
+            The potential energy of bonds containing ``atom_ids``, in unit of ``kilojoule_permol``
+        """
+        self._testBound()
+        bond_ids = np.where(np.isin(self._bond_index, atom_ids).any(1))[0]
+        coord = self._ensemble.system.coordinate_array
+        bond_index = self._bond_index[bond_ids, :]
+        bond_length = np.sqrt(((coord[bond_index[:, 0], :] - coord[bond_index[:, 1], :])**2).sum(1))
+        bond_group = self._bond_group[bond_ids]
+        energy = 0
+        for group in np.unique(bond_group):
+            energy += self._group_force_fields[group]._energy_table(bond_length[bond_group == group]).sum()
+        return energy
+
     def calculateAtomForce(self, atom_id):
         """
         calculateAtomForce calculates the force acts on atom
 
+        Only bonds containing the atom are calculated
+
         Parameters
         ----------
         atom_id : int
@@ -236,40 +309,25 @@ class PDFFBondForce(Force):
 
         Returns
         -------
-        Quantity
+        QuantityArray
             the force acts on atom
         """        
         self._testBound()
-        # fixme: Need to multiple 0.5 to each force?
-        atom = self._atoms[atom_id]
-        num_bonds = 0
-        if atom.atom_type == 'CA':
-            if atom.atom_id == 0 or atom.atom_id == self._num_atoms - 1:
-                num_bonds = 2
-            else:
-                num_bonds = 3
-        else:
-            num_bonds = 1
-        bond_info = []
-        for bond_id, bond in enumerate(self._bonds):
-            if atom in bond:
-                bond_info.append(
-                    [bond_id, bond, [0, 1] if bond[0]==atom else [1, 0]]
-                ) # Locate the position of current in bond
-                if len(bond_info) == num_bonds:
-                    break
-        force = np.zeros(3) * kilocalorie_permol_over_angstrom
-        for info in bond_info:
-            vec = getUnitVec(
-                info[1][info[2][0]].coordinate -
-                info[1][info[2][1]].coordinate
-            )
-            bond_length = getBond(
-                info[1][info[2][0]].coordinate, 
-                info[1][info[2][1]].coordinate
-            )
-            force += 0.5 * self._force_field_vector[info[0]].getForce(bond_length) * vec
-        return force
+        bond_ids = np.where((self._bond_index == atom_id).any(1))[0]
+        forces = self._calculateBondEnergyAndForces(bond_ids)[1]
+        return QuantityArray(forces[atom_id, :], kilojoule_permol_over_angstrom)
+
+    @property
+    def num_interactions(self):
+        """
+        num_interactions overloads ``Force.num_interactions`` to get the number of bonds
+
+        Returns
+        -------
+        int
+            the number of bonds
+        """
+        return self._num_bonds
 
     @property
     def num_bonds(self):
@@ -294,7 +352,7 @@ class PDFFBondForce(Force):
             The potential energy of all bonds 
         """    
         try:
-            self.calculatePotentialEnergy()
+            self._ensemble.calculateReducedForceEnergyAndForces(self._force_id)
             return self._potential_energy
         except:
             return self._potential_energy
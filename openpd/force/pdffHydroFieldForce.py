@@ -4,92 +4,498 @@
 file: pdffHydroFieldForce.py
 created time : 2021/04/07
 last edit time : 2021/04/07
-author : Zhenyu Wei 
+author : Zhenyu Wei
 version : 1.0
 contact : zhenyuwei99@gmail.com
 copyright : (C)Copyright 2021-2021, Zhenyu Wei and Southeast University
 '''
 
-import os, json, codecs
+import copy
 import numpy as np
-from .. import Force
-from .. import getBond
+from . import Force
+from .neighborList import NeighborList
+from .. import isStandardPeptide
 from ..unit import *
-from ..unit import Quantity
+from ..unit import Quantity, QuantityArray
 from ..exceptions import *
 
-cur_dir = os.path.abspath(os.path.dirname(os.path.abspath(__file__)))
-force_field_dir = os.path.join(cur_dir, '../data/pdff/hydrofield')
+def _calculateHydroField(r, gaussian_parameters, switching_parameters):
+    """
+    _calculateHydroField calculates ``g(r) - 1`` and ``-dg(r)/dr`` of hydration fields
 
-class PDFFNonBondedForceField:
-    def __init__(self, atom_type: str) -> None:
-        self._atom_type = atom_type
+    ``g(r)`` is the sum of Gaussian terms ``h * exp(-((r - mu) / sigma)**2)``
+    and switching terms ``a / (1 + exp(-zeta * (r - r_s)))``
+
+    Parameters
+    ----------
+    r : np.ndarray
+        (...) distance, in unit of angstrom
+    gaussian_parameters : np.ndarray
+        (..., num_gaussian_terms, 3) ``h``, ``mu`` and ``sigma`` of Gaussian terms,
+        the leading dimensions should be broadcastable with ``r``
+    switching_parameters : np.ndarray
+        (..., num_switching_terms, 3) ``a``, ``zeta`` and ``r_s`` of switching terms,
+        the leading dimensions should be broadcastable with ``r``
+
+    Returns
+    -------
+    tuple(np.ndarray, np.ndarray)
+        - (...) ``g(r) - 1``, in unit of ``kilojoule_permol``
+        - (...) ``-dg(r)/dr``, in unit of ``kilojoule_permol_over_angstrom``
+    """
+    r = np.asarray(r, dtype=np.float64)[..., np.newaxis]
+    h, mu, sigma = [gaussian_parameters[..., i] for i in range(3)]
+    gaussian = h * np.exp(-((r - mu) / sigma)**2)
+    a, zeta, r_s = [switching_parameters[..., i] for i in range(3)]
+    exp_term = np.exp(-zeta * (r - r_s))
+    switching = a / (1 + exp_term)
+    energy = gaussian.sum(-1) + switching.sum(-1) - 1
+    force = (
+        (2 * (r - mu) / sigma**2 * gaussian).sum(-1) -
+        (a * zeta * exp_term / (1 + exp_term)**2).sum(-1)
+    )
+    return energy, force
+
+class PDFFHydroFieldForceField:
+    def __init__(self, peptide_type: str, parameters=None) -> None:
+        """
+        Parameters
+        ----------
+        peptide_type : str
+            The type of peptide
+        parameters : dict, optional
+            the parameters fitted for ``peptide_type``, with ``gaussian_*: {h, mu, sigma}`` and ``switching_*: {zeta, r_s}`` items, 
+            by default None, which means ``PDFFHydroFieldForce.DEFAULT_PARAMETERS``
+
+        Raises
+        ------
+        openpd.exceptions.PeptideTypeError
+            When the peptide type is not in the standard peptide list
+        """
+        isStandardPeptide(peptide_type)
+        self._name = peptide_type
+        if parameters == None:
+            parameters = PDFFHydroFieldForce.DEFAULT_PARAMETERS
+        self._parameters = copy.deepcopy(parameters)
+        self._gaussian_parameters, self._switching_parameters = self._parseParameters(self._parameters)
 
     def __repr__(self) -> str:
         return (
-            '<PDFFNonBondedForceField object: %s atom at 0x%x>'
-            %(self._atom_type, id(self))
+            '<PDFFHydroFieldForceField object: %s hydration field at 0x%x>'
+            %(self._name, id(self))
         )
 
     __str__ = __repr__
 
     @staticmethod
-    def _getEnergyExperssion(paramters: dict):
-        expression = 'lambda r: '
-        terms = []
-        gaussian_term = lambda h, mu, sigma: '%.5f * np.exp(-((r-%.5f)/%.5f)**2)' %(h, mu, sigma)
-        switching_term = lambda zeta, r_s: '1 / (1 + np.exp(-%.5f * (r - %.5f)))' %(zeta, r_s)
-        for key, value in paramters.items():
-            if key.lower().startswith('gaussian'):
-                terms.append(gaussian_term(value['h'], value['mu'], value['sigma']))
-            elif key.lower().startswith('switching'):
-                terms.append(switching_term(value['zeta'], value['r_s']))
-        for i, j in enumerate(terms):
-            if i != len(terms)-1:
-                expression += j + ' + '
-            else:
-                expression += j
-        return eval(expression + ' - 1') # g(r) - 1
+    def _parseParameters(parameters: dict):
+        """
+        _parseParameters converts the parameters dict to parameter arrays
 
-    @staticmethod
-    def _getForceExperssion(paramters: dict):
-        expression = 'lambda r: '
-        terms = []
-        gaussian_term = lambda h, mu, sigma: '2 * %.5f * (r - %.5f) / %.5f**2 * np.exp(- (r - %.5f)**2 / %.5f**2)' %(h, mu, sigma, mu, sigma)
-        switching_term = lambda zeta, r_s: '- %.5f * np.exp(-%.5f*(r-%.5f)) / (1 + np.exp(-%.5f*(r-%.5f)))**2' %(zeta, zeta, r_s, zeta, r_s)
-        for key, value in paramters.items():
+        Parameters
+        ----------
+        parameters : dict
+            dict with ``gaussian_*: {h, mu, sigma}`` and ``switching_*: {zeta, r_s}`` items
+
+        Returns
+        -------
+        tuple(np.ndarray, np.ndarray)
+            - (num_gaussian_terms, 3) ``h``, ``mu`` and ``sigma`` of Gaussian terms
+            - (num_switching_terms, 3) ``a``, ``zeta`` and ``r_s`` of switching terms, ``a`` is always 1
+        """
+        gaussian_parameters, switching_parameters = [], []
+        for key, value in parameters.items():
             if key.lower().startswith('gaussian'):
-                terms.append(gaussian_term(value['h'], value['mu'], value['sigma']))
+                gaussian_parameters.append([value['h'], value['mu'], value['sigma']])
             elif key.lower().startswith('switching'):
-                terms.append(switching_term(value['zeta'], value['r_s']))
-        for i, j in enumerate(terms):
-            if i != len(terms)-1:
-                expression += j + ' + '
-            else:
-                expression += j
+                switching_parameters.append([1, value['zeta'], value['r_s']])
+        return (
+            np.array(gaussian_parameters, dtype=np.float64).reshape(-1, 3),
+            np.array(switching_parameters, dtype=np.float64).reshape(-1, 3)
+        )
+
+    def getEnergy(self, coord):
+        """
+        getEnergy calculates the energy in specific coordinate
+
+        Parameters
+        ----------
+        coord : float or list or np.ndarray or Quantity
+            The coordinate of the wanted energy
+
+        Returns
+        -------
+        Quantity or np.ndarray
+            The energy in giving coordinate
+        """
+        if isinstance(coord, Quantity):
+            coord = coord.convertTo(angstrom) / angstrom
+        energy = _calculateHydroField(coord, self._gaussian_parameters, self._switching_parameters)[0]
+        return energy * kilojoule_permol if energy.ndim == 0 else QuantityArray(energy, kilojoule_permol)
+
+    def getForce(self, coord):
+        """
+        getForce calculates the force in specific coordinate
+
+        Parameters
+        ----------
+        coord : float or list or np.ndarray or Quantity
+            The coordinate of the wanted force
 
-        return eval(expression)
+        Returns
+        -------
+        Quantity or np.ndarray
+            The force in giving coordinate
+        """
+        if isinstance(coord, Quantity):
+            coord = coord.convertTo(angstrom) / angstrom
+        force = _calculateHydroField(coord, self._gaussian_parameters, self._switching_parameters)[1]
+        return (
+            force * kilojoule_permol_over_angstrom if force.ndim == 0
+            else QuantityArray(force, kilojoule_permol_over_angstrom)
+        )
+
+    @property
+    def name(self):
+        """
+        name gets the name of force field
+
+        Returns
+        -------
+        str
+            the name of force field
+        """
+        return self._name
 
-    def getEnergy(self):
-        pass
+    @property
+    def parameters(self):
+        """
+        parameters gets the parameters of hydration field
 
-    def getForce(self):
-        pass
+        Returns
+        -------
+        dict
+            the parameters of hydration field
+        """
+        return self._parameters
 
 class PDFFHydroFieldForce(Force):
-    def __init__(self, force_id, force_group) -> None:
+    # note: Generic hydration field shared by all peptide types, it is not fitted to any residue
+    DEFAULT_PARAMETERS = {
+        'gaussian_1': {'h': 0.8, 'mu': 3.8, 'sigma': 0.6},
+        'gaussian_2': {'h': 0.2, 'mu': 6.5, 'sigma': 0.9},
+        'switching_1': {'zeta': 4.0, 'r_s': 3.0}
+    }
+
+    def __init__(
+        self, force_id=0, force_group=0,
+        cutoff_radius=12, is_scale_14=True, skin_width=2, parameters=None
+    ) -> None:
+        """
+        Parameters
+        ----------
+        force_id : int, optional
+            the id of force, by default 0
+        force_group : int, optional
+            the group of force, by default 0
+        cutoff_radius : int, optional
+            the cutoff radius, by default ``12 * angstrom``
+        is_scale_14 : bool, optional
+            skip the interaction between neighbor SCs, by default True
+        skin_width : int or float or Quantity, optional
+            the skin width of the ``NeighborList``, by default ``2 * angstrom``
+        parameters : dict, optional
+            peptide type to the fitted parameters of its hydration field, by default None, 
+            which means all peptide types use the generic ``DEFAULT_PARAMETERS``, which is not fitted
+        """
         super().__init__(force_id, force_group)
+        self._parameters = parameters
+
+        if isinstance(cutoff_radius, Quantity):
+            cutoff_radius = cutoff_radius.convertTo(angstrom)
+        else:
+            cutoff_radius = cutoff_radius * angstrom
+        self._cutoff_radius = cutoff_radius
+        self._reduced_cutoff_radius = cutoff_radius / angstrom # Used in the inner loop
+        self._is_scale_14 = is_scale_14
+        self._neighbor_list = NeighborList(self._cutoff_radius, skin_width)
+
+        self._num_atoms = 0
+        self._num_peptides = 0
+        self._potential_energy = 0
+        self._force_field_vector = None
+
+    def __repr__(self) -> str:
+        return ('<PDFFHydroFieldForce object: %d peptides, at 0x%x>'
+            %(self._num_peptides, id(self)))
+
+    __str__ = __repr__
 
     def bindEnsemble(self, ensemble):
+        """
+        bindEnsemble overloads ``Force.bindEnsemble()`` to bind ``PDFFHydroFieldForce`` to an ``Ensemble`` instance
+
+        Parameters
+        ----------
+        ensemble : Ensemble
+            An``Ensemble`` instance.
+
+        Raises
+        ------
+        openpd.exceptions.RebindError
+            When ``self`` is bound multi-times
+
+        openpd.exceptions.NotincludedInteractionError
+            When ``parameters`` is provided without the parameters of a peptide type in the system
+        """
         if self._is_bound == True:
             raise RebindError('Force has been bound to %s' %(self._ensemble))
-        
+
         self._is_bound = True
         self._ensemble = ensemble
-        self._num_peptides = self._ensemble.system.num_peptides
-        self._peptides = self._ensemble.system.peptides
+        self._num_peptides = self._ensemble.system.num_molecules
+        self._peptides = self._ensemble.system.molecules
         self._num_atoms = self._ensemble.system.num_atoms
         self._atoms = self._ensemble.system.atoms
+        self._setForceFieldVector()
 
     def _setForceFieldVector(self):
-        pass
\ No newline at end of file
+        """
+        _setForceFieldVector sets ``self.force_field_vector`` and the parameter arrays used by the batched calculation
+
+        Parameters of all peptide types are padded to the same number of terms,
+        padded terms have zero amplitude, so that all pairs are calculated in one pass
+
+        Raises
+        ------
+        AttributeError
+            When the number of peptides is less than 2
+
+        openpd.exceptions.NotincludedInteractionError
+            When ``parameters`` is provided without the parameters of a peptide type in the system
+        """
+        if self._num_peptides < 2:
+            raise AttributeError(
+                'Only %d peptides in force object, cannot form force field vector'
+                %(self._num_peptides)
+            )
+        force_field_dict = {} # Peptides of the same type share one force field
+        self._force_field_vector = np.zeros(self._num_peptides, dtype=PDFFHydroFieldForceField)
+        for i, peptide in enumerate(self._peptides):
+            if not peptide.peptide_type in force_field_dict.keys():
+                if self._parameters == None:
+                    parameters = None
+                elif peptide.peptide_type in self._parameters.keys():
+                    parameters = self._parameters[peptide.peptide_type]
+                else:
+                    raise NotincludedInteractionError(
+                        'No fitted hydration field parameters of %s, provided peptide types: %s'
+                        %(peptide.peptide_type, list(self._parameters.keys()))
+                    )
+                force_field_dict[peptide.peptide_type] = PDFFHydroFieldForceField(peptide.peptide_type, parameters)
+            self._force_field_vector[i] = force_field_dict[peptide.peptide_type]
+        force_fields = list(force_field_dict.values())
+        num_gaussian_terms = max([i._gaussian_parameters.shape[0] for i in force_fields])
+        num_switching_terms = max([i._switching_parameters.shape[0] for i in force_fields])
+        self._gaussian_parameters = np.zeros([len(force_fields), num_gaussian_terms, 3])
+        self._gaussian_parameters[:, :, 2] = 1 # Sigma of padded terms, avoiding dividing by 0
+        self._switching_parameters = np.zeros([len(force_fields), num_switching_terms, 3])
+        for i, force_field in enumerate(force_fields):
+            self._gaussian_parameters[i, :force_field._gaussian_parameters.shape[0], :] = force_field._gaussian_parameters
+            self._switching_parameters[i, :force_field._switching_parameters.shape[0], :] = force_field._switching_parameters
+        self._peptide_field_index = np.array([
+            list(force_field_dict.keys()).index(peptide.peptide_type) for peptide in self._peptides
+        ])
+        self._sc_index = np.array([peptide.atoms[1].atom_id for peptide in self._peptides])
+
+    def _calculatePairEnergyAndForces(self, index0, index1):
+        """
+        _calculatePairEnergyAndForces calculates the energy and force of SC pairs in one pass
+
+        The energy of each pair is the average of the hydration fields of two SCs
+
+        Parameters
+        ----------
+        index0 : np.ndarray
+            (num_pairs, ) peptide id of the first SC of each pair
+        index1 : np.ndarray
+            (num_pairs, ) peptide id of the second SC of each pair
+
+        Returns
+        -------
+        tuple(float, np.ndarray)
+            - The potential energy of all pairs, in unit of ``kilojoule_permol``
+            - (num_pairs, 3) float array of force acts on the second SC of each pair, in unit of ``kilojoule_permol_over_angstrom``
+        """
+        coord = self._ensemble.system.coordinate_array[self._sc_index, :]
+        vec = coord[index1, :] - coord[index0, :]
+        dist = np.sqrt((vec**2).sum(1))
+        mask = (dist <= self._reduced_cutoff_radius) & (dist != 0)
+        if self._is_scale_14:
+            mask &= np.abs(index1 - index0) != 1
+        vec, dist = vec[mask, :], dist[mask]
+        field_index = np.stack([
+            self._peptide_field_index[index0[mask]], self._peptide_field_index[index1[mask]]
+        ], 1) # (num_pairs, 2), the field of both SCs
+        energy, force = _calculateHydroField(
+            dist[:, np.newaxis],
+            self._gaussian_parameters[field_index], self._switching_parameters[field_index]
+        )
+        pair_force = np.zeros([index0.shape[0], 3])
+        pair_force[mask, :] = (0.5 * force.sum(1) / dist)[:, np.newaxis] * vec
+        return 0.5 * energy.sum(), pair_force
+
+    def calculateReducedEnergyAndForces(self):
+        """
+        calculateReducedEnergyAndForces calculates the potential energy of all peptides and the force acts on all atoms in one pass
+
+        Returns
+        -------
+        tuple(float, np.ndarray)
+            - The potential energy of all peptides, in unit of ``kilojoule_permol``
+            - (num_atoms, 3) float array of force acts on each atom, in unit of ``kilojoule_permol_over_angstrom``
+        """
+        self._testBound()
+        coord = self._ensemble.system.coordinate_array[self._sc_index, :]
+        self._neighbor_list.update(coord)
+        pair_index = self._neighbor_list.pair_index
+        energy, pair_force = self._calculatePairEnergyAndForces(pair_index[0, :], pair_index[1, :])
+        forces = np.zeros([self._num_atoms, 3])
+        np.add.at(forces, self._sc_index[pair_index[0, :]], -pair_force)
+        np.add.at(forces, self._sc_index[pair_index[1, :]], pair_force)
+        self._potential_energy = energy * kilojoule_permol
+        return energy, forces
+
+    def calculateReducedLocalEnergy(self, atom_ids):
+        """
+        calculateReducedLocalEnergy calculates the potential energy of neighbor pairs containing the SC in ``atom_ids``
+
+        Parameters
+        ----------
+        atom_ids : np.ndarray
+            the id of atoms
+
+        Returns
+        -------
+        float
+            The potential energy of pairs containing ``atom_ids``, in unit of ``kilojoule_permol``
+        """
+        self._testBound()
+        self._neighbor_list.update(self._ensemble.system.coordinate_array[self._sc_index, :])
+        pair_index = self._neighbor_list.pair_index
+        is_moved = np.isin(self._sc_index, atom_ids)
+        pair_index = pair_index[:, is_moved[pair_index[0, :]] | is_moved[pair_index[1, :]]]
+        return self._calculatePairEnergyAndForces(pair_index[0, :], pair_index[1, :])[0]
+
+    def calculatePotentialEnergy(self):
+        """
+        calculatePotentialEnergy calculates the potential energy of all peptides
+
+        Returns
+        -------
+        Quantity
+            The potential energy of all peptides
+        """
+        self._testBound()
+        self.calculateReducedEnergyAndForces()
+        return self._potential_energy
+
+    def calculateAtomForce(self, atom_id):
+        """
+        calculateAtomForce calculates the force acts on atom
+
+        Parameters
+        ----------
+        atom_id : int
+            The id of atom
+
+        Returns
+        -------
+        QuantityArray
+            the force acts on atom
+        """
+        self._testBound()
+        target_atom = self._atoms[atom_id]
+        if target_atom.atom_type == 'CA':
+            # CA has no hydration field in PDFF
+            return QuantityArray(np.zeros(3), kilojoule_permol_over_angstrom)
+        index1 = np.arange(self._num_peptides)
+        index0 = np.ones_like(index1) * target_atom.peptide_id
+        pair_force = self._calculatePairEnergyAndForces(index0, index1)[1]
+        return QuantityArray(-pair_force.sum(0), kilojoule_permol_over_angstrom)
+
+    @property
+    def cutoff_radius(self):
+        """
+        cutoff_radius gets the cutoff radius of force field
+
+        Returns
+        -------
+        Quantity
+            the cutoff radius of force field
+        """
+        return self._cutoff_radius
+
+    @property
+    def num_interactions(self):
+        """
+        num_interactions overloads ``Force.num_interactions`` to get the number of neighbor pairs of SCs in the neighbor list
+
+        Returns
+        -------
+        int
+            the number of neighbor pairs of SCs in the neighbor list
+        """
+        return self._neighbor_list.num_pairs
+
+    @property
+    def neighbor_list(self):
+        """
+        neighbor_list gets the ``NeighborList`` of SCs owned by ``self``
+
+        Returns
+        -------
+        NeighborList
+            the ``NeighborList`` of SCs
+        """
+        return self._neighbor_list
+
+    @property
+    def num_peptides(self):
+        """
+        num_peptides gets the number of peptides of ``PDFFHydroFieldForce``
+
+        Returns
+        -------
+        int
+            the number of peptides
+        """
+        return self._num_peptides
+
+    @property
+    def potential_energy(self):
+        """
+        potential_energy gets the potential energy of all peptides
+
+        Returns
+        -------
+        Quantity
+            The potential energy of all peptides
+        """
+        try:
+            self._ensemble.calculateReducedForceEnergyAndForces(self._force_id)
+            return self._potential_energy
+        except:
+            return self._potential_energy
+
+    @property
+    def force_field_vector(self):
+        """
+        force_field_vector gets the force field vector, the hydration field of each peptide
+
+        Returns
+        -------
+        np.ndarray(dtype=PDFFHydroFieldForceField)
+            force field vector
+        """
+        return self._force_field_vector
@@ -1,14 +1,27 @@
 import os
 import numpy as np
-from scipy.interpolate import interp1d
 from . import Force
+from .forceFieldCache import loadForceFieldTables
+from .neighborList import NeighborList
 from .. import getBond, getUnitVec, isStandardPeptide
 from ..unit import *
-from ..unit import Quantity
+from ..unit import Quantity, QuantityArray
 from ..exceptions import *
 
 cur_dir = os.path.abspath(os.path.dirname(os.path.abspath(__file__)))
 force_field_dir = os.path.join(cur_dir, '../data/pdff/nonbonded')
+# note: sorted peptide type pair -> name of the force field file, or None if neither order is contained
+_force_field_names = {}
+
+def _getForceFieldName(peptide_type1, peptide_type2):
+    key = tuple(sorted([peptide_type1, peptide_type2]))
+    if not key in _force_field_names:
+        _force_field_names[key] = None
+        for name in [peptide_type1 + '-' + peptide_type2, peptide_type2 + '-' + peptide_type1]:
+            if os.path.isfile(os.path.join(force_field_dir, name + '.npz')):
+                _force_field_names[key] = name
+                break
+    return _force_field_names[key]
 
 class PDFFNonBondedForceField:
     def __init__(self, peptide_type1, peptide_type2, cutoff_radius=12):
@@ -34,18 +47,15 @@ class PDFFNonBondedForceField:
             When ``cutoff_radius`` greater then 30 or 30 Angstrom
         """        
         isStandardPeptide(peptide_type1, peptide_type2)
-        try:
-            self._name = peptide_type1 + '-' + peptide_type2
-            self._origin_data = np.load(os.path.join(force_field_dir, self._name + '.npz'))
-        except:
-            try:
-                self._name = peptide_type2 + '-' + peptide_type1
-                self._origin_data = np.load(os.path.join(force_field_dir, self._name + '.npz'))
-            except:
-                raise NotincludedInteractionError(
-                    '%s-%s interaction is not contained in %s' 
-                    %(peptide_type1, peptide_type2, force_field_dir)    
-                )
+        self._name = _getForceFieldName(peptide_type1, peptide_type2)
+        if self._name == None:
+            raise NotincludedInteractionError(
+                '%s-%s interaction is not contained in %s' 
+                %(peptide_type1, peptide_type2, force_field_dir)    
+            )
+        self._origin_data, self._energy_table, self._force_table = loadForceFieldTables(
+            os.path.join(force_field_dir, self._name + '.npz')
+        )
         if isinstance(cutoff_radius, Quantity):
             cutoff_radius = cutoff_radius.convertTo(angstrom) / angstrom
         if cutoff_radius > 30:
@@ -53,8 +63,6 @@ class PDFFNonBondedForceField:
                 'Cutoff radius should be less than 30 Angstrom'
             )
         self._cutoff_radius = cutoff_radius
-        self._setEnergyInterpolate()
-        self._setForceInterpolate()
 
     def __repr__(self) -> str:
         return (
@@ -64,18 +72,6 @@ class PDFFNonBondedForceField:
 
     __str__ = __repr__
         
-    def _setEnergyInterpolate(self):
-        self._energy_interp = interp1d(
-            self._origin_data['energy_coord'], 
-            self._origin_data['energy_data'], kind='cubic'
-        )
-
-    def _setForceInterpolate(self):
-        self._force_interp = interp1d(
-            self._origin_data['force_coord'], 
-            self._origin_data['force_data'], kind='cubic'
-        )
-
     def getEnergy(self, coord):
         """
         getEnergy calculates the energy in specific coordinate
@@ -93,7 +89,7 @@ class PDFFNonBondedForceField:
         if isinstance(coord, Quantity):
             coord = coord.convertTo(angstrom) / angstrom
         if coord <= self._cutoff_radius:
-            return self._energy_interp(coord) * kilojoule_permol
+            return self._energy_table(coord) * kilojoule_permol
         else:
             return 0 * kilojoule_permol
 
@@ -114,7 +110,7 @@ class PDFFNonBondedForceField:
         if isinstance(coord, Quantity):
             coord = coord.convertTo(angstrom) / angstrom
         if coord <= self._cutoff_radius:
-            return self._force_interp(coord) * kilojoule_permol_over_angstrom
+            return self._force_table(coord) * kilojoule_permol_over_angstrom
         else:
             return 0 * kilojoule_permol_over_angstrom
         
@@ -145,7 +141,7 @@ class PDFFNonBondedForceField:
 class PDFFNonBondedForce(Force):
     def __init__(
         self, force_id=0, force_group=0,
-        cutoff_radius=12, is_scale_14=True
+        cutoff_radius=12, is_scale_14=True, skin_width=2
     ) -> None:
         """
         Parameters
@@ -156,6 +152,10 @@ class PDFFNonBondedForce(Force):
             the group of force, by default 0
         cutoff_radius : int, optional
             the cutoff radius, by default ``12 * angstrom``
+        is_scale_14 : bool, optional
+            skip the interaction between neighbor SCs, by default True
+        skin_width : int or float or Quantity, optional
+            the skin width of the ``NeighborList``, by default ``2 * angstrom``
         """        
         super().__init__(force_id, force_group)
         
@@ -164,7 +164,9 @@ class PDFFNonBondedForce(Force):
         else:
             cutoff_radius = cutoff_radius * angstrom
         self._cutoff_radius = cutoff_radius
+        self._reduced_cutoff_radius = cutoff_radius / angstrom # Used in the inner loop
         self._is_scale_14 = is_scale_14
+        self._neighbor_list = NeighborList(self._cutoff_radius, skin_width)
         
         self._num_atoms = 0
         self._num_peptides = 0
@@ -198,15 +200,16 @@ class PDFFNonBondedForce(Force):
         
         self._is_bound = True
         self._ensemble = ensemble
-        self._num_peptides = self._ensemble.system.num_peptides
-        self._peptides = self._ensemble.system.peptides
+        self._num_peptides = self._ensemble.system.num_molecules
+        self._peptides = self._ensemble.system.molecules
         self._num_atoms = self._ensemble.system.num_atoms
         self._atoms = self._ensemble.system.atoms
         self._setForceFieldMatrix()
+        self._setPairIndex()
     
     def _setForceFieldMatrix(self):
         """
-        _setForceFieldMatrix set the ``self.force_field_matrix``
+        _setForceFieldMatrix set the ``self.force_field_matrix``, peptide pairs of the same type pair share one force field
 
         Raises
         ------
@@ -218,16 +221,147 @@ class PDFFNonBondedForce(Force):
                 'Only %d peptides in force object, cannot form force field matrix'
                 %(self._num_peptides)
             )
-        self._force_field_matrix = np.zeros([self._num_peptides, self._num_peptides], dtype=PDFFNonBondedForceField)
-        for i, peptide1 in enumerate(self._peptides):
-            for j, peptide2 in enumerate(self._peptides[i+1:]):
-                force_field =  PDFFNonBondedForceField(
-                    peptide1.peptide_type, peptide2.peptide_type, 
-                    cutoff_radius=self._cutoff_radius
+        # One force field for each pair of peptide types, shared by all peptide pairs of these types
+        peptide_types = [peptide.peptide_type for peptide in self._peptides]
+        type_names = sorted(set(peptide_types))
+        type_dict = {name: index for index, name in enumerate(type_names)}
+        self._type_index = np.array([type_dict[peptide_type] for peptide_type in peptide_types])
+        type_count = np.bincount(self._type_index, minlength=len(type_names))
+        self._type_force_field_matrix = np.zeros([len(type_names), len(type_names)], dtype=PDFFNonBondedForceField)
+        for i, type1 in enumerate(type_names):
+            for j in range(i, len(type_names)):
+                if i == j and type_count[i] < 2:
+                    continue # No pair of peptides has this type pair
+                force_field = PDFFNonBondedForceField(
+                    type1, type_names[j], cutoff_radius=self._cutoff_radius
                 )
+                self._type_force_field_matrix[i, j] = force_field
+                self._type_force_field_matrix[j, i] = force_field
+        self._force_field_matrix = self._type_force_field_matrix[
+            self._type_index[:, np.newaxis], self._type_index[np.newaxis, :]
+        ]
+        np.fill_diagonal(self._force_field_matrix, 0)
+
+    def _setPairIndex(self):
+        """
+        _setPairIndex sets the index arrays used by the batched calculation
+
+        Force fields are grouped by name so that each residue-type pair table is evaluated once on an array of distances
+        """        
+        self._sc_index = np.array([peptide.atoms[1].atom_id for peptide in self._peptides])
+        self._group_force_fields = []
+        num_types = self._type_force_field_matrix.shape[0]
+        type_group_matrix = np.zeros([num_types, num_types], dtype=int)
+        group_dict = {}
+        for i in range(num_types):
+            for j in range(i, num_types):
+                force_field = self._type_force_field_matrix[i, j]
+                if not isinstance(force_field, PDFFNonBondedForceField):
+                    continue
+                if not force_field.name in group_dict:
+                    group_dict[force_field.name] = len(self._group_force_fields)
+                    self._group_force_fields.append(force_field)
+                type_group_matrix[i, j] = type_group_matrix[j, i] = group_dict[force_field.name]
+        self._group_matrix = type_group_matrix[self._type_index[:, np.newaxis], self._type_index[np.newaxis, :]]
+        self._neighbor_list.rebuild(self._ensemble.system.coordinate_array[self._sc_index, :])
+        self._setPairGroup()
+
+    def _setPairGroup(self):
+        """
+        _setPairGroup groups the pairs of ``NeighborList`` by their force field
+
+        This is called after each rebuild of ``NeighborList``
+        """        
+        self._pair_index = self._neighbor_list.pair_index
+        self._is_neighbor_pair = (self._pair_index[1, :] - self._pair_index[0, :]) == 1
+        pair_group = self._group_matrix[self._pair_index[0, :], self._pair_index[1, :]]
+        self._pair_group = pair_group
+        self._group_pair_index = [
+            np.where(pair_group == group)[0] for group in range(len(self._group_force_fields))
+        ]
+
+    def _calculatePairVector(self):
+        """
+        _calculatePairVector calculates the SC - SC vector and distance of pairs in ``NeighborList``, in unit of angstrom
+
+        ``NeighborList`` is updated first and rebuilt when SCs have moved more than half of the skin width
+
+        Returns
+        -------
+        tuple(np.ndarray, np.ndarray, np.ndarray)
+            - (num_pairs, 3) vector pointing from the first SC to the second SC of each pair
+            - (num_pairs, ) distance of each pair
+            - (num_pairs, ) mask of pairs within cutoff radius and not excluded
+        """        
+        coord = self._ensemble.system.coordinate_array[self._sc_index, :]
+        if self._neighbor_list.update(coord):
+            self._setPairGroup()
+        vec = coord[self._pair_index[1, :], :] - coord[self._pair_index[0, :], :]
+        dist = np.sqrt((vec**2).sum(1))
+        mask = (dist <= self._reduced_cutoff_radius) & (dist != 0)
+        if self._is_scale_14:
+            mask &= ~self._is_neighbor_pair
+        return vec, dist, mask
+
+    def calculateReducedEnergyAndForces(self):
+        """
+        calculateReducedEnergyAndForces calculates the potential energy of all peptides and the force acts on all atoms in one pass
+
+        Returns
+        -------
+        tuple(float, np.ndarray)
+            - The potential energy of all peptides, in unit of ``kilojoule_permol``
+            - (num_atoms, 3) float array of force acts on each atom, in unit of ``kilojoule_permol_over_angstrom``
+        """        
+        self._testBound()
+        vec, dist, mask = self._calculatePairVector()
+        energy = 0
+        pair_force = np.zeros_like(dist)
+        for group, force_field in enumerate(self._group_force_fields):
+            pair_index = self._group_pair_index[group]
+            pair_index = pair_index[mask[pair_index]]
+            if pair_index.shape[0] != 0:
+                energy += force_field._energy_table(dist[pair_index]).sum()
+                pair_force[pair_index] = force_field._force_table(dist[pair_index])
+        # fixme: Need to multiple 0.5 to each force?
+        pair_force[mask] = 0.5 * pair_force[mask] / dist[mask]
+        pair_force = pair_force[:, np.newaxis] * vec
+        forces = np.zeros([self._num_atoms, 3])
+        np.add.at(forces, self._sc_index[self._pair_index[0, :]], pair_force)
+        np.add.at(forces, self._sc_index[self._pair_index[1, :]], -pair_force)
+        self._potential_energy = energy * kilojoule_permol
+        return energy, forces
+
+    def calculateReducedLocalEnergy(self, atom_ids):
+        """
+        calculateReducedLocalEnergy calculates the potential energy of neighbor pairs containing the SC in ``atom_ids``
 
-                self._force_field_matrix[i, i+j+1] = force_field
-                self._force_field_matrix[i+j+1, i] = force_field
+        Parameters
+        ----------
+        atom_ids : np.ndarray
+            the id of atoms
+
+        Returns
+        -------
+        float
+            The potential energy of pairs containing ``atom_ids``, in unit of ``kilojoule_permol``
+        """
+        self._testBound()
+        coord = self._ensemble.system.coordinate_array[self._sc_index, :]
+        if self._neighbor_list.update(coord):
+            self._setPairGroup()
+        is_moved = np.isin(self._sc_index, atom_ids)
+        pair_ids = np.where(is_moved[self._pair_index[0, :]] | is_moved[self._pair_index[1, :]])[0]
+        if self._is_scale_14:
+            pair_ids = pair_ids[~self._is_neighbor_pair[pair_ids]]
+        pair_index = self._pair_index[:, pair_ids]
+        dist = np.sqrt(((coord[pair_index[1, :], :] - coord[pair_index[0, :], :])**2).sum(1))
+        mask = (dist <= self._reduced_cutoff_radius) & (dist != 0)
+        dist, pair_group = dist[mask], self._pair_group[pair_ids[mask]]
+        energy = 0
+        for group in np.unique(pair_group):
+            energy += self._group_force_fields[group]._energy_table(dist[pair_group == group]).sum()
+        return energy
 
     def calculatePairEnergy(self, peptide_id1, peptide_id2):
         """
@@ -265,10 +399,14 @@ class PDFFNonBondedForce(Force):
             The potential energy of all peptides
         """        
         self._testBound()
-        self._potential_energy = 0
-        for i in range(self._num_peptides):
-            for j in range(i+1, self._num_peptides):
-                self._potential_energy += self.calculatePairEnergy(i, j)
+        _, dist, mask = self._calculatePairVector()
+        energy = 0
+        for group, force_field in enumerate(self._group_force_fields):
+            pair_index = self._group_pair_index[group]
+            pair_index = pair_index[mask[pair_index]]
+            if pair_index.shape[0] != 0:
+                energy += force_field._energy_table(dist[pair_index]).sum()
+        self._potential_energy = energy * kilojoule_permol
         return self._potential_energy
 
     def calculateAtomForce(self, atom_id):
@@ -290,33 +428,23 @@ class PDFFNonBondedForce(Force):
         target_atom = self._atoms[atom_id]
         if target_atom.atom_type == 'CA':
             # CA has no interaction in PDFF
-            return np.zeros(3) * kilojoule_permol_over_angstrom
+            return QuantityArray(np.zeros(3), kilojoule_permol_over_angstrom)
         elif target_atom.atom_type == 'SC':
-            force = np.zeros(3) * kilojoule_permol_over_angstrom
-            target_peptide_id = int((target_atom.atom_id - 1) / 2)
-            # All SC atoms
+            target_peptide_id = target_atom.peptide_id
+            coord = self._ensemble.system.coordinate_array[self._sc_index, :]
+            vec = coord - coord[target_peptide_id, :]
+            dist = np.sqrt((vec**2).sum(1))
+            mask = (dist <= self._cutoff_radius / angstrom) & (dist != 0)
+            mask[target_peptide_id] = False
             if self._is_scale_14:
-                for peptide_id, atom in enumerate(self._atoms[1::2]):
-                    if(
-                        np.abs(peptide_id-target_atom.peptide_id) == 1 or
-                        peptide_id == target_atom.peptide_id
-                    ):
-                        continue # Skip neighbor SC
-                    bond_length = getBond(target_atom.coordinate, atom.coordinate)
-                    if bond_length <= self._cutoff_radius:
-                        vec = getUnitVec(atom.coordinate - target_atom.coordinate)
-                        single_force = self._force_field_matrix[target_peptide_id, peptide_id].getForce(bond_length) 
-                        force += 0.5 * single_force * vec
-            else:
-                for peptide_id, atom in enumerate(self._atoms[1::2]):
-                    if peptide_id == target_atom.peptide_id:
-                        continue # Skip neighbor SC
-                    bond_length = getBond(target_atom.coordinate, atom.coordinate)
-                    if bond_length <= self._cutoff_radius:
-                        vec = getUnitVec(atom.coordinate - target_atom.coordinate)
-                        single_force = self._force_field_matrix[target_peptide_id, peptide_id].getForce(bond_length) 
-                        force += 0.5 * single_force * vec
-            return force
+                mask[np.abs(np.arange(self._num_peptides) - target_peptide_id) == 1] = False # Skip neighbor SC
+            groups = self._group_matrix[target_peptide_id, :]
+            single_force = np.zeros_like(dist)
+            for group in np.unique(groups[mask]):
+                index = mask & (groups == group)
+                single_force[index] = self._group_force_fields[group]._force_table(dist[index])
+            single_force[mask] = 0.5 * single_force[mask] / dist[mask]
+            return QuantityArray((single_force[:, np.newaxis] * vec).sum(0), kilojoule_permol_over_angstrom)
 
     @property
     def cutoff_radius(self):
@@ -330,6 +458,30 @@ class PDFFNonBondedForce(Force):
         """             
         return self._cutoff_radius
 
+    @property
+    def num_interactions(self):
+        """
+        num_interactions overloads ``Force.num_interactions`` to get the number of neighbor pairs of SCs in the neighbor list
+
+        Returns
+        -------
+        int
+            the number of neighbor pairs of SCs in the neighbor list
+        """
+        return self._neighbor_list.num_pairs
+
+    @property
+    def neighbor_list(self):
+        """
+        neighbor_list gets the ``NeighborList`` of SCs owned by ``self``
+
+        Returns
+        -------
+        NeighborList
+            the ``NeighborList`` of SCs
+        """        
+        return self._neighbor_list
+
     @property
     def num_peptides(self):
         """
@@ -353,7 +505,7 @@ class PDFFNonBondedForce(Force):
             The potential energy of all peptides 
         """        
         try:
-            self.calculatePotentialEnergy()
+            self._ensemble.calculateReducedForceEnergyAndForces(self._force_id)
             return self._potential_energy
         except:
             return self._potential_energy
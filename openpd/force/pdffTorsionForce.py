@@ -1,10 +1,11 @@
 import os, pickle
 import numpy as np
-from numpy import pi, floor
-from scipy.interpolate import interp1d
+from numpy import pi
 from . import Force
-from .. import getTorsion, getNormVec, isStandardPeptide
+from .forceFieldCache import loadForceFieldTables
+from .. import getTorsionAndGradient, isStandardPeptide
 from ..unit import *
+from ..unit import QuantityArray
 from ..exceptions import RebindError, NotincludedInteractionError
 
 cur_dir = os.path.abspath(os.path.dirname(os.path.abspath(__file__)))
@@ -31,19 +32,20 @@ class PDFFTorsionForceField:
         isStandardPeptide(peptide_type1, peptide_type2)  
         try:
             self._name = peptide_type1 + '-' + peptide_type2
-            self._origin_data = np.load(os.path.join(force_field_dir, self._name + '.npz'))
+            self._origin_data, self._energy_table, self._force_table = loadForceFieldTables(
+                os.path.join(force_field_dir, self._name + '.npz'), period=2*np.pi
+            )
         except:
             try:
                 self._name = peptide_type2 + '-' + peptide_type1
-                self._origin_data = np.load(os.path.join(force_field_dir, self._name + '.npz'))
+                self._origin_data, self._energy_table, self._force_table = loadForceFieldTables(
+                    os.path.join(force_field_dir, self._name + '.npz'), period=2*np.pi
+                )
             except:
                 raise NotincludedInteractionError(
                     '%s-%s interaction is not contained in %s' 
                     %(peptide_type1, peptide_type2, force_field_dir)    
                 )
-                
-        self._setEnergyInterpolate()
-        self._setForceInterpolate()
     
     def __repr__(self) -> str:
         return (
@@ -52,24 +54,6 @@ class PDFFTorsionForceField:
         )
 
     __str__ = __repr__
-
-    def _setEnergyInterpolate(self):
-        coord = np.array(self._origin_data['energy_coord'])
-        coord[0] = -np.pi - 0.000001
-        coord[-1] = np.pi + 0.000001
-        self._energy_interp = interp1d(
-            coord, 
-            self._origin_data['energy_data'], kind='cubic'
-        )
-
-    def _setForceInterpolate(self):
-        coord = np.array(self._origin_data['force_coord'])
-        coord[0] = -np.pi - 0.000001
-        coord[-1] = np.pi + 0.000001
-        self._force_interp = interp1d(
-            coord, 
-            self._origin_data['force_data'], kind='cubic'
-        )
         
     def getEnergy(self, coord):
         """
@@ -85,7 +69,7 @@ class PDFFTorsionForceField:
         float or np.ndarry
             The energy in giving coordinate
         """        
-        return self._energy_interp(coord) * kilojoule_permol
+        return self._energy_table(coord) * kilojoule_permol
     
     def getForce(self, coord):
         """
@@ -101,7 +85,7 @@ class PDFFTorsionForceField:
         float or np.ndarry
             The force in giving coordinate
         """        
-        return self._force_interp(coord) * kilojoule_permol_over_angstrom
+        return self._force_table(coord) * kilojoule_permol_over_angstrom
 
     @property
     def name(self):
@@ -173,6 +157,9 @@ class PDFFTorsionForce(Force):
                 torsion[1].peptide_type, 
                 torsion[2].peptide_type
             ]) # Parent Molecule of 2 Ca Atom
+        self._torsion_index = np.array(
+            [[atom.atom_id for atom in torsion] for torsion in self._torsions], dtype=np.int64
+        ).reshape(-1, 4)
         self._setForceFieldVector()
 
     def _setForceFieldVector(self):
@@ -186,6 +173,61 @@ class PDFFTorsionForce(Force):
             self._force_field_vector[i] = PDFFTorsionForceField(
                 torison_type[0], torison_type[1]
             )
+        self._setTorsionGroup()
+
+    def _setTorsionGroup(self):
+        """
+        _setTorsionGroup groups torsions sharing the same tables, so that each table is evaluated once for the whole group
+        """
+        group_dict = {}
+        for torsion_id, force_field in enumerate(self._force_field_vector):
+            group_dict.setdefault(id(force_field._energy_table), [force_field, []])[1].append(torsion_id)
+        self._group_force_fields = [group[0] for group in group_dict.values()]
+        self._group_torsion_index = [np.array(group[1]) for group in group_dict.values()]
+        self._torsion_group = np.zeros(self._num_torsions, dtype=np.int64)
+        for group, group_index in enumerate(self._group_torsion_index):
+            self._torsion_group[group_index] = group
+
+    def _calculateTorsionEnergyAndForces(self, torsion_ids=None):
+        """
+        _calculateTorsionEnergyAndForces calculates the energy of torsions and the forces acting on their atoms in one vectorized pass
+
+        The force of each atom is ``-dE/dphi * dphi/dr``, where ``-dE/dphi`` comes from the force table 
+        and ``dphi/dr`` is the analytic gradient of the torsion angle
+
+        Parameters
+        ----------
+        torsion_ids : np.ndarray, optional
+            the id of torsions to be calculated, by default None, which means all torsions
+
+        Returns
+        -------
+        tuple(float, np.ndarray)
+            - The potential energy of torsions, in unit of ``kilojoule_permol``
+            - (num_atoms, 3) float array of force acts on each atom, in unit of ``kilojoule_permol_over_angstrom``
+        """
+        torsion_mask = None
+        if torsion_ids is not None:
+            torsion_mask = np.zeros(self._num_torsions, dtype=bool)
+            torsion_mask[torsion_ids] = True
+        torsion_index = self._torsion_index if torsion_mask is None else self._torsion_index[torsion_mask, :]
+        # Geometry of all torsions is shared through the cache of Ensemble
+        torsion_angle, gradient = self._ensemble.calculateTorsionGeometry()
+        if torsion_mask is not None:
+            gradient = gradient[torsion_mask]
+        energy = 0
+        torsion_force = np.zeros(self._num_torsions)
+        for force_field, group_index in zip(self._group_force_fields, self._group_torsion_index):
+            if torsion_mask is not None:
+                group_index = group_index[torsion_mask[group_index]]
+            if group_index.shape[0] != 0:
+                energy += force_field._energy_table(torsion_angle[group_index]).sum()
+                torsion_force[group_index] = force_field._force_table(torsion_angle[group_index])
+        if torsion_mask is not None:
+            torsion_force = torsion_force[torsion_mask]
+        forces = np.zeros([self._ensemble.system.num_atoms, 3])
+        np.add.at(forces, torsion_index, torsion_force[:, np.newaxis, np.newaxis] * gradient)
+        return energy, forces
 
     def calculateTorsionEnergy(self, torsion_id):
         """
@@ -203,12 +245,7 @@ class PDFFTorsionForce(Force):
         """        
         self._testBound()
         return self._force_field_vector[torsion_id].getEnergy(
-            getTorsion(
-                self._torsions[torsion_id][0].coordinate, 
-                self._torsions[torsion_id][1].coordinate, 
-                self._torsions[torsion_id][2].coordinate, 
-                self._torsions[torsion_id][3].coordinate
-            )
+            self._ensemble.calculateTorsionGeometry()[0][torsion_id]
         )
 
     def calculatePotentialEnergy(self):
@@ -221,15 +258,60 @@ class PDFFTorsionForce(Force):
             The potential energy of all torsions
         """        
         self._testBound()
-        self._potential_energy = 0
-        for torsion_id in range(self._num_torsions):
-            self._potential_energy += self.calculateTorsionEnergy(torsion_id)
+        self._potential_energy = self._calculateTorsionEnergyAndForces()[0] * kilojoule_permol
         return self._potential_energy 
 
+    def calculateReducedEnergyAndForces(self):
+        """
+        calculateReducedEnergyAndForces calculates the potential energy of all torsions and the force acts on all atoms in one pass
+
+        All torsion angles and their gradients are calculated in one vectorized pass, 
+        forces are scattered to both SC and CA atoms of each torsion
+
+        Returns
+        -------
+        tuple(float, np.ndarray)
+            - The potential energy of all torsions, in unit of ``kilojoule_permol``
+            - (num_atoms, 3) float array of force acts on each atom, in unit of ``kilojoule_permol_over_angstrom``
+        """        
+        self._testBound()
+        energy, forces = self._calculateTorsionEnergyAndForces()
+        self._potential_energy = energy * kilojoule_permol
+        return energy, forces
+
+    def calculateReducedLocalEnergy(self, atom_ids):
+        """
+        calculateReducedLocalEnergy calculates the potential energy of torsions containing any of ``atom_ids``
+
+        Parameters
+        ----------
+        atom_ids : np.ndarray
+            the id of atoms
+
+        Returns
+        -------
+        float
+            The potential energy of torsions containing ``atom_ids``, in unit of ``kilojoule_permol``
+        """
+        self._testBound()
+        torsion_ids = np.where(np.isin(self._torsion_index, atom_ids).any(1))[0]
+        if torsion_ids.shape[0] == 0:
+            return 0
+        torsion_angle = getTorsionAndGradient(
+            self._ensemble.system.coordinate_array, self._torsion_index[torsion_ids, :]
+        )[0]
+        torsion_group = self._torsion_group[torsion_ids]
+        energy = 0
+        for group in np.unique(torsion_group):
+            energy += self._group_force_fields[group]._energy_table(torsion_angle[torsion_group == group]).sum()
+        return energy
+
     def calculateAtomForce(self, atom_id):
         """
         calculateAtomForce calculates the force acts on atom
 
+        Only torsions containing the atom are calculated
+
         Parameters
         ----------
         atom_id : int
@@ -237,79 +319,25 @@ class PDFFTorsionForce(Force):
 
         Returns
         -------
-        Quantity
+        QuantityArray
             the force acts on atom
         """        
         self._testBound()
-        # fixme: Need to multiple 0.5 to each force?
-        target_atom = self._atoms[atom_id]
-        if target_atom.atom_type == 'CA':
-            # CA has no interaction in PDFF
-            return np.zeros(3) * kilojoule_permol_over_angstrom
-        else:
-            force = np.zeros(3) * kilojoule_permol_over_angstrom
-
-            if atom_id == 1:
-                # First SC
-                torsion_id = 0
-                vec = getNormVec(
-                    self._torsions[torsion_id][0].coordinate,
-                    self._torsions[torsion_id][1].coordinate,
-                    self._torsions[torsion_id][2].coordinate
-                )
-                torsion_angle = getTorsion(
-                    self._torsions[torsion_id][0].coordinate, 
-                    self._torsions[torsion_id][1].coordinate, 
-                    self._torsions[torsion_id][2].coordinate, 
-                    self._torsions[torsion_id][3].coordinate
-                )
-                force += 0.5 * self.force_field_vector[torsion_id].getForce(torsion_angle) * vec 
-            elif atom_id == self._num_atoms - 1:
-                # Last SC
-                torsion_id = self._num_torsions - 1
-                vec = getNormVec(
-                    self._torsions[torsion_id][3].coordinate,
-                    self._torsions[torsion_id][2].coordinate,
-                    self._torsions[torsion_id][1].coordinate
-                )
-                torsion_angle = getTorsion(
-                    self._torsions[torsion_id][0].coordinate, 
-                    self._torsions[torsion_id][1].coordinate, 
-                    self._torsions[torsion_id][2].coordinate, 
-                    self._torsions[torsion_id][3].coordinate
-                )
-                force += 0.5 * self.force_field_vector[torsion_id].getForce(torsion_angle) * vec 
-            else:
-                # Other SC
-                torsion_id = int(floor(atom_id/2)) - 1 
-                # Atom 3 equals to the second SC and corelated to 0 torsion and 1 torsion
-                # Atom 5 equals to the third SC and corelated to 1 torsion and 2 torsion
-                vec = getNormVec(
-                    self._torsions[torsion_id][0].coordinate,
-                    self._torsions[torsion_id][1].coordinate,
-                    self._torsions[torsion_id][2].coordinate
-                )
-                torsion_angle = getTorsion(
-                    self._torsions[torsion_id][0].coordinate, 
-                    self._torsions[torsion_id][1].coordinate, 
-                    self._torsions[torsion_id][2].coordinate, 
-                    self._torsions[torsion_id][3].coordinate
-                )
-                force += 0.5 * self.force_field_vector[torsion_id].getForce(torsion_angle) * vec 
-                torsion_id += 1 # Next torsion
-                vec = getNormVec(
-                    self._torsions[torsion_id][3].coordinate,
-                    self._torsions[torsion_id][2].coordinate,
-                    self._torsions[torsion_id][1].coordinate
-                )
-                torsion_angle = getTorsion(
-                    self._torsions[torsion_id][0].coordinate, 
-                    self._torsions[torsion_id][1].coordinate, 
-                    self._torsions[torsion_id][2].coordinate, 
-                    self._torsions[torsion_id][3].coordinate
-                )
-                force += 0.5 * self.force_field_vector[torsion_id].getForce(torsion_angle) * vec 
-            return force
+        torsion_ids = np.where((self._torsion_index == atom_id).any(1))[0]
+        forces = self._calculateTorsionEnergyAndForces(torsion_ids)[1]
+        return QuantityArray(forces[atom_id, :], kilojoule_permol_over_angstrom)
+
+    @property
+    def num_interactions(self):
+        """
+        num_interactions overloads ``Force.num_interactions`` to get the number of torsions
+
+        Returns
+        -------
+        int
+            the number of torsions
+        """
+        return self._num_torsions
 
     @property
     def num_torsions(self):
@@ -334,7 +362,7 @@ class PDFFTorsionForce(Force):
             The potential energy of all torsions 
         """        
         try:
-            self.calculatePotentialEnergy()
+            self._ensemble.calculateReducedForceEnergyAndForces(self._force_id)
             return self._potential_energy
         except:
             return self._potential_energy
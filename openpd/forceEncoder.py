@@ -10,7 +10,7 @@ class ForceEncoder:
     def __init__(
         self, system:System, 
         force_field_name:str='pdff',
-        cutoff_radius=12
+        cutoff_radius=12, is_hydro_field=False, bonded_force_group=0
     ) -> None:
         self._system = system
         if not force_field_name.lower() in RIGISTERED_FORCE_FIELDS:
@@ -19,6 +19,10 @@ class ForceEncoder:
         self._force_field_name = force_field_name
         self._force_field_folder = os.path.join(cur_dir, 'data', force_field_name)
         self._cutoff_radius = cutoff_radius
+        # Hydration field uses the generic PDFFHydroFieldForce.DEFAULT_PARAMETERS, which is not fitted, so it is disabled by default
+        self._is_hydro_field = is_hydro_field
+        # Bond and torsion forces can be put into a separate group for multiple time-step integration
+        self._bonded_force_group = bonded_force_group
 
     def __repr__(self) -> str:
         return ('<ForceEncoder object: encoding %s forcefield at 0x%x>' 
@@ -37,6 +41,8 @@ class ForceEncoder:
             non_bonded_force, bond_force, torsion_force,
             center_constraint_force
         )
+        if self._is_hydro_field:
+            self.ensemble.addForces(self._createHydroFieldForce())
 
         return self.ensemble
 
@@ -47,11 +53,17 @@ class ForceEncoder:
         return force
 
     def _createBondForce(self):
-        force = PDFFBondForce()
+        force = PDFFBondForce(force_group=self._bonded_force_group)
         return force
 
     def _createTorsionForce(self):
-        force = PDFFTorsionForce()
+        force = PDFFTorsionForce(force_group=self._bonded_force_group)
+        return force
+
+    def _createHydroFieldForce(self):
+        force = PDFFHydroFieldForce(
+            cutoff_radius=self._cutoff_radius
+        )
         return force
 
     def _createCenterConstraintForce(self):
@@ -66,4 +78,12 @@ class ForceEncoder:
 
     @property
     def cutoff_radius(self):
-        return self._cutoff_radius
\ No newline at end of file
+        return self._cutoff_radius
+
+    @property
+    def is_hydro_field(self):
+        return self._is_hydro_field
+
+    @property
+    def bonded_force_group(self):
+        return self._bonded_force_group
@@ -4,18 +4,24 @@ __email__ = "zhenyuwei99@gmail.com"
 __copyright__ = "Copyright 2021-2021, Southeast University and Zhenyu Wei"
 __license__ = "GPLv3"
 
+from .workerPool import WorkerPool
 from .integrator import Integrator
 from .verletIntegrator import VerletIntegrator
 from .leapFrogIntegrator import LeapFrogIntegrator
 from .velocityVerletIntegrator import VelocityVerletIntegrator
+from .respaIntegrator import RESPAIntegrator
 from .brownianIntegrator import BrownianIntegrator
+from .langevinIntegrator import LangevinIntegrator
 from .mcmcIntegrator import MCMCIntegrator
 
 __all__ = [
+    'WorkerPool',
     'Integrator',
     'VerletIntegrator',
     'LeapFrogIntegrator',
     'VelocityVerletIntegrator',
+    'RESPAIntegrator',
     'BrownianIntegrator', 
+    'LangevinIntegrator',
     'MCMCIntegrator'
 ]
\ No newline at end of file
@@ -1,25 +1,40 @@
 import math
-import multiprocessing as mp
 import numpy as np
 import openpd.unit as unit
 from .. import Ensemble
+from .workerPool import WorkerPool, POOL_TYPES
 from ..unit import *
 from ..unit import Quantity
 from ..exceptions import NonboundError, RebindError, DismatchedDimensionError
 
 class Integrator:
-    def __init__(self, sim_interval=1) -> None:
+    def __init__(self, sim_interval=1, num_workers=1, pool_type='process', seed=None) -> None:
         """
         Parameters
         ----------
         sim_interval : int or Quantity, optional
             the step sim_interval of the integrator, by default ``1 * femtosecond``
+        num_workers : int, optional
+            the number of workers used to calculate forces, by default 1. 
+            A persistent ``WorkerPool`` is created at bind time when ``num_workers > 1``.
+            Each ``Force`` is evaluated by one worker, so at most ``Ensemble.num_forces`` workers are used
+        pool_type : str, optional
+            the type of workers, ``'process'`` or ``'thread'``, by default 'process'
+        seed : int, optional
+            the seed of the random number generator used for velocity and thermal noise, by default None
 
         Raises
         ------
         ValueError
             When the parameter ``sim_interval`` is ``Quantity`` and ``sim_interval.unit.base_dimension != BaseDimension(time_dimension=1)``
+        ValueError
+            When ``pool_type`` is not in ``POOL_TYPES``
         """        
+        if not pool_type.lower() in POOL_TYPES:
+            raise ValueError(
+                '%s pool type is not support. Choose from \n %s'
+                %(pool_type, POOL_TYPES)
+            )
         if isinstance(sim_interval, Quantity):
             sim_interval.convertTo(femtosecond)
         else:
@@ -28,6 +43,13 @@ class Integrator:
         self._sim_interval = sim_interval
         self._is_bound = False # This will turn to True in Simulation.__init__()
         self._ensemble = None
+        self._num_workers = num_workers
+        self._pool_type = pool_type.lower()
+        self._worker_pool = None
+        self._random_generator = np.random.default_rng(seed)
+        # Coordinate version and force groups of the forces in System.force_array
+        self._force_coordinate_version = None
+        self._force_group = None
 
     def __repr__(self):
         return (
@@ -57,6 +79,8 @@ class Integrator:
             raise RebindError('This integrator has been bonded, can not be bound again!')
         self._ensemble = ensemble
         self._system = ensemble.system
+        if self._num_workers > 1:
+            self._worker_pool = WorkerPool(ensemble, self._num_workers, self._pool_type)
         self._is_bound = True
 
     def _testBound(self):
@@ -81,26 +105,45 @@ class Integrator:
             When the dimension of input ``temperature`` is Quantity and != ``BaseDimension(temperature_dimension=1)``
         """        
         self._testBound()
+        temperature = self._convertTemperature(temperature)
+        # Maxwell-Boltzmann velocity of all atoms in one batch, std = sqrt(kT/m)
+        velocity = self._random_generator.standard_normal([self._system.num_atoms, 3])
+        velocity *= np.sqrt(
+            self._getReducedThermalEnergy(temperature) / 
+            self._system.mass_array / mass_velocity_square_factor
+        )
+        self._system.velocity_array[:, :] = velocity
+
+        # Rescale temperature
+        scale = self.calculateTemperature() / temperature
+        self._system.velocity_array[:, :] /= np.sqrt(scale)
+
+    @staticmethod
+    def _convertTemperature(temperature):
         if isinstance(temperature, Quantity):
             if temperature.unit.base_dimension != unit.temperature:
                 raise DismatchedDimensionError(
-                    'Dimension of parameter temperature should be s instead of %s' 
+                    'Dimension of parameter temperature should be K instead of %s' 
                     %(temperature.unit.base_dimension)
                 )
-            else:
-                temperature = temperature / kelvin * kelvin
-        else:
-            temperature = temperature * kelvin
+            return temperature / kelvin * kelvin
+        return temperature * kelvin
 
-        for atom in self._system.atoms:
-            width = (3 * k_b * temperature / atom.mass).sqrt()
-            atom.velocity = np.random.rand(3) * 2 * width - width
-        
-        # Rescale temperature
-        scale = self.calculateTemperature() / temperature
-        for atom in self._system.atoms:
-            atom.velocity /= np.sqrt(scale)
-        
+    @staticmethod
+    def _convertFrictionCoefficient(friction_coefficient):
+        if isinstance(friction_coefficient, Quantity):
+            if friction_coefficient.unit.base_dimension != 1 / unit.time:
+                raise DismatchedDimensionError(
+                    'Dimension of parameter friction_coefficient should be 1/s instead of %s' 
+                    %(friction_coefficient.unit.base_dimension)
+                )
+            return friction_coefficient / (1 / femtosecond) * (1 / femtosecond)
+        return friction_coefficient * (1 / femtosecond)
+
+    @staticmethod
+    def _getReducedThermalEnergy(temperature):
+        # kT in unit of kilojoule_permol
+        return (k_b * temperature).convertTo(kilojoule_permol) / kilojoule_permol
 
     def calculateKineticEnergy(self):
         """
@@ -117,11 +160,11 @@ class Integrator:
             When ``self`` has not been bound to any ``Simulation`` instance
         """        
         self._testBound()
-        
-        kinetic_energy = 0
-        for atom in self._system.atoms:
-            kinetic_energy += atom.mass * (atom.velocity**2).sum() / 2
-        return kinetic_energy.convertTo(kilojoule_permol)
+        kinetic_energy = (
+            (self._system.mass_array * self._system.velocity_array**2).sum() / 2 * 
+            mass_velocity_square_factor
+        )
+        return kinetic_energy * kilojoule_permol
 
     def calculateTemperature(self):
         """
@@ -145,27 +188,36 @@ class Integrator:
         """
         updateForce updates the force acts on all ``Atom``
 
-        This method needs to be overloaded for all subclass
+        Forces of the whole system are calculated by ``Ensemble.calculateForces`` in one pass, 
+        or by the ``WorkerPool`` when ``num_workers > 1``, and written into the force buffer of ``System``
+
+        Parameters
+        ----------
+        force_group : list, optional
+            the force groups that will be calculated, by default [0]
         """  
-        num_processes = mp.cpu_count() if self._system.num_atoms > mp.cpu_count() else self._system.num_atoms
-        atom_ranges = np.array_split([atom.atom_id for atom in self._system.atoms], num_processes)
-
-        jobs = []
-        manager = mp.Manager()
-        return_dict = manager.dict()
-        for atom_range in atom_ranges:            
-            jobs.append(mp.Process(
-                target=self._calculateAtomForce,
-                args=(atom_range, force_group, return_dict)
-            ))
-            jobs[-1].start()
-        [p.join() for p in jobs]
-        for atom in self._system.atoms:
-            atom.force = return_dict[atom.atom_id]
-
-    def _calculateAtomForce(self, atom_range, force_group, return_dict):
-        for atom_id in atom_range:
-            return_dict[atom_id] = self._ensemble.calculateAtomForce(atom_id, force_group)
+        self._testBound()
+        self._system.force_array[:, :] = self._calculateForces(force_group)
+        self._force_coordinate_version = self._system.coordinate_version
+        self._force_group = list(force_group)
+
+    def _updateCachedForce(self, force_group=[0]):
+        """
+        _updateCachedForce updates the force buffer of ``System`` only when the coordinate version of ``System`` 
+        or ``force_group`` has changed since the last ``updateForce()``
+
+        The forces of the last step are reused by the first step of the next ``step()`` call
+        """
+        if (
+            self._force_coordinate_version != self._system.coordinate_version or
+            self._force_group != list(force_group)
+        ):
+            self.updateForce(force_group)
+
+    def _calculateForces(self, force_group=[0]):
+        if self._worker_pool != None:
+            return self._worker_pool.calculateForces(force_group)
+        return self._ensemble.calculateForces(force_group)
 
     def step(self, num_steps:int):
         """
@@ -224,6 +276,43 @@ class Integrator:
             sim_interval = sim_interval * femtosecond
         self._sim_interval = sim_interval 
 
+    @property
+    def num_workers(self):
+        """
+        num_workers gets the number of workers used to calculate forces
+
+        Returns
+        -------
+        int
+            the number of workers
+        """
+        return self._num_workers
+
+    @property
+    def pool_type(self):
+        """
+        pool_type gets the type of workers used to calculate forces
+
+        Returns
+        -------
+        str
+            ``'process'`` or ``'thread'``
+        """
+        return self._pool_type
+
+    @property
+    def worker_pool(self):
+        """
+        worker_pool gets the ``WorkerPool`` created at bind time
+
+        Returns
+        -------
+        WorkerPool or None
+            the ``WorkerPool`` of ``self``, None if ``num_workers <= 1``
+        """
+        self._testBound()
+        return self._worker_pool
+
     @property
     def ensemble(self):
         """
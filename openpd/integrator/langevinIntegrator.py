@@ -0,0 +1,102 @@
+import numpy as np
+from . import Integrator
+from .. import Ensemble
+from ..unit import *
+
+class LangevinIntegrator(Integrator):
+    def __init__(
+        self, sim_interval, dumpping_factor, temperature=300, 
+        num_workers=1, pool_type='process', seed=None
+    ) -> None:
+        """
+        Parameters
+        ----------
+        sim_interval : int or float or Quantity
+            the step sim_interval of the integrator, Unit default to be ``femtosecond`` if ``int`` or ``float`` is provided
+        dumpping_factor : int or float or Quantity
+            the friction coefficient gamma, Unit default to be ``1/femtosecond`` if ``int`` or ``float`` is provided
+        temperature : int or float or Quantity, optional
+            the temperature of the heat bath, by default ``300 * kelvin``
+        num_workers : int, optional
+            the number of workers used to calculate forces, by default 1
+        pool_type : str, optional
+            the type of workers, ``'process'`` or ``'thread'``, by default 'process'
+        seed : int, optional
+            the seed of the random number generator, by default None
+        """
+        super().__init__(sim_interval, num_workers, pool_type, seed)
+        self._dumpping_factor = self._convertFrictionCoefficient(dumpping_factor)
+        self._temperature = self._convertTemperature(temperature)
+
+    def __repr__(self):
+        return (
+            '<LangevinIntegrator object: step sim_interval %s, %s at 0x%x>'
+            %(self._sim_interval, self._temperature, id(self))
+        )
+
+    __str__ = __repr__
+
+    def _bindEnsemble(self, ensemble: Ensemble):
+        super()._bindEnsemble(ensemble)
+        self.setVelocityToTemperature(self._temperature)
+
+    def step(self, num_steps):
+        """
+        step integrates the Langevin equation with BAOAB splitting
+
+        Each step is a half kick (B), a half drift (A), an exact Ornstein-Uhlenbeck update of velocity (O), 
+        a half drift (A) and a half kick (B) with the new forces. 
+        All atoms are updated in one pass and the gaussian noise of each step is drawn in one batch
+
+        Parameters
+        ----------
+        num_steps : int
+            the number of steps that integrator will integrate
+        """
+        self._testBound()
+        coord = self._system.coordinate_array
+        velocity = self._system.velocity_array
+        force = self._system.force_array
+        inv_mass = force_over_mass_factor / self._system.mass_array
+        sim_interval = self._sim_interval / femtosecond
+        half_interval = 0.5 * sim_interval
+        velocity_decay = np.exp(-self._dumpping_factor * femtosecond * sim_interval)
+        noise_width = np.sqrt(
+            (1 - velocity_decay**2) * self._getReducedThermalEnergy(self._temperature) / 
+            self._system.mass_array / mass_velocity_square_factor
+        )
+        num_atoms = self._system.num_atoms
+        self._updateCachedForce()
+        for _ in range(num_steps):
+            velocity += force * inv_mass * half_interval
+            coord += velocity * half_interval
+            velocity *= velocity_decay
+            velocity += noise_width * self._random_generator.standard_normal([num_atoms, 3])
+            coord += velocity * half_interval
+            self._system.updateCoordinateVersion()
+            self.updateForce()
+            velocity += force * inv_mass * half_interval
+
+    @property
+    def dumpping_factor(self):
+        """
+        dumpping_factor gets the friction coefficient of ``self``
+
+        Returns
+        -------
+        Quantity
+            the friction coefficient, in unit of ``1/femtosecond``
+        """
+        return self._dumpping_factor
+
+    @property
+    def temperature(self):
+        """
+        temperature gets the temperature of the heat bath
+
+        Returns
+        -------
+        Quantity
+            the temperature of the heat bath
+        """
+        return self._temperature
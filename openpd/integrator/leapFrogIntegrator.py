@@ -1,5 +1,64 @@
 from . import Integrator
+from .. import Ensemble
+from ..unit import *
 
 class LeapFrogIntegrator(Integrator):
-    def __init__(self, sim_interval) -> None:
-        super().__init__(sim_interval)
\ No newline at end of file
+    def __init__(self, sim_interval, temperature=300, num_workers=1, pool_type='process', seed=None) -> None:
+        """
+        Parameters
+        ----------
+        sim_interval : int or float or Quantity
+            the step sim_interval of the integrator, Unit default to be ``femtosecond`` if ``int`` or ``float`` is provided
+        temperature : int or float or Quantity, optional
+            the initial temperature of the system, by default ``300 * kelvin``
+        num_workers : int, optional
+            the number of workers used to calculate forces, by default 1
+        pool_type : str, optional
+            the type of workers, ``'process'`` or ``'thread'``, by default 'process'
+        seed : int, optional
+            the seed of the random number generator used for velocity, by default None
+        """
+        super().__init__(sim_interval, num_workers, pool_type, seed)
+        self._temperature = self._convertTemperature(temperature)
+
+    def _bindEnsemble(self, ensemble: Ensemble):
+        super()._bindEnsemble(ensemble)
+        self.setVelocityToTemperature(self._temperature)
+
+    def step(self, num_steps):
+        """
+        step integrates ``num_steps`` steps with leap-frog algorithm
+
+        ``System.velocity_array`` holds the velocity at half step ``v(t - dt/2)``.
+        Forces are calculated once per step, the forces of the last step are reused by the next ``step()`` call
+
+        Parameters
+        ----------
+        num_steps : int
+            the number of steps that integrator will integrate
+        """
+        self._testBound()
+        # Views of System state buffers, all updates are in place
+        coord = self._system.coordinate_array
+        velocity = self._system.velocity_array
+        force = self._system.force_array
+        inv_mass = force_over_mass_factor / self._system.mass_array
+        sim_interval = self._sim_interval / femtosecond
+        self._updateCachedForce()
+        for _ in range(num_steps):
+            velocity += force * inv_mass * sim_interval
+            coord += velocity * sim_interval
+            self._system.updateCoordinateVersion()
+            self.updateForce()
+
+    @property
+    def temperature(self):
+        """
+        temperature gets the initial temperature of the system
+
+        Returns
+        -------
+        Quantity
+            the initial temperature
+        """
+        return self._temperature
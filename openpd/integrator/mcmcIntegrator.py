@@ -1,3 +1,280 @@
-class MCMCIntegrator(object):
-    def __init__(self) -> None:
-        super().__init__()
\ No newline at end of file
+import numpy as np
+from . import Integrator
+from .. import Ensemble
+from ..unit import *
+from ..unit import Quantity
+
+MCMC_MOVE_TYPES = ['sc', 'ca', 'crankshaft', 'pivot']
+# Step size of each move type: displacement in angstrom for 'sc' and 'ca', maximum rotation angle in radian for the others
+MCMC_MAX_STEP_SIZES = {'sc': 2, 'ca': 2, 'crankshaft': np.pi, 'pivot': np.pi}
+
+class MCMCIntegrator(Integrator):
+    def __init__(
+        self, sim_interval=1, temperature=300, move_weights=None,
+        displacement=0.1, rotation_angle=0.1, num_trials_per_step=None,
+        is_auto_tune=True, target_acceptance_ratio=0.5, tune_interval=100, seed=None
+    ) -> None:
+        """
+        Parameters
+        ----------
+        sim_interval : int or float or Quantity, optional
+            the nominal time of one step, used by ``Simulation`` to schedule dumpers, by default ``1 * femtosecond``
+        temperature : int or float or Quantity, optional
+            the temperature of Metropolis criterion, by default ``300 * kelvin``
+        move_weights : dict, optional
+            the relative probability of each move type in ``MCMC_MOVE_TYPES``,
+            by default None, which means ``{'sc': 1, 'ca': 1, 'crankshaft': 1, 'pivot': 0.2}``
+        displacement : int or float or Quantity, optional
+            the initial standard deviation of ``'sc'`` and ``'ca'`` displacement, by default ``0.1 * angstrom``
+        rotation_angle : int or float, optional
+            the initial maximum angle of ``'crankshaft'`` and ``'pivot'`` rotation in radian, by default 0.1
+        num_trials_per_step : int, optional
+            the number of trial moves of each step, by default None, which means the number of peptides
+        is_auto_tune : bool, optional
+            tune the step size of each move type toward ``target_acceptance_ratio``, by default True
+        target_acceptance_ratio : float, optional
+            the target acceptance ratio of auto-tuning, by default 0.5
+        tune_interval : int, optional
+            the number of trials of a move type between two tunings, by default 100
+        seed : int, optional
+            the seed of the random number generator, by default None
+
+        Raises
+        ------
+        ValueError
+            When ``move_weights`` contains move type not in ``MCMC_MOVE_TYPES`` or all weights are 0
+        """
+        super().__init__(sim_interval, seed=seed)
+        self._temperature = self._convertTemperature(temperature)
+        if move_weights is None:
+            move_weights = {'sc': 1, 'ca': 1, 'crankshaft': 1, 'pivot': 0.2}
+        for move_type, weight in move_weights.items():
+            if not move_type in MCMC_MOVE_TYPES:
+                raise ValueError(
+                    '%s move is not supported. Choose from \n %s'
+                    %(move_type, MCMC_MOVE_TYPES)
+                )
+            if weight < 0:
+                raise ValueError('Weight of %s move should not be negative' %(move_type))
+        self._move_weights = np.array([move_weights.get(move_type, 0) for move_type in MCMC_MOVE_TYPES], dtype=np.float64)
+        if self._move_weights.sum() == 0:
+            raise ValueError('At least one move type should have positive weight')
+        if isinstance(displacement, Quantity):
+            displacement = displacement.convertTo(angstrom) / angstrom
+        self._step_size = {
+            'sc': displacement, 'ca': displacement,
+            'crankshaft': rotation_angle, 'pivot': rotation_angle
+        }
+        self._num_trials_per_step = num_trials_per_step
+        self._is_auto_tune = is_auto_tune
+        self._target_acceptance_ratio = target_acceptance_ratio
+        self._tune_interval = tune_interval
+        self.resetStatistics()
+
+    def __repr__(self):
+        return (
+            '<MCMCIntegrator object: %s, acceptance ratio %.3f at 0x%x>'
+            %(self._temperature, self.total_acceptance_ratio, id(self))
+        )
+
+    __str__ = __repr__
+
+    def _bindEnsemble(self, ensemble: Ensemble):
+        super()._bindEnsemble(ensemble)
+        self._ca_index = np.array([peptide.atoms[0].atom_id for peptide in self._system.molecules])
+        self._sc_index = np.array([peptide.atoms[1].atom_id for peptide in self._system.molecules])
+        # Crankshaft rotates a residue around the axis of its 2 neighbor CAs
+        self._crankshaft_index = []
+        # Pivot rotates the shorter side of chain around a CA
+        self._pivot_index, self._pivot_atom_ids = [], []
+        for chain in self._system.chains:
+            peptide_ids = [peptide.peptide_id for peptide in chain.molecules]
+            for i in range(1, len(peptide_ids) - 1):
+                self._crankshaft_index.append(peptide_ids[i-1:i+2])
+                side = peptide_ids[i+1:] if i >= len(peptide_ids) - 1 - i else peptide_ids[:i]
+                self._pivot_index.append(peptide_ids[i])
+                self._pivot_atom_ids.append(np.concatenate([self._ca_index[side], self._sc_index[side]]))
+        self._crankshaft_index = np.array(self._crankshaft_index, dtype=np.int64).reshape(-1, 3)
+        self._move_probability = self._move_weights.copy()
+        if len(self._crankshaft_index) == 0:
+            self._move_probability[MCMC_MOVE_TYPES.index('crankshaft')] = 0
+            self._move_probability[MCMC_MOVE_TYPES.index('pivot')] = 0
+        if self._move_probability.sum() == 0:
+            raise ValueError('No move type is available for %s' %(self._system))
+        self._move_probability /= self._move_probability.sum()
+        self._reduced_thermal_energy = self._getReducedThermalEnergy(self._temperature)
+
+    def resetStatistics(self):
+        """
+        resetStatistics resets the acceptance statistics of ``self``
+        """
+        self._num_trials = {move_type: 0 for move_type in MCMC_MOVE_TYPES}
+        self._num_accepted = {move_type: 0 for move_type in MCMC_MOVE_TYPES}
+        self._num_tune_trials = {move_type: 0 for move_type in MCMC_MOVE_TYPES}
+        self._num_tune_accepted = {move_type: 0 for move_type in MCMC_MOVE_TYPES}
+
+    @staticmethod
+    def _rotate(coord, origin, axis, angle):
+        # Rodrigues' rotation of (n, 3) coord around the unit axis passing origin
+        vec = coord - origin
+        cos, sin = np.cos(angle), np.sin(angle)
+        return (
+            origin + vec * cos + np.cross(axis, vec) * sin +
+            axis * (vec @ axis)[:, np.newaxis] * (1 - cos)
+        )
+
+    def _proposeMove(self, move_type):
+        """
+        _proposeMove proposes a symmetric trial move of ``move_type``
+
+        Returns
+        -------
+        tuple(np.ndarray, np.ndarray)
+            - the id of moved atoms
+            - (num_moved_atoms, 3) trial coordinate of moved atoms, in unit of angstrom
+        """
+        coord = self._system.coordinate_array
+        step_size = self._step_size[move_type]
+        if move_type == 'sc' or move_type == 'ca':
+            index = self._sc_index if move_type == 'sc' else self._ca_index
+            atom_ids = index[self._random_generator.integers(index.shape[0])][np.newaxis]
+            return atom_ids, coord[atom_ids, :] + self._random_generator.normal(0, step_size, [1, 3])
+        angle = self._random_generator.uniform(-step_size, step_size)
+        if move_type == 'crankshaft':
+            peptide_ids = self._crankshaft_index[self._random_generator.integers(self._crankshaft_index.shape[0])]
+            origin, end = coord[self._ca_index[peptide_ids[0]], :], coord[self._ca_index[peptide_ids[2]], :]
+            axis = end - origin
+            atom_ids = np.array([self._ca_index[peptide_ids[1]], self._sc_index[peptide_ids[1]]])
+        else:
+            pivot = self._random_generator.integers(len(self._pivot_index))
+            origin = coord[self._ca_index[self._pivot_index[pivot]], :]
+            axis = self._random_generator.standard_normal(3)
+            atom_ids = self._pivot_atom_ids[pivot]
+        axis = axis / np.sqrt((axis**2).sum())
+        return atom_ids, self._rotate(coord[atom_ids, :], origin, axis, angle)
+
+    def _tuneStepSize(self, move_type):
+        ratio = self._num_tune_accepted[move_type] / self._num_tune_trials[move_type]
+        scale = 1.1 if ratio > self._target_acceptance_ratio else 0.9
+        self._step_size[move_type] = min(self._step_size[move_type] * scale, MCMC_MAX_STEP_SIZES[move_type])
+        self._num_tune_trials[move_type] = 0
+        self._num_tune_accepted[move_type] = 0
+
+    def step(self, num_steps):
+        """
+        step performs ``num_steps`` steps of Metropolis Monte Carlo, each contains ``num_trials_per_step`` trial moves
+
+        The energy change of each trial is calculated by ``Ensemble.calculateReducedLocalEnergy()``
+        from only the terms involving the moved atoms
+
+        Parameters
+        ----------
+        num_steps : int
+            the number of steps that integrator will integrate
+        """
+        self._testBound()
+        coord = self._system.coordinate_array
+        num_trials = self._num_trials_per_step
+        if num_trials is None:
+            num_trials = self._system.num_molecules
+        move_types = self._random_generator.choice(
+            len(MCMC_MOVE_TYPES), num_steps * num_trials, p=self._move_probability
+        )
+        for move_type in move_types:
+            move_type = MCMC_MOVE_TYPES[move_type]
+            atom_ids, trial_coord = self._proposeMove(move_type)
+            old_coord = coord[atom_ids, :].copy()
+            old_energy = self._ensemble.calculateReducedLocalEnergy(atom_ids)
+            coord[atom_ids, :] = trial_coord
+            self._system.updateCoordinateVersion()
+            delta_energy = self._ensemble.calculateReducedLocalEnergy(atom_ids) - old_energy
+            is_accepted = bool(
+                delta_energy <= 0 or
+                self._random_generator.random() < np.exp(-delta_energy / self._reduced_thermal_energy)
+            )
+            if not is_accepted:
+                coord[atom_ids, :] = old_coord
+                self._system.updateCoordinateVersion()
+            self._num_trials[move_type] += 1
+            self._num_accepted[move_type] += is_accepted
+            if self._is_auto_tune:
+                self._num_tune_trials[move_type] += 1
+                self._num_tune_accepted[move_type] += is_accepted
+                if self._num_tune_trials[move_type] == self._tune_interval:
+                    self._tuneStepSize(move_type)
+
+    @property
+    def temperature(self):
+        """
+        temperature gets the temperature of Metropolis criterion
+
+        Returns
+        -------
+        Quantity
+            the temperature of Metropolis criterion
+        """
+        return self._temperature
+
+    @property
+    def step_size(self):
+        """
+        step_size gets the current step size of each move type
+
+        Returns
+        -------
+        dict
+            displacement in angstrom of ``'sc'`` and ``'ca'``, maximum angle in radian of ``'crankshaft'`` and ``'pivot'``
+        """
+        return self._step_size.copy()
+
+    @property
+    def num_trials(self):
+        """
+        num_trials gets the number of trials of each move type since the last ``resetStatistics()``
+
+        Returns
+        -------
+        dict
+            the number of trials
+        """
+        return self._num_trials.copy()
+
+    @property
+    def num_accepted(self):
+        """
+        num_accepted gets the number of accepted trials of each move type since the last ``resetStatistics()``
+
+        Returns
+        -------
+        dict
+            the number of accepted trials
+        """
+        return self._num_accepted.copy()
+
+    @property
+    def acceptance_ratio(self):
+        """
+        acceptance_ratio gets the acceptance ratio of each move type since the last ``resetStatistics()``
+
+        Returns
+        -------
+        dict
+            the acceptance ratio, 0 if the move type has not been tried
+        """
+        return {
+            move_type: self._num_accepted[move_type] / self._num_trials[move_type]
+            if self._num_trials[move_type] != 0 else 0 for move_type in MCMC_MOVE_TYPES
+        }
+
+    @property
+    def total_acceptance_ratio(self):
+        """
+        total_acceptance_ratio gets the acceptance ratio of all trials since the last ``resetStatistics()``
+
+        Returns
+        -------
+        float
+            the acceptance ratio, 0 if no trial has been performed
+        """
+        num_trials = sum(self._num_trials.values())
+        return sum(self._num_accepted.values()) / num_trials if num_trials != 0 else 0
@@ -0,0 +1,162 @@
+import numpy as np
+from . import Integrator
+from .. import Ensemble
+from ..unit import *
+
+class RESPAIntegrator(Integrator):
+    def __init__(
+        self, sim_interval, num_inner_steps=4, fast_force_group=[1], slow_force_group=[0],
+        temperature=300, num_workers=1, pool_type='process', seed=None
+    ) -> None:
+        """
+        Parameters
+        ----------
+        sim_interval : int or float or Quantity
+            the outer step sim_interval, at which forces in ``slow_force_group`` are calculated,
+            Unit default to be ``femtosecond`` if ``int`` or ``float`` is provided
+        num_inner_steps : int, optional
+            the number of inner steps in each outer step, by default 4.
+            Forces in ``fast_force_group`` are calculated every ``sim_interval / num_inner_steps``
+        fast_force_group : list, optional
+            the force groups of stiff forces like ``PDFFBondForce`` and ``PDFFTorsionForce``, by default [1]
+        slow_force_group : list, optional
+            the force groups of expensive forces like ``PDFFNonBondedForce``, by default [0]
+        temperature : int or float or Quantity, optional
+            the initial temperature of the system, by default ``300 * kelvin``
+        num_workers : int, optional
+            the number of workers used to calculate forces, by default 1
+        pool_type : str, optional
+            the type of workers, ``'process'`` or ``'thread'``, by default 'process'
+        seed : int, optional
+            the seed of the random number generator used for velocity, by default None
+
+        Raises
+        ------
+        ValueError
+            When ``num_inner_steps < 1`` or a group is in both ``fast_force_group`` and ``slow_force_group``.
+            When binding an ``Ensemble`` without forces in ``fast_force_group`` or ``slow_force_group``,
+            like the default of ``ForceEncoder`` putting bonded forces in group 0
+        """
+        super().__init__(sim_interval, num_workers, pool_type, seed)
+        if num_inner_steps < 1:
+            raise ValueError('num_inner_steps should be positive, instead of %s' %(num_inner_steps))
+        if set(fast_force_group) & set(slow_force_group):
+            raise ValueError(
+                'Force group %s is in both fast_force_group and slow_force_group'
+                %(list(set(fast_force_group) & set(slow_force_group)))
+            )
+        self._num_inner_steps = int(num_inner_steps)
+        self._fast_force_group = list(fast_force_group)
+        self._slow_force_group = list(slow_force_group)
+        self._temperature = self._convertTemperature(temperature)
+        self._cached_forces = None # (coordinate version, slow forces, fast forces) of the last step
+
+    def __repr__(self):
+        return (
+            '<RESPAIntegrator object: step sim_interval %s, %d inner steps at 0x%x>'
+            %(self._sim_interval, self._num_inner_steps, id(self))
+        )
+
+    __str__ = __repr__
+
+    def _bindEnsemble(self, ensemble: Ensemble):
+        # An empty group silently turns RESPA into velocity verlet at the outer sim_interval
+        for name, force_group in [
+            ['fast_force_group', self._fast_force_group], ['slow_force_group', self._slow_force_group]
+        ]:
+            if ensemble.getNumForcesByGroup(force_group) == 0:
+                raise ValueError(
+                    '%s %s contains no force, create the ensemble by ForceEncoder(system, bonded_force_group=1)'
+                    %(name, force_group)
+                )
+        super()._bindEnsemble(ensemble)
+        self.setVelocityToTemperature(self._temperature)
+
+    def step(self, num_steps):
+        """
+        step integrates ``num_steps`` outer steps with reversible reference system propagator algorithm
+
+        Each outer step is a half kick of slow forces, ``num_inner_steps`` velocity verlet steps driven by fast forces
+        and a half kick of the new slow forces.
+        Slow forces are calculated once per outer step, fast forces once per inner step, 
+        the forces of the last step are reused by the next ``step()`` call.
+        The force buffer of ``System`` is set to the sum of both after each outer step
+
+        Parameters
+        ----------
+        num_steps : int
+            the number of outer steps that integrator will integrate
+        """
+        self._testBound()
+        coord = self._system.coordinate_array
+        velocity = self._system.velocity_array
+        inv_mass = force_over_mass_factor / self._system.mass_array
+        sim_interval = self._sim_interval / femtosecond
+        inner_interval = sim_interval / self._num_inner_steps
+        if self._cached_forces is not None and self._cached_forces[0] == self._system.coordinate_version:
+            slow_force, fast_force = self._cached_forces[1:]
+        else:
+            slow_force = self._calculateForces(self._slow_force_group)
+            fast_force = self._calculateForces(self._fast_force_group)
+        for _ in range(num_steps):
+            velocity += 0.5 * sim_interval * slow_force * inv_mass
+            for _ in range(self._num_inner_steps):
+                velocity += 0.5 * inner_interval * fast_force * inv_mass
+                coord += inner_interval * velocity
+                self._system.updateCoordinateVersion()
+                fast_force = self._calculateForces(self._fast_force_group)
+                velocity += 0.5 * inner_interval * fast_force * inv_mass
+            slow_force = self._calculateForces(self._slow_force_group)
+            velocity += 0.5 * sim_interval * slow_force * inv_mass
+        self._cached_forces = (self._system.coordinate_version, slow_force, fast_force)
+        self._system.force_array[:, :] = slow_force + fast_force
+        self._force_coordinate_version = self._system.coordinate_version
+        self._force_group = self._slow_force_group + self._fast_force_group
+
+    @property
+    def num_inner_steps(self):
+        """
+        num_inner_steps gets the number of inner steps in each outer step
+
+        Returns
+        -------
+        int
+            the number of inner steps
+        """
+        return self._num_inner_steps
+
+    @property
+    def fast_force_group(self):
+        """
+        fast_force_group gets the force groups calculated at each inner step
+
+        Returns
+        -------
+        list
+            the force groups of fast forces
+        """
+        return self._fast_force_group
+
+    @property
+    def slow_force_group(self):
+        """
+        slow_force_group gets the force groups calculated at each outer step
+
+        Returns
+        -------
+        list
+            the force groups of slow forces
+        """
+        return self._slow_force_group
+
+    @property
+    def temperature(self):
+        """
+        temperature gets the initial temperature of the system
+
+        Returns
+        -------
+        Quantity
+            the initial temperature
+        """
+        return self._temperature
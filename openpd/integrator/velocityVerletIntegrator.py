@@ -1,12 +1,11 @@
-from time import process_time_ns
 from . import Integrator
 from .. import Ensemble
 from ..unit import *
 from ..unit import Quantity
 
 class VelocityVerletIntegrator(Integrator):
-    def __init__(self, sim_interval, temperature=300) -> None:
-        super().__init__(sim_interval)
+    def __init__(self, sim_interval, temperature=300, num_workers=1, pool_type='process', seed=None) -> None:
+        super().__init__(sim_interval, num_workers, pool_type, seed)
         if isinstance(temperature, Quantity):
             temperature.convertTo(kelvin)
         else:
@@ -18,22 +17,30 @@ class VelocityVerletIntegrator(Integrator):
         self.setVelocityToTemperature(self._temperature)
         
     def step(self, num_steps):
-        cur_step = 0
-        mass = self._system.mass        
-        self.updateForce()
-        while cur_step < num_steps:
-            cur_force = self._system.force
-            self._system.coordinate = (
-                self._system.coordinate +
-                self._system.velocity * self._sim_interval +
-                0.5 * self._system.force / mass * self._sim_interval**2
+        """
+        step integrates ``num_steps`` steps with velocity verlet algorithm
+
+        Forces are calculated once per step, the forces of the last step are reused by the next ``step()`` call
+
+        Parameters
+        ----------
+        num_steps : int
+            the number of steps that integrator will integrate
+        """
+        self._testBound()
+        # Views of System state buffers, all updates are in place
+        coord = self._system.coordinate_array
+        velocity = self._system.velocity_array
+        force = self._system.force_array
+        inv_mass = force_over_mass_factor / self._system.mass_array
+        sim_interval = self._sim_interval / femtosecond
+        self._updateCachedForce()
+        for _ in range(num_steps):
+            cur_accelration = force * inv_mass
+            coord += (
+                velocity * sim_interval +
+                0.5 * cur_accelration * sim_interval**2
             )
+            self._system.updateCoordinateVersion()
             self.updateForce()
-            self._system.velocity = (
-                self._system.velocity + 
-                0.5 * (
-                    cur_force / mass +
-                    self._system.force / mass
-                ) * self._sim_interval
-            )
-            cur_step += 1
\ No newline at end of file
+            velocity += 0.5 * (cur_accelration + force * inv_mass) * sim_interval
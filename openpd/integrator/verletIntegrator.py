@@ -3,39 +3,59 @@ from . import Integrator
 from ..unit import *
 
 class VerletIntegrator(Integrator):
-    def __init__(self, sim_interval) -> None:
+    def __init__(self, sim_interval, num_workers=1, pool_type='process', seed=None) -> None:
         """
         Parameters
         ----------
         sim_interval : int or Quantity, optional
             the step sim_interval of the integrator, by default ``1 * femtosecond``
+        num_workers : int, optional
+            the number of workers used to calculate forces, by default 1
+        pool_type : str, optional
+            the type of workers, ``'process'`` or ``'thread'``, by default 'process'
+        seed : int, optional
+            the seed of the random number generator used for velocity, by default None
 
         Raises
         ------
         ValueError
             When the parameter ``sim_interval`` is ``Quantity`` and ``sim_interval.unit.base_dimension != BaseDimension(time_dimension=1)``
         """        
-        super().__init__(sim_interval)
-    
+        super().__init__(sim_interval, num_workers, pool_type, seed)
+        self._pre_coord = None
+        self._pre_coord_state = None # (coordinate version, sim_interval) of the previous coordinate
+
     def step(self, num_steps:int):
-        cur_step = 0
+        """
+        step integrates ``num_steps`` steps with position verlet algorithm
+
+        Forces are calculated once per step. The previous coordinate is kept between ``step()`` calls 
+        and rebuilt from velocity only when the coordinate of ``System`` has been modified outside
+
+        Parameters
+        ----------
+        num_steps : int
+            the number of steps that integrator will integrate
+        """
+        self._testBound()
+        # Views of System state buffers, all updates are in place
+        coord = self._system.coordinate_array
+        velocity = self._system.velocity_array
+        force = self._system.force_array
+        inv_mass = force_over_mass_factor / self._system.mass_array
+        sim_interval = self._sim_interval / femtosecond
         
-        mass = self._system.mass
-        self.updateForce()
-        pre_coord = self._system.coordinate - self._system.force / mass * self._sim_interval**2
-        next_coord = self._system.coordinate
-        cur_velocity = self._system.velocity
+        self._updateCachedForce()
+        if self._pre_coord_state != (self._system.coordinate_version, sim_interval):
+            # x(t-dt) = x(t) - v(t) * dt + a(t) * dt**2 / 2
+            self._pre_coord = coord - velocity * sim_interval + 0.5 * force * inv_mass * sim_interval**2
+        pre_coord = self._pre_coord
         
-        while cur_step < num_steps:
+        for _ in range(num_steps):
+            next_coord = 2 * coord - pre_coord + force * inv_mass * sim_interval**2
+            velocity[:, :] = (next_coord - pre_coord) / (2 * sim_interval)
+            pre_coord[:, :] = coord
+            coord[:, :] = next_coord
+            self._system.updateCoordinateVersion()
             self.updateForce()
-            
-            next_coord = 2 * self._system.coordinate - pre_coord + self._system.force / mass * self._sim_interval**2
-            cur_velocity = (next_coord - pre_coord) / (2 * self._sim_interval)
-    
-            pre_coord = self._system.coordinate
-            self._system.coordinate = next_coord
-            self._system.velocity = cur_velocity
-            cur_step += 1
-            
-            
-            
\ No newline at end of file
+        self._pre_coord_state = (self._system.coordinate_version, sim_interval)
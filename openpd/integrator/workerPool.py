@@ -0,0 +1,236 @@
+import weakref
+import multiprocessing as mp
+import numpy as np
+from multiprocessing import shared_memory
+from multiprocessing.pool import ThreadPool
+from ..unit import *
+
+POOL_TYPES = ['process', 'thread']
+
+# note: Globals of worker processes, set once by _initProcessWorker when the pool starts
+_worker_ensemble = None
+_worker_shms = None
+_worker_coordinate = None
+_worker_forces = None
+
+def _initProcessWorker(ensemble, coordinate_name, forces_name, num_forces, num_atoms):
+    global _worker_ensemble, _worker_shms, _worker_coordinate, _worker_forces
+    coordinate_shm = shared_memory.SharedMemory(name=coordinate_name)
+    forces_shm = shared_memory.SharedMemory(name=forces_name)
+    _worker_ensemble = ensemble
+    _worker_shms = [coordinate_shm, forces_shm] # Keep references to avoid closing the mapping
+    _worker_coordinate = np.ndarray([num_atoms, 3], dtype=np.float64, buffer=coordinate_shm.buf)
+    _worker_forces = np.ndarray([num_forces, num_atoms, 3], dtype=np.float64, buffer=forces_shm.buf)
+
+def _evaluateForce(ensemble, forces, force_id):
+    energy, forces[force_id, :, :] = ensemble.forces[force_id].calculateReducedEnergyAndForces()
+    return energy
+
+def _evaluateProcessTask(force_id):
+    _worker_ensemble.system.coordinate_array[:, :] = _worker_coordinate
+    _worker_ensemble.system.updateCoordinateVersion()
+    return _evaluateForce(_worker_ensemble, _worker_forces, force_id)
+
+class WorkerPool:
+    def __init__(self, ensemble, num_workers=None, pool_type='process') -> None:
+        """
+        Parameters
+        ----------
+        ensemble : Ensemble
+            the ``Ensemble`` whose forces will be evaluated by the pool
+        num_workers : int, optional
+            the maximum number of workers, by default None, which means ``mp.cpu_count()``.
+            Each ``Force`` is one task of the pool, so the number of workers is capped at ``ensemble.num_forces``
+        pool_type : str, optional
+            the type of workers, ``'process'`` or ``'thread'``, by default 'process'
+
+        Raises
+        ------
+        ValueError
+            When ``pool_type`` is not in ``POOL_TYPES``
+        """
+        if not pool_type.lower() in POOL_TYPES:
+            raise ValueError(
+                '%s pool type is not support. Choose from \n %s'
+                %(pool_type, POOL_TYPES)
+            )
+        self._ensemble = ensemble
+        self._system = ensemble.system
+        self._max_num_workers = mp.cpu_count() if num_workers == None else num_workers
+        self._num_workers = 0
+        self._pool_type = pool_type.lower()
+        self._pool = None
+        self._shms = []
+        self._finalizer = None
+        self._startPool()
+
+    def __repr__(self) -> str:
+        return (
+            '<WorkerPool object: %d %s workers, at 0x%x>'
+            %(self._num_workers, self._pool_type, id(self))
+        )
+
+    __str__ = __repr__
+
+    @staticmethod
+    def _releaseResources(pool, shms):
+        if pool != None:
+            pool.terminate()
+            pool.join()
+        for shm in shms:
+            shm.unlink()
+            try:
+                shm.close()
+            except BufferError:
+                # Views of the buffer are still alive, the mapping is released with them
+                pass
+
+    def _startPool(self):
+        """
+        _startPool allocates the shared buffers and starts the workers
+
+        Each force of ``ensemble`` owns one ``(num_atoms, 3)`` slice of the output buffer,
+        so that workers never write to the same memory
+        """
+        self._num_forces = self._ensemble.num_forces
+        # Workers more than forces would stay idle, as a force is never split between workers
+        self._num_workers = max(1, min(self._max_num_workers, self._num_forces))
+        num_atoms = self._system.num_atoms
+        shape = [max(self._num_forces, 1), num_atoms, 3]
+        if self._pool_type == 'thread':
+            # Threads share the coordinate buffer of System directly
+            self._coordinate = self._system.coordinate_array
+            self._forces = np.zeros(shape)
+            self._pool = ThreadPool(self._num_workers)
+        else:
+            coordinate_shm = shared_memory.SharedMemory(create=True, size=num_atoms*3*8)
+            forces_shm = shared_memory.SharedMemory(create=True, size=int(np.prod(shape))*8)
+            self._shms = [coordinate_shm, forces_shm]
+            self._coordinate = np.ndarray([num_atoms, 3], dtype=np.float64, buffer=coordinate_shm.buf)
+            self._forces = np.ndarray(shape, dtype=np.float64, buffer=forces_shm.buf)
+            self._coordinate[:, :] = self._system.coordinate_array
+            context = mp.get_context('fork') if 'fork' in mp.get_all_start_methods() else mp.get_context()
+            self._pool = context.Pool(
+                self._num_workers, initializer=_initProcessWorker,
+                initargs=(self._ensemble, coordinate_shm.name, forces_shm.name, shape[0], num_atoms)
+            )
+        # Workers and shared memory are released on close(), garbage collection or interpreter exit
+        self._finalizer = weakref.finalize(self, WorkerPool._releaseResources, self._pool, self._shms)
+
+    def _stopPool(self):
+        # Views need to be dropped before the shared memory is closed
+        self._coordinate = None
+        self._forces = None
+        if self._finalizer != None:
+            self._finalizer()
+        self._pool = None
+        self._shms = []
+
+    def close(self):
+        """
+        close stops all workers and releases the shared buffers
+        """
+        self._stopPool()
+
+    def calculateEnergyAndForces(self, force_group=[0]):
+        """
+        calculateEnergyAndForces calculates the potential energy and forces of ``force_group`` with the workers
+
+        Parameters
+        ----------
+        force_group : list, optional
+            the force groups that will be calculated, by default [0]
+
+        Returns
+        -------
+        tuple(Quantity, np.ndarray)
+            - The potential energy of ``force_group``
+            - (num_atoms, 3) float array of force acts on each atom, in unit of ``kilojoule_permol_over_angstrom``
+        """
+        energy, forces = self.calculateReducedEnergyAndForces(force_group)
+        return energy * kilojoule_permol, forces
+
+    def calculateReducedEnergyAndForces(self, force_group=[0]):
+        """
+        calculateReducedEnergyAndForces calculates the potential energy and forces of ``force_group`` with the workers, without ``Quantity``
+
+        Each force is a task of the pool, the results are written into the shared output buffer
+
+        Parameters
+        ----------
+        force_group : list, optional
+            the force groups that will be calculated, by default [0]
+
+        Returns
+        -------
+        tuple(float, np.ndarray)
+            - The potential energy of ``force_group``, in unit of ``kilojoule_permol``
+            - (num_atoms, 3) float array of force acts on each atom, in unit of ``kilojoule_permol_over_angstrom``
+        """
+        if self._pool == None:
+            raise RuntimeError('WorkerPool has been closed')
+        if self._ensemble.num_forces != self._num_forces:
+            # Forces added after the workers started are unknown to them
+            self._stopPool()
+            self._startPool()
+        force_ids = [force.force_id for force in self._ensemble.getForcesByGroup(force_group)]
+        if self._pool_type == 'thread':
+            energies = self._pool.map(
+                lambda force_id: _evaluateForce(self._ensemble, self._forces, force_id), force_ids
+            )
+        else:
+            self._coordinate[:, :] = self._system.coordinate_array
+            energies = self._pool.map(_evaluateProcessTask, force_ids)
+        return sum(energies), self._forces[force_ids, :, :].sum(0)
+
+    def calculateForces(self, force_group=[0]):
+        """
+        calculateForces calculates the forces of ``force_group`` with the workers
+
+        Parameters
+        ----------
+        force_group : list, optional
+            the force groups that will be calculated, by default [0]
+
+        Returns
+        -------
+        np.ndarray
+            (num_atoms, 3) float array of force acts on each atom, in unit of ``kilojoule_permol_over_angstrom``
+        """
+        return self.calculateReducedEnergyAndForces(force_group)[1]
+
+    @property
+    def num_workers(self):
+        """
+        num_workers gets the number of workers, which is capped at the number of forces
+
+        Returns
+        -------
+        int
+            the number of workers
+        """
+        return self._num_workers
+
+    @property
+    def pool_type(self):
+        """
+        pool_type gets the type of workers
+
+        Returns
+        -------
+        str
+            ``'process'`` or ``'thread'``
+        """
+        return self._pool_type
+
+    @property
+    def is_closed(self):
+        """
+        is_closed gets whether the pool has been closed
+
+        Returns
+        -------
+        bool
+            True if the pool has been closed
+        """
+        return self._pool == None
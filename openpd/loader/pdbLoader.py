@@ -170,7 +170,7 @@ class PDBLoader(Loader):
         for i, chain_name in enumerate(self.chain_names):
             # Extrat each peptides' corresponding res_id in the pdb file to extract the coordinate
             res_id = self.sequence_dict[chain_name + 'res_id'] 
-            for (i, peptide) in enumerate(self.system.chains[i].peptides):
+            for (i, peptide) in enumerate(self.system.chains[i].molecules):
                 index = findAll(res_id[i], self._res_id)
                 atom_name = self._atom_name[index[0]:index[-1]+1]
                 coord = self._coord[index[0]:index[-1]+1, :]
@@ -201,7 +201,7 @@ class PDBLoader(Loader):
             chain = Chain()
             sequence = self.sequence_dict[chain_name]
             for peptide_type in sequence:
-                chain.addPeptides(Peptide(peptide_type))
+                chain.addMolecules(Peptide(peptide_type))
             self.system.addChains(chain)
         if is_extract_coordinate:
             self.extractCoordinates()
@@ -69,7 +69,7 @@ class SequenceLoader(Loader):
             if key.upper().startswith('CHAIN'):
                 chain = Chain()
                 for peptide_type in value:
-                    chain.addPeptides(Peptide(peptide_type))
+                    chain.addMolecules(Peptide(peptide_type))
                 self.system.addChains(chain)
         self.guessCoordinates()
         return self.system
\ No newline at end of file
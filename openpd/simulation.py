@@ -1,13 +1,14 @@
-import datetime
+import datetime, heapq, time
 import numpy as np
 from . import Ensemble, Integrator, Dumper
-from . import gcd
 from .unit import *
 
 ENERGY_MINIMIZATION_METHODS = [
     'gd', 'gradient descent',
     'sd', 'steepest descent',
-    'cg', 'conjugate gradient'
+    'cg', 'conjugate gradient',
+    'lbfgs', 'l-bfgs',
+    'fire'
 ]
 
 class Simulation:
@@ -18,6 +19,8 @@ class Simulation:
         self._num_dumpers = 0
         self._dumpers = []
         self._dumper_intervals = []
+        self._callbacks = []
+        self._callback_intervals = []
         self._cur_step = 0
         self._target_step = 0
         self._remain_step = 0
@@ -35,10 +38,32 @@ class Simulation:
     def addDumpers(self, *dumpers):
         for dumper in dumpers:
             self._addDumper(dumper)
-        self._gcd_interval = gcd(*self._dumper_intervals)
         self._start_time = datetime.datetime.now().replace(microsecond=0) # Update start time
-        
-    def dump(self):
+
+    def addCallback(self, callback, interval:int):
+        """
+        addCallback adds a function called every ``interval`` steps during ``step()``
+
+        Callbacks are scheduled with dumpers, the integrator runs uninterrupted between two events
+
+        Parameters
+        ----------
+        callback : function
+            the function called as ``callback(simulation)``
+        interval : int
+            the number of steps between two calls
+
+        Raises
+        ------
+        ValueError
+            When ``interval`` is not positive
+        """
+        if interval < 1:
+            raise ValueError('interval should be positive, instead of %s' %(interval))
+        self._callbacks.append(callback)
+        self._callback_intervals.append(int(interval))
+
+    def _updateTime(self):
         self._cur_time = datetime.datetime.now().replace(microsecond=0)
         self._elapsed_time = self._cur_time - self._start_time
         self._sim_velocity = (
@@ -46,35 +71,153 @@ class Simulation:
         ) # Step / second
         self._remain_time = datetime.timedelta(seconds=int(round(self._remain_step/self._sim_velocity)))
         
+    def dump(self):
+        self._updateTime()
         for i, dumper in enumerate(self._dumpers):
             if self._cur_step % self._dumper_intervals[i] == 0:
                 dumper.dump()
+
+    def _fireEvent(self, event_id):
+        # Dumpers take event ids first, followed by callbacks
+        if not self._ensemble.is_profiling:
+            if event_id < self._num_dumpers:
+                self._dumpers[event_id].dump()
+            else:
+                self._callbacks[event_id - self._num_dumpers](self)
+            return
+        start_time = time.perf_counter()
+        if event_id < self._num_dumpers:
+            self._dumpers[event_id].dump()
+            name = '%s %d' %(type(self._dumpers[event_id]).__name__, event_id)
+        else:
+            self._callbacks[event_id - self._num_dumpers](self)
+            name = 'callback %d' %(event_id - self._num_dumpers)
+        self._ensemble._recordPhase(name, time.perf_counter() - start_time)
+
+    def _integrate(self, num_steps):
+        if not self._ensemble.is_profiling:
+            self._integrator.step(num_steps)
+            return
+        start_time = time.perf_counter()
+        self._integrator.step(num_steps)
+        self._ensemble._recordPhase('integrator', time.perf_counter() - start_time)
+
+    def _createEventQueue(self):
+        """
+        _createEventQueue creates the heap of ``(next step, event id, interval)`` of all dumpers and callbacks
+
+        Events fire at the multiples of their interval, counted from step 0
+        """
+        events = []
+        for event_id, interval in enumerate(self._dumper_intervals + self._callback_intervals):
+            events.append(((self._cur_step // interval + 1) * interval, event_id, interval))
+        heapq.heapify(events)
+        return events
             
+    def flushDumpers(self):
+        """
+        flushDumpers waits for the background writers and writes the buffer of all dumpers to file
+        """
+        for dumper in self._dumpers:
+            dumper.flush()
+
+    def closeDumpers(self):
+        """
+        closeDumpers flushes all dumpers, stops their background writers and closes their files
+        """
+        for dumper in self._dumpers:
+            dumper.close()
+
     def step(self, num_steps):
+        """
+        step integrates ``num_steps`` steps, calling dumpers and callbacks at their intervals
+
+        The integrator runs exactly the steps until the next event of the heap, 
+        so co-prime intervals do not cut the integration into single steps. 
+        All dumpers dump at the first and the last step of each call
+
+        Parameters
+        ----------
+        num_steps : int
+            the number of steps to integrate
+        """
         self._target_step += num_steps
         self._remain_step = num_steps
-        # Dump 0 Step
-        for dumper in self._dumpers:
-            dumper.dump()
-        while self._cur_step < self._target_step:
-            if self._remain_step < self._gcd_interval:
-                # Dump Last Step
-                self._integrator.step(self._gcd_interval)
-                self._cur_step += self._remain_step
-                self._remain_step = 0
-                for dumper in self._dumpers:
-                    dumper.dump()
-            else:
-                self._integrator.step(self._gcd_interval)
-                self._cur_step += self._gcd_interval
-                self._remain_step -= self._gcd_interval
-                self.dump()
+        events = self._createEventQueue()
+        try:
+            # Dump 0 Step
+            for dumper_id in range(self._num_dumpers):
+                self._fireEvent(dumper_id)
+            while self._cur_step < self._target_step:
+                next_step = self._target_step if len(events) == 0 else min(events[0][0], self._target_step)
+                self._integrate(next_step - self._cur_step)
+                self._cur_step = next_step
+                self._remain_step = self._target_step - self._cur_step
+                self._updateTime()
+                is_dumped = [False] * self._num_dumpers
+                while len(events) != 0 and events[0][0] == self._cur_step:
+                    _, event_id, interval = events[0]
+                    self._fireEvent(event_id)
+                    if event_id < self._num_dumpers:
+                        is_dumped[event_id] = True
+                    heapq.heapreplace(events, (self._cur_step + interval, event_id, interval))
+                if self._cur_step == self._target_step:
+                    # Dump Last Step
+                    for dumper_id, is_dumper_dumped in enumerate(is_dumped):
+                        if not is_dumper_dumped:
+                            self._fireEvent(dumper_id)
+        except BaseException:
+            # Write the tail of a crashed run, the original error is raised instead of errors of flushing
+            for dumper in self._dumpers:
+                try:
+                    dumper.flush()
+                except Exception:
+                    pass
+            raise
+        self.flushDumpers()
 
     def minimizeEnergy(
         self, method='gd', max_iteration:int=1000,
-        energy_tolerance=1e-7,
-        alpha=0.001, alpha_range=list(np.arange(-0.01, 0.01+0.0001, 0.0001))
+        energy_tolerance=1e-7, force_tolerance=0.1, max_displacement=0.1,
+        alpha=0.001, alpha_range=list(np.arange(-0.01, 0.01+0.0001, 0.0001)),
+        num_memories=10, time_step=1
     ):
+        """
+        minimizeEnergy minimizes the potential energy of the ensemble
+
+        Parameters
+        ----------
+        method : str, optional
+            the minimization method, choose from ``ENERGY_MINIMIZATION_METHODS``, by default 'gd'
+        max_iteration : int, optional
+            the maximum number of iterations, by default 1000
+        energy_tolerance : float, optional
+            the tolerance of relative energy change between two iterations, by default 1e-7
+        force_tolerance : float, optional
+            'cg', 'lbfgs' and 'fire' stop when the force of every atom is less than it, 
+            in unit of ``kilojoule_permol_over_angstrom``, by default 0.1
+        max_displacement : float, optional
+            the maximum displacement of an atom in one step of 'cg', 'lbfgs' and 'fire', in unit of ``angstrom``, by default 0.1
+        alpha : float, optional
+            the step length of 'gd', by default 0.001
+        alpha_range : list, optional
+            the step lengths scanned by 'sd', by default ``list(np.arange(-0.01, 0.01+0.0001, 0.0001))``
+        num_memories : int, optional
+            the number of correction pairs stored by 'lbfgs', by default 10
+        time_step : float, optional
+            the initial time step of 'fire', in unit of ``femtosecond``, by default 1
+
+        Returns
+        -------
+        dict
+            ``method``, ``num_iterations``, ``num_evaluations``, ``initial_energy`` and ``final_energy``
+            in kilojoule_permol, ``max_force`` in kilojoule_permol_over_angstrom and ``is_converged``
+
+        Raises
+        ------
+        ValueError
+            When ``method`` is not in ``ENERGY_MINIMIZATION_METHODS``
+        """
         if not method.lower() in ENERGY_MINIMIZATION_METHODS:
             raise ValueError(
                 '%s method is not support. Choose from \n %s'
@@ -82,81 +225,274 @@ class Simulation:
             )
         self._max_iteration = max_iteration
         self._energy_tolerance = energy_tolerance
+        self._force_tolerance = force_tolerance
+        self._max_displacement = max_displacement
         self._alpha = alpha # gd
         self._alpha_range = alpha_range # sd
+        self._num_memories = num_memories # lbfgs
+        self._time_step = time_step # fire
+        self._num_evaluations = 0
+        initial_energy = self._ensemble.calculateReducedPotentialEnergy(self._ensemble.force_groups)
         print('Start energy minimization:')
-        print(
-            'Initial potential energy: %.5f kj/mol' 
-            %(self._ensemble.calculatePotentialEnergy()/kilojoule_permol)
-        )
+        print('Initial potential energy: %.5f kj/mol' %(initial_energy))
         if method.lower() == 'gd' or method.lower() == 'gradient descent':
-            self._gradientDescentMinimizer()
+            num_iterations, is_converged = self._gradientDescentMinimizer()
         elif method.lower() == 'sd' or method.lower() == 'steepest descent':
-            self._steepDescentMinimizer()
-        elif method.lower() == 'cg' or method.lower() == 'conjugrate gradient':
-            self._conjugateGradientMinimizer()
+            num_iterations, is_converged = self._steepDescentMinimizer()
+        elif method.lower() == 'cg' or method.lower() == 'conjugate gradient':
+            num_iterations, is_converged = self._conjugateGradientMinimizer()
+        elif method.lower() == 'lbfgs' or method.lower() == 'l-bfgs':
+            num_iterations, is_converged = self._lbfgsMinimizer()
+        elif method.lower() == 'fire':
+            num_iterations, is_converged = self._fireMinimizer()
+        final_energy, forces = self._ensemble.calculateReducedEnergyAndForces(self._ensemble.force_groups)
+        max_force = np.sqrt((forces**2).sum(1)).max()
+        if num_iterations >= self._max_iteration:
+            print('Max number of iterations %d has achieved.' %(self._max_iteration))
+        print('Final potential energy: %.5f kj/mol' %(final_energy))
+        print(
+            'Iterations: %d, energy evaluations: %d, max force: %.5f kj/mol/A' 
+            %(num_iterations, self._num_evaluations, max_force)
+        )
+        return {
+            'method': method.lower(),
+            'num_iterations': num_iterations,
+            'num_evaluations': self._num_evaluations,
+            'initial_energy': initial_energy,
+            'final_energy': final_energy,
+            'max_force': max_force,
+            'is_converged': is_converged
+        }
+
+    def _isEnergyConverged(self, pre_energy, cur_energy):
+        energy_error = np.abs((cur_energy - pre_energy) * 2 / (cur_energy + pre_energy))
+        if energy_error < self._energy_tolerance:
+            print('Penultimate potential energy: %.5f kj/mol' %(pre_energy))
+            print('Energy error: %s < %e' %(energy_error, self._energy_tolerance))
+            return True
+        return False
+
+    def _isForceConverged(self, gradient):
+        max_force = np.sqrt((gradient.reshape(-1, 3)**2).sum(1)).max()
+        if max_force < self._force_tolerance:
+            print('Max force: %s < %e' %(max_force, self._force_tolerance))
+            return True
+        return False
 
     def _gradientDescentMinimizer(self):
         cur_iteration = 0
-        pre_energy = self._ensemble.calculatePotentialEnergy()
+        pre_energy = self._ensemble.calculateReducedPotentialEnergy(self._ensemble.force_groups)
+        system = self._ensemble.system
         while cur_iteration < self._max_iteration:
-            for atom in self._ensemble.system.topology.atoms:
-                atom.force = self._ensemble.calculateAtomForce(atom.atom_id)
-                atom.coordinate += self._alpha * atom.force / kilojoule_permol_over_angstrom
-            cur_energy = self._ensemble.calculatePotentialEnergy()
-            energy_error = np.abs((cur_energy - pre_energy) * 2 / (cur_energy + pre_energy))
-            if energy_error < self._energy_tolerance:
-                print('Penultimate potential energy: %.5f kj/mol' %(pre_energy/kilojoule_permol))
-                print('Final potential energy: %.5f kj/mol' %(cur_energy/kilojoule_permol))
-                print('Energy error: %s < %e' %(energy_error, self._energy_tolerance))
-                return None
+            system.force_array[:, :] = self._ensemble.calculateForces(self._ensemble.force_groups)
+            system.coordinate_array[:, :] += self._alpha * system.force_array
+            system.updateCoordinateVersion()
+            cur_energy = self._ensemble.calculateReducedPotentialEnergy(self._ensemble.force_groups)
+            self._num_evaluations += 2
             cur_iteration += 1
-        print('Max number of iterations %d has achieved.' %(self._max_iteration))
-        print(
-            'Final potential energy: %.5f kj/mol' 
-            %(self._ensemble.calculatePotentialEnergy()/kilojoule_permol)
-        )
+            if self._isEnergyConverged(pre_energy, cur_energy):
+                return cur_iteration, True
+            pre_energy = cur_energy
+        return cur_iteration, False
     
     def _steepDescentMinimizer(self):
         cur_iteration = 0
-        pre_energy = self._ensemble.calculatePotentialEnergy()
+        pre_energy = self._ensemble.calculateReducedPotentialEnergy(self._ensemble.force_groups)
+        system = self._ensemble.system
+        # Step length of alpha is measured in angstrom / (kcal/mol/A)
+        force_factor = kilojoule_permol_over_angstrom / kilocalorie_permol_over_angstrom
         while cur_iteration < self._max_iteration:
             # Update force
-            for atom in self._ensemble.system.topology.atoms:
-                atom.force = self._ensemble.calculateAtomForce(atom.atom_id)
+            system.force_array[:, :] = self._ensemble.calculateForces(self._ensemble.force_groups)
             # Search minima
             energy_range = []
-            cur_coord = self._ensemble.system.coordinate
+            cur_coord = system.coordinate_array.copy()
+            direction = system.force_array * force_factor
             for alpha in self._alpha_range:
-                self._ensemble.system.coordinate = (
-                    cur_coord + self._ensemble.system.force /
-                    kilocalorie_permol_over_angstrom * alpha
-                )
-                energy_range.append(self._ensemble.calculatePotentialEnergy()/kilojoule_permol)
+                system.coordinate_array[:, :] = cur_coord + direction * alpha
+                system.updateCoordinateVersion()
+                energy_range.append(self._ensemble.calculateReducedPotentialEnergy(self._ensemble.force_groups))
             target_alpha = self._alpha_range[energy_range.index(min(energy_range))]
             # Update
-            self._ensemble.system.coordinate = (
-                cur_coord + self._ensemble.system.force / 
-                kilocalorie_permol_over_angstrom * target_alpha
-            )
-            cur_energy = self._ensemble.calculatePotentialEnergy()
-            # Calculate Error
-            energy_error = np.abs((cur_energy - pre_energy) * 2 / (cur_energy + pre_energy))
-            if energy_error < self._energy_tolerance:
-                print('Penultimate potential energy: %.5f kj/mol' %(pre_energy/kilojoule_permol))
-                print('Final potential energy: %.5f kj/mol' %(cur_energy/kilojoule_permol))
-                print('Energy error: %s < %e' %(energy_error, self._energy_tolerance))
-                return None
+            system.coordinate_array[:, :] = cur_coord + direction * target_alpha
+            system.updateCoordinateVersion()
+            cur_energy = self._ensemble.calculateReducedPotentialEnergy(self._ensemble.force_groups)
+            self._num_evaluations += len(self._alpha_range) + 2
             cur_iteration += 1
-        print('Max number of iterations %d has achieved.' %(self._max_iteration))
-        print(
-            'Final potential energy: %.5f kj/mol' 
-            %(self._ensemble.calculatePotentialEnergy()/kilojoule_permol)
-        )
+            # Calculate Error
+            if self._isEnergyConverged(pre_energy, cur_energy):
+                return cur_iteration, True
+            pre_energy = cur_energy
+        return cur_iteration, False
+
+    def _evaluateGradient(self, coord):
+        """
+        _evaluateGradient sets the coordinate of system and calculates the energy and gradient in one pass
+
+        Parameters
+        ----------
+        coord : np.ndarray
+            (num_atoms*3, ) flat coordinate, in unit of angstrom
+
+        Returns
+        -------
+        tuple(float, np.ndarray)
+            - The potential energy, in unit of ``kilojoule_permol``
+            - (num_atoms*3, ) flat gradient, the opposite of forces, in unit of ``kilojoule_permol_over_angstrom``
+        """
+        system = self._ensemble.system
+        system.coordinate_array[:, :] = coord.reshape(-1, 3)
+        system.updateCoordinateVersion()
+        energy, forces = self._ensemble.calculateReducedEnergyAndForces(self._ensemble.force_groups)
+        system.force_array[:, :] = forces
+        self._num_evaluations += 1
+        return energy, -forces.flatten()
+
+    def _lineSearch(self, coord, energy, gradient, direction, step=1, c1=1e-4, max_trials=20):
+        """
+        _lineSearch searches the step length along ``direction`` by backtracking with the Armijo condition
+
+        The initial step length is limited so that no atom moves more than ``max_displacement``.
+        As tabulated forces are not the exact gradient of tabulated energies, 
+        the search may fail close to the minimum even along forces
+
+        Returns
+        -------
+        tuple or None
+            - (coord, energy, gradient) of accepted point
+            - None, if ``direction`` is not a descent direction or no step length is accepted
+        """
+        slope = np.dot(gradient, direction)
+        if slope >= 0:
+            return None
+        max_length = np.sqrt((direction.reshape(-1, 3)**2).sum(1)).max()
+        step = min(step, self._max_displacement / max_length)
+        for _ in range(max_trials):
+            new_coord = coord + step * direction
+            new_energy, new_gradient = self._evaluateGradient(new_coord)
+            if new_energy <= energy + c1 * step * slope:
+                return new_coord, new_energy, new_gradient
+            step *= 0.5
+        return None
 
     def _conjugateGradientMinimizer(self):
-        pass
+        # Polak-Ribiere conjugate gradient, restarted with steepest descent when the search fails
+        cur_iteration = 0
+        coord = self._ensemble.system.coordinate_array.flatten()
+        energy, gradient = self._evaluateGradient(coord)
+        direction = -gradient
+        while cur_iteration < self._max_iteration:
+            if self._isForceConverged(gradient):
+                return cur_iteration, True
+            result = self._lineSearch(coord, energy, gradient, direction)
+            if result == None:
+                if np.array_equal(direction, -gradient):
+                    self._evaluateGradient(coord) # Restore the last accepted point
+                    print('Line search failed along steepest descent direction')
+                    return cur_iteration, False
+                direction = -gradient
+                continue
+            coord, new_energy, new_gradient = result
+            cur_iteration += 1
+            if self._isEnergyConverged(energy, new_energy):
+                return cur_iteration, True
+            beta = max(0, np.dot(new_gradient, new_gradient - gradient) / np.dot(gradient, gradient))
+            direction = -new_gradient + beta * direction
+            if np.dot(direction, new_gradient) >= 0:
+                direction = -new_gradient
+            energy, gradient = new_energy, new_gradient
+        return cur_iteration, False
+
+    def _lbfgsMinimizer(self):
+        cur_iteration = 0
+        coord = self._ensemble.system.coordinate_array.flatten()
+        energy, gradient = self._evaluateGradient(coord)
+        s_list, y_list = [], []
+        while cur_iteration < self._max_iteration:
+            if self._isForceConverged(gradient):
+                return cur_iteration, True
+            # Two loop recursion
+            q = gradient.copy()
+            rho_list = [1 / np.dot(y, s) for s, y in zip(s_list, y_list)]
+            alpha_list = []
+            for s, y, rho in zip(s_list[::-1], y_list[::-1], rho_list[::-1]):
+                alpha = rho * np.dot(s, q)
+                q -= alpha * y
+                alpha_list.append(alpha)
+            if len(s_list) != 0:
+                q *= np.dot(s_list[-1], y_list[-1]) / np.dot(y_list[-1], y_list[-1])
+            for s, y, rho, alpha in zip(s_list, y_list, rho_list, alpha_list[::-1]):
+                beta = rho * np.dot(y, q)
+                q += (alpha - beta) * s
+            result = self._lineSearch(coord, energy, gradient, -q)
+            if result == None:
+                if len(s_list) == 0:
+                    self._evaluateGradient(coord) # Restore the last accepted point
+                    print('Line search failed along steepest descent direction')
+                    return cur_iteration, False
+                s_list, y_list = [], []
+                continue
+            new_coord, new_energy, new_gradient = result
+            cur_iteration += 1
+            if self._isEnergyConverged(energy, new_energy):
+                return cur_iteration, True
+            s, y = new_coord - coord, new_gradient - gradient
+            if np.dot(s, y) > 1e-10:
+                # Pairs violating the curvature condition are skipped to keep the inverse Hessian positive definite
+                s_list.append(s)
+                y_list.append(y)
+                if len(s_list) > self._num_memories:
+                    s_list.pop(0)
+                    y_list.pop(0)
+            coord, energy, gradient = new_coord, new_energy, new_gradient
+        return cur_iteration, False
         
+    def _fireMinimizer(
+        self, num_delay_steps=5, time_step_increase=1.1, time_step_decrease=0.5,
+        alpha_start=0.1, alpha_decrease=0.99, max_time_step_ratio=10
+    ):
+        # Fast inertial relaxation engine, Bitzek E., et al. Phys. Rev. Lett. 97, 170201 (2006)
+        cur_iteration = 0
+        system = self._ensemble.system
+        # Velocity is a private buffer, so that velocity of system is not changed
+        coord = system.coordinate_array
+        velocity = np.zeros_like(system.velocity_array)
+        force = system.force_array
+        inv_mass = force_over_mass_factor / system.mass_array
+        time_step, max_time_step = self._time_step, self._time_step * max_time_step_ratio
+        alpha, num_positive_steps = alpha_start, 0
+        energy, force[:, :] = self._ensemble.calculateReducedEnergyAndForces(self._ensemble.force_groups)
+        self._num_evaluations += 1
+        while cur_iteration < self._max_iteration:
+            if self._isForceConverged(force.flatten()):
+                return cur_iteration, True
+            power = (force * velocity).sum()
+            if power > 0:
+                # Mix velocity towards the direction of force
+                velocity[:, :] = (
+                    (1 - alpha) * velocity + 
+                    alpha * np.sqrt((velocity**2).sum() / (force**2).sum()) * force
+                )
+                num_positive_steps += 1
+                if num_positive_steps > num_delay_steps:
+                    time_step = min(time_step * time_step_increase, max_time_step)
+                    alpha *= alpha_decrease
+            else:
+                velocity[:, :] = 0
+                time_step *= time_step_decrease
+                alpha, num_positive_steps = alpha_start, 0
+            # Semi-implicit Euler step, displacement of each atom is limited to max_displacement
+            velocity += force * inv_mass * time_step
+            displacement = velocity * time_step
+            displacement_norm = np.sqrt((displacement**2).sum(1, keepdims=True))
+            displacement *= np.minimum(1, self._max_displacement / np.maximum(displacement_norm, 1e-30))
+            coord += displacement
+            system.updateCoordinateVersion()
+            energy, force[:, :] = self._ensemble.calculateReducedEnergyAndForces(self._ensemble.force_groups)
+            self._num_evaluations += 1
+            cur_iteration += 1
+        return cur_iteration, False
+
     @property
     def num_dumpers(self):
         return self._num_dumpers
@@ -164,6 +500,10 @@ class Simulation:
     @property
     def dumpers(self):
         return self._dumpers
+
+    @property
+    def callbacks(self):
+        return self._callbacks
                 
     @property
     def cur_step(self):
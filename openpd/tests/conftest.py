@@ -4,6 +4,7 @@ test_order = [
      'baseDimension',
      'unit',
      'quantity',
+     'quantityArray',
      'unitDefinition',
      'judgement',
      'locate',
@@ -19,20 +20,34 @@ test_order = [
      'pdbLoader',
      'sequenceLoader',
      'force',
+     'lookupTable',
+     'forceFieldCache',
+     'neighborList',
      'pdffNonBondedForceField',
      'pdffNonBondedForce',
      'pdffBondForceField',
      'pdffBondForce',
      'pdffTorsionForceField',
      'pdffTorsionForce',
+     'pdffHydroFieldForceField',
+     'pdffHydroFieldForce',
      'rigidBondForce',
      'ensemble',
      'forceEncoder',
+     'workerPool',
      'integrator',
      'verletIntegrator',
+     'leapFrogIntegrator',
+     'respaIntegrator',
+     'brownianIntegrator',
+     'langevinIntegrator',
+     'mcmcIntegrator',
      'simulation',
+     'unitModeBenchmark',
      'logDumper',
      'snapshotDumper',
+     'trajectoryDumper',
+     'trajectoryFile',
      'xyzDumper'
      'snapshotVisualizer'
 ]
@@ -1,4 +1,5 @@
-import pytest
+import pytest, pickle
+from copy import deepcopy
 from ..unit import BaseDimension
 
 class TestUnit:
@@ -81,6 +82,16 @@ class TestUnit:
         assert length == square.sqrt()
         assert volume.sqrt() == BaseDimension(length_dimension=1.5)
 
+    def test_interned(self):
+        length = BaseDimension(length_dimension=1)
+        assert length is BaseDimension(length_dimension=1)
+        assert length is BaseDimension(length_dimension=2).sqrt()
+        assert length * length is BaseDimension(length_dimension=2)
+        assert deepcopy(length) is length
+        assert pickle.loads(pickle.dumps(length)) is length
+        with pytest.raises(AttributeError):
+            length._length_dimension = 2
+
     def test_generateDimensionName(self):
         dimension = BaseDimension()
         assert dimension.name == ''
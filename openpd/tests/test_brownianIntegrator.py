@@ -0,0 +1,68 @@
+import pytest, os
+import numpy as np
+from .. import BrownianIntegrator, SequenceLoader, ForceEncoder, Ensemble, isArrayEqual
+from ..unit import *
+from ..exceptions import DismatchedDimensionError
+
+cur_dir = os.path.abspath(os.path.dirname(os.path.abspath(__file__)))
+
+class TestBrownianIntegrator:
+    def setup(self):
+        self.integrator = BrownianIntegrator(1, 0.01, 300, seed=1)
+        self.system = SequenceLoader(os.path.join(cur_dir, 'data/testForceEncoder.json')).createSystem()
+        ensemble = ForceEncoder(self.system).createEnsemble()
+        self.integrator._bindEnsemble(ensemble)
+
+    def teardown(self):
+        self.integrator = None
+
+    def test_attributes(self):
+        assert self.integrator.sim_interval == 1 * femtosecond
+        assert self.integrator.dumpping_factor == 0.01 / femtosecond
+        assert self.integrator.temperature == 300 * kelvin
+        assert self.integrator._is_bound == True
+        assert self.integrator.calculateKineticEnergy() == 0 * kilojoule_permol
+
+    def test_exceptions(self):
+        with pytest.raises(DismatchedDimensionError):
+            BrownianIntegrator(1, 0.01*femtosecond, 300)
+
+        with pytest.raises(DismatchedDimensionError):
+            BrownianIntegrator(1, 0.01, 300*femtosecond)
+
+    def test_step(self):
+        version = self.system.coordinate_version
+        self.integrator.step(10)
+        assert self.system.coordinate_version == version + 10
+        assert np.isfinite(self.system.coordinate_array).all()
+
+    def test_seed(self):
+        coordinates = []
+        for _ in range(2):
+            # The initial coordinate of a SequenceLoader system is random
+            system = SequenceLoader(os.path.join(cur_dir, 'data/testForceEncoder.json')).createSystem()
+            system.coordinate_array[:, :] = self.system.coordinate_array
+            integrator = BrownianIntegrator(1, 0.01, 300, seed=10)
+            integrator._bindEnsemble(ForceEncoder(system).createEnsemble())
+            integrator.step(10)
+            coordinates.append(system.coordinate_array.copy())
+        assert isArrayEqual(coordinates[0], coordinates[1])
+
+    def test_diffusion(self):
+        # Free atoms diffuse with D = kT / (m * gamma), mean square displacement is 2Dt per dimension
+        system = SequenceLoader(os.path.join(cur_dir, 'data/testForceEncoder.json')).createSystem()
+        integrator = BrownianIntegrator(1, 0.01, 300, seed=1)
+        integrator._bindEnsemble(Ensemble(system))
+        num_steps, num_repeats = 100, 200
+        origin_coordinate = system.coordinate_array.copy()
+        square_displacement = []
+        for _ in range(num_repeats):
+            system.coordinate_array[:, :] = origin_coordinate
+            integrator.step(num_steps)
+            square_displacement.append((system.coordinate_array - origin_coordinate)**2)
+        diffusion = (
+            integrator._getReducedThermalEnergy(300 * kelvin) / 
+            (system.mass_array * 0.01) / mass_velocity_square_factor
+        )
+        ratio = np.mean(square_displacement, 0) / (2 * diffusion * num_steps)
+        assert ratio.mean() == pytest.approx(1, abs=0.1)
@@ -1,7 +1,7 @@
 import pytest, os
 import numpy as np
 from .. import CenterConstraintForce, SequenceLoader, Ensemble
-from .. import isArrayEqual, getBond, getUnitVec
+from .. import isAlmostEqual, isArrayEqual, isArrayAlmostEqual, getBond, getUnitVec
 from ..unit import *
 from ..exceptions import NonboundError, RebindError
 
@@ -52,7 +52,7 @@ class TestCenterConstraintForce:
             mass_center += atom.mass * atom.coordinate
             total_mass += atom.mass
         mass_center /= total_mass
-        assert isArrayEqual(
+        assert isArrayAlmostEqual(
             self.force.calculateMassCenter(),
             mass_center
         )
@@ -65,8 +65,8 @@ class TestCenterConstraintForce:
             cur_center += atom.mass * atom.coordinate
             total_mass += atom.mass
         cur_center /= total_mass
-        assert (
-            self.force.calculatePotentialEnergy() == 
+        assert isAlmostEqual(
+            self.force.calculatePotentialEnergy(),
             0.5 * 100 * kilojoule_permol / angstrom**2 * getBond(
                 cur_center, self.force.origin_center
             )**2
@@ -87,7 +87,47 @@ class TestCenterConstraintForce:
             ) * atom0.mass / total_mass
         )
         vec0 = getUnitVec(self.force.origin_center - cur_center)
-        assert isArrayEqual(
+        assert isArrayAlmostEqual(
             self.force.calculateAtomForce(0),
             force0 * vec0
-        )
\ No newline at end of file
+        )
+
+    def test_calculateEnergyAndForces(self):
+        self.force.bindEnsemble(self.ensemble)
+        energy, forces = self.force.calculateEnergyAndForces()
+
+        assert energy / kilojoule_permol == pytest.approx(
+            self.force.calculatePotentialEnergy() / kilojoule_permol
+        )
+        assert forces.shape == (self.system.num_atoms, 3)
+        for atom in self.system.atoms:
+            assert np.allclose(
+                forces[atom.atom_id, :],
+                [i / kilojoule_permol_over_angstrom for i in self.force.calculateAtomForce(atom.atom_id)]
+            )
+
+    def test_massCenterCache(self):
+        self.force.bindEnsemble(self.ensemble)
+        mass_center = self.force.calculateMassCenter()
+        version = self.system.coordinate_version
+        assert self.force._mass_center_version == version
+
+        # In place modification is only seen after updating the version
+        self.system.coordinate_array[:, :] += 1
+        assert isArrayEqual(self.force.calculateMassCenter(), mass_center)
+        self.system.updateCoordinateVersion()
+        assert self.system.coordinate_version == version + 1
+        assert isArrayAlmostEqual(self.force.calculateMassCenter(), mass_center + 1 * angstrom)
+
+        self.system.atoms[0].coordinate = self.system.atoms[0].coordinate + 1 * angstrom
+        assert self.system.coordinate_version == version + 2
+        self.system.coordinate = self.system.coordinate - 1 * angstrom
+        assert self.system.coordinate_version == version + 3
+
+        # The reduced path always recalculates the mass center
+        self.system.coordinate_array[:, :] += 1
+        energy, forces = self.force.calculateReducedEnergyAndForces()
+        assert isArrayAlmostEqual(
+            self.force.calculateMassCenter(), 
+            (self.system.coordinate_array * self.system.mass_array).sum(0) / self.system.mass_array.sum() * angstrom
+        )
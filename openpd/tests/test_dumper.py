@@ -1,7 +1,8 @@
-import pytest, os
-from .. import Dumper
+import pytest, os, gc
+from .. import Dumper, XYZDumper
 from .. import SequenceLoader, ForceEncoder, VelocityVerletIntegrator, Simulation
 from ..exceptions import NonboundError, RebindError
+from ..dumper.dumper import _OPEN_DUMPERS, _closeDumpers
 
 cur_dir = os.path.abspath(os.path.dirname(os.path.abspath(__file__)))
 
@@ -46,4 +47,114 @@ class TestDumper:
         with pytest.raises(NotImplementedError):
             self.dumper.dump()
     
-    
\ No newline at end of file
+    def test_flush(self):
+        system = SequenceLoader(os.path.join(cur_dir, 'data/testSimulation.json')).createSystem()
+        ensemble = ForceEncoder(system).createEnsemble()
+        integrator = VelocityVerletIntegrator(1)
+        simulation = Simulation(ensemble, integrator)
+        output_file = os.path.join(cur_dir, 'output/outputXYZDumper.xyz')
+        dumper = XYZDumper(output_file, 1, buffer_size=1024**2)
+        dumper.bindSimulation(simulation)
+        dumper.dump()
+        assert os.path.getsize(output_file) == 0
+        dumper.flush()
+        with open(output_file, 'r') as io:
+            lines = io.readlines()
+        assert len(lines) == system.num_atoms + 2
+        assert lines[1] == 'Frame 0\n'
+        dumper.close()
+        dumper.close()
+
+    def test_background(self):
+        system = SequenceLoader(os.path.join(cur_dir, 'data/testSimulation.json')).createSystem()
+        ensemble = ForceEncoder(system).createEnsemble()
+        integrator = VelocityVerletIntegrator(1)
+        simulation = Simulation(ensemble, integrator)
+        output_files = [
+            os.path.join(cur_dir, 'output/outputXYZDumper.xyz'),
+            os.path.join(cur_dir, 'output/outputBackgroundDumper.xyz')
+        ]
+        simulation.addDumpers(
+            XYZDumper(output_files[0], 5),
+            XYZDumper(output_files[1], 5, is_background=True, max_queue_size=2)
+        )
+        assert simulation.dumpers[1].is_background
+        simulation.step(50)
+        with open(output_files[0], 'r') as io:
+            foreground = io.read()
+        with open(output_files[1], 'r') as io:
+            background = io.read()
+        assert foreground == background
+        assert foreground.count('Frame') == 11
+        simulation.closeDumpers()
+
+    def test_backgroundError(self):
+        system = SequenceLoader(os.path.join(cur_dir, 'data/testSimulation.json')).createSystem()
+        ensemble = ForceEncoder(system).createEnsemble()
+        integrator = VelocityVerletIntegrator(1)
+        simulation = Simulation(ensemble, integrator)
+        dumper = XYZDumper(os.path.join(cur_dir, 'output/outputXYZDumper.xyz'), 1, is_background=True)
+        dumper.bindSimulation(simulation)
+        dumper._formatSnapshot = lambda snapshot: 1 / 0
+        dumper.dump()
+        with pytest.raises(ZeroDivisionError):
+            dumper.flush()
+        dumper.close()
+
+    def test_flushOnError(self):
+        system = SequenceLoader(os.path.join(cur_dir, 'data/testSimulation.json')).createSystem()
+        ensemble = ForceEncoder(system).createEnsemble()
+        integrator = VelocityVerletIntegrator(1)
+        simulation = Simulation(ensemble, integrator)
+        output_file = os.path.join(cur_dir, 'output/outputXYZDumper.xyz')
+        simulation.addDumpers(XYZDumper(output_file, 1, buffer_size=1024**2, is_background=True))
+        step = integrator.step
+        def crashedStep(num_steps):
+            if simulation.cur_step == 10:
+                raise RuntimeError('Crash')
+            step(num_steps)
+        integrator.step = crashedStep
+        with pytest.raises(RuntimeError):
+            simulation.step(20)
+        with open(output_file, 'r') as io:
+            assert io.read().count('Frame') == 11
+        simulation.closeDumpers()
+
+    def test_closeDumpers(self):
+        system = SequenceLoader(os.path.join(cur_dir, 'data/testSimulation.json')).createSystem()
+        ensemble = ForceEncoder(system).createEnsemble()
+        integrator = VelocityVerletIntegrator(1)
+        simulation = Simulation(ensemble, integrator)
+        output_file = os.path.join(cur_dir, 'output/outputXYZDumper.xyz')
+        dumper = XYZDumper(output_file, 1, buffer_size=1024**2)
+        dumper.bindSimulation(simulation)
+        assert dumper in _OPEN_DUMPERS
+        dumper.close()
+        assert not dumper in _OPEN_DUMPERS
+        # Exit hook closes open dumpers and writes the tail of buffer
+        dumper = XYZDumper(output_file, 1, buffer_size=1024**2)
+        dumper.bindSimulation(simulation)
+        dumper.dump()
+        _closeDumpers()
+        assert not dumper in _OPEN_DUMPERS
+        assert dumper._io.closed
+        with open(output_file, 'r') as io:
+            assert io.read().count('Frame') == 1
+        # Closed dumpers are released by the exit hook
+        num_open_dumpers = len(_OPEN_DUMPERS)
+        for _ in range(10):
+            dumper = XYZDumper(output_file, 1)
+            dumper.bindSimulation(simulation)
+            dumper.close()
+        assert len(_OPEN_DUMPERS) == num_open_dumpers
+        # Dumpers dropped without close() are kept until exit, so the tail of buffer is not lost
+        dumper = XYZDumper(output_file, 1, buffer_size=1024**2)
+        dumper.bindSimulation(simulation)
+        dumper.dump()
+        dumper = None
+        gc.collect()
+        assert len(_OPEN_DUMPERS) == num_open_dumpers + 1
+        _closeDumpers()
+        assert len(_OPEN_DUMPERS) == 0
+        with open(output_file, 'r') as io:
+            assert io.read().count('Frame') == 1
@@ -1,6 +1,7 @@
 import pytest, os
 import numpy as np
 from .. import SequenceLoader, Ensemble, PDFFNonBondedForce, PDFFTorsionForce
+from .. import PDFFBondForce, CenterConstraintForce
 from .. import isArrayEqual
 from ..unit import *
 
@@ -83,4 +84,134 @@ class TestEnsemble:
         assert isArrayEqual(
             self.ensemble.calculateAtomForce(1), 
             force1.calculateAtomForce(1) + force2.calculateAtomForce(1)
-        )
\ No newline at end of file
+        )
+
+    def test_calculateEnergyAndForces(self):
+        force1 = PDFFNonBondedForce(cutoff_radius=12)
+        force2 = PDFFTorsionForce()
+        self.ensemble.addForces(force1, force2)
+        energy, forces = self.ensemble.calculateEnergyAndForces()
+
+        assert energy / kilojoule_permol == pytest.approx(
+            self.ensemble.calculatePotentialEnergy() / kilojoule_permol
+        )
+        assert forces.shape == (self.ensemble.system.num_atoms, 3)
+        assert np.allclose(
+            forces, force1.calculateEnergyAndForces()[1] + force2.calculateEnergyAndForces()[1]
+        )
+        assert np.allclose(self.ensemble.calculateForces(), forces)
+        assert np.allclose(
+            forces[1, :], 
+            [i / kilojoule_permol_over_angstrom for i in self.ensemble.calculateAtomForce(1)]
+        )
+
+    def test_calculateReducedEnergyAndForces(self):
+        force1 = PDFFNonBondedForce(cutoff_radius=12)
+        force2 = PDFFTorsionForce()
+        self.ensemble.addForces(force1, force2)
+        energy, forces = self.ensemble.calculateReducedEnergyAndForces()
+
+        assert isinstance(energy, float)
+        assert energy == pytest.approx(self.ensemble.calculatePotentialEnergy() / kilojoule_permol)
+        assert self.ensemble.calculateReducedPotentialEnergy() == pytest.approx(energy)
+        assert np.allclose(forces, self.ensemble.calculateEnergyAndForces()[1])
+        assert self.ensemble.calculateReducedEnergyAndForces([1])[0] == 0
+
+    def test_calculateReducedLocalEnergy(self):
+        self.ensemble.addForces(
+            PDFFNonBondedForce(cutoff_radius=12), PDFFBondForce(), 
+            PDFFTorsionForce(), CenterConstraintForce()
+        )
+        coord = self.ensemble.system.coordinate_array
+        random_state = np.random.RandomState(1)
+        for atom_ids in [[0], [1], [2, 5], np.arange(self.ensemble.system.num_atoms)]:
+            energy = self.ensemble.calculateReducedPotentialEnergy()
+            local_energy = self.ensemble.calculateReducedLocalEnergy(atom_ids)
+            coord[atom_ids, :] += random_state.randn(len(atom_ids), 3) * 0.5
+            self.ensemble.system.updateCoordinateVersion()
+            assert (
+                self.ensemble.calculateReducedLocalEnergy(atom_ids) - local_energy ==
+                pytest.approx(self.ensemble.calculateReducedPotentialEnergy() - energy)
+            )
+        assert self.ensemble.calculateReducedLocalEnergy([0], [1]) == 0
+
+    def test_calculateReducedForceEnergyAndForces(self):
+        force1 = PDFFNonBondedForce(cutoff_radius=12)
+        force2 = PDFFTorsionForce()
+        self.ensemble.addForces(force1, force2)
+        calculate = force1.calculateReducedEnergyAndForces
+        num_calls = []
+        def countedCalculate():
+            num_calls.append(1)
+            return calculate()
+        force1.calculateReducedEnergyAndForces = countedCalculate
+        energy, forces = self.ensemble.calculateReducedForceEnergyAndForces(0)
+        assert energy == pytest.approx(calculate()[0])
+        assert np.allclose(forces, calculate()[1])
+        with pytest.raises(ValueError):
+            forces[0, 0] = 1
+        # Consumers at the same coordinate share one calculation
+        self.ensemble.calculateReducedPotentialEnergy()
+        self.ensemble.calculateForces()
+        self.ensemble.calculateAtomForce(1)
+        assert force1.potential_energy / kilojoule_permol == pytest.approx(energy)
+        assert len(num_calls) == 1
+        self.ensemble.system.coordinate_array[:, :] += 0.1
+        self.ensemble.system.updateCoordinateVersion()
+        self.ensemble.calculateReducedPotentialEnergy()
+        assert len(num_calls) == 2
+        self.ensemble.clearCache()
+        self.ensemble.calculateReducedPotentialEnergy()
+        assert len(num_calls) == 3
+
+    def test_calculateGeometry(self):
+        system = self.ensemble.system
+        coord = system.coordinate_array
+        vec, bond_length = self.ensemble.calculateBondGeometry()
+        for bond_id, bond in enumerate(system.topology.bonds):
+            assert np.allclose(vec[bond_id], coord[bond[0].atom_id] - coord[bond[1].atom_id])
+            assert bond_length[bond_id] == pytest.approx(np.sqrt((vec[bond_id]**2).sum()))
+        assert self.ensemble.calculateBondGeometry()[1] is bond_length
+        torsion_angle, gradient = self.ensemble.calculateTorsionGeometry()
+        assert torsion_angle.shape[0] == system.topology.num_torsions
+        assert gradient.shape == (system.topology.num_torsions, 4, 3)
+        coord[:, :] *= 1.1
+        system.updateCoordinateVersion()
+        assert np.allclose(self.ensemble.calculateBondGeometry()[1], bond_length * 1.1)
+        assert np.allclose(self.ensemble.calculateTorsionGeometry()[0], torsion_angle)
+
+    def test_profile(self):
+        force1 = PDFFNonBondedForce(cutoff_radius=12)
+        force2 = PDFFTorsionForce()
+        self.ensemble.addForces(force1, force2)
+        assert not self.ensemble.is_profiling
+        self.ensemble.calculateReducedEnergyAndForces()
+        assert self.ensemble.getProfile() == {'forces': {}, 'phases': {}}
+
+        self.ensemble.enableProfiling()
+        self.ensemble.system.updateCoordinateVersion()
+        self.ensemble.calculateReducedEnergyAndForces()
+        self.ensemble.calculateReducedPotentialEnergy()
+        self.ensemble.calculateReducedLocalEnergy([1])
+        profile = self.ensemble.getProfile()['forces']
+        assert profile[0]['name'] == 'PDFFNonBondedForce'
+        assert profile[1]['name'] == 'PDFFTorsionForce'
+        assert profile[0]['force_group'] == 0
+        for force in [force1, force2]:
+            assert profile[force.force_id]['num_calls'] == 1
+            assert profile[force.force_id]['num_cache_hits'] == 1
+            assert profile[force.force_id]['num_local_calls'] == 1
+            assert profile[force.force_id]['time'] > 0
+            assert profile[force.force_id]['num_interactions'] == force.num_interactions
+        assert force2.num_interactions == force2.num_torsions
+        assert force1.num_interactions == force1.neighbor_list.num_pairs
+        # Returned profile is a copy
+        profile[0]['num_calls'] = 100
+        assert self.ensemble.getProfile()['forces'][0]['num_calls'] == 1
+
+        self.ensemble.disableProfiling()
+        self.ensemble.system.updateCoordinateVersion()
+        self.ensemble.calculateReducedEnergyAndForces()
+        assert self.ensemble.getProfile()['forces'][0]['num_calls'] == 1
+        self.ensemble.resetProfile()
+        assert self.ensemble.getProfile() == {'forces': {}, 'phases': {}}
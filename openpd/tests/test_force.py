@@ -19,3 +19,9 @@ class TestForce:
             
         with pytest.raises(NotImplementedError):
             self.force.bindEnsemble(1)
+
+        with pytest.raises(NotImplementedError):
+            self.force.calculatePotentialEnergy()
+
+        with pytest.raises(NotImplementedError):
+            self.force.calculateAtomForce(0)
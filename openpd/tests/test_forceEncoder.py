@@ -68,4 +68,26 @@ class TestForceEncoder:
     def test_createEnsemble(self):
         ensemble = self.encoder.createEnsemble()
         assert ensemble.getNumForcesByGroup([0]) == 4
-        assert ensemble.getNumForcesByGroup([1]) == 0
\ No newline at end of file
+        assert ensemble.getNumForcesByGroup([1]) == 0
+    def test_createHydroFieldForce(self):
+        self.encoder.ensemble = Ensemble(self.encoder._system)
+        force = self.encoder._createHydroFieldForce()
+        force.bindEnsemble(self.encoder.ensemble)
+        assert force.cutoff_radius == self.encoder.cutoff_radius * angstrom
+        assert force.force_field_vector[0].name == 'ASN'
+
+        assert self.encoder.is_hydro_field == False
+        num_forces = self.encoder.createEnsemble().num_forces
+        encoder = ForceEncoder(self.system, is_hydro_field=True)
+        assert encoder.is_hydro_field == True
+        assert encoder.createEnsemble().num_forces == num_forces + 1
+
+    def test_bondedForceGroup(self):
+        assert self.encoder.bonded_force_group == 0
+        encoder = ForceEncoder(self.system, bonded_force_group=1)
+        ensemble = encoder.createEnsemble()
+        assert encoder.bonded_force_group == 1
+        assert ensemble.getNumForcesByGroup([0]) == 2
+        assert [type(force).__name__ for force in ensemble.getForcesByGroup([1])] == [
+            'PDFFBondForce', 'PDFFTorsionForce'
+        ]
@@ -0,0 +1,69 @@
+import pytest, os
+from .. import PDFFNonBondedForceField, PDFFBondForceField, PDFFTorsionForceField
+from .. import loadForceFieldTables, clearForceFieldCache
+from .. import getForceFieldCacheSize, getForceFieldCacheLimit, setForceFieldCacheLimit
+
+cur_dir = os.path.abspath(os.path.dirname(os.path.abspath(__file__)))
+force_field_dir = os.path.join(cur_dir, '../data/pdff')
+
+class TestForceFieldCache:
+    def setup(self):
+        clearForceFieldCache()
+
+    def teardown(self):
+        setForceFieldCacheLimit(None)
+        clearForceFieldCache()
+
+    def test_exceptions(self):
+        with pytest.raises(ValueError):
+            setForceFieldCacheLimit(0)
+
+        with pytest.raises(FileNotFoundError):
+            loadForceFieldTables(os.path.join(force_field_dir, 'bond', 'AAA.npz'))
+
+    def test_loadForceFieldTables(self):
+        file_path = os.path.join(force_field_dir, 'bond', 'ASN.npz')
+        origin_data, energy_table, force_table = loadForceFieldTables(file_path)
+        assert getForceFieldCacheSize() == 1
+        assert loadForceFieldTables(file_path)[1] is energy_table
+        assert loadForceFieldTables(file_path)[2] is force_table
+        assert getForceFieldCacheSize() == 1
+        # Periodic tables are cached separately
+        assert loadForceFieldTables(file_path, period=10)[1] is not energy_table
+        assert getForceFieldCacheSize() == 2
+
+    def test_sharing(self):
+        force_field1 = PDFFNonBondedForceField('ASN', 'LEU')
+        force_field2 = PDFFNonBondedForceField('LEU', 'ASN', cutoff_radius=10)
+        assert force_field1._energy_table is force_field2._energy_table
+        assert force_field1._force_table is force_field2._force_table
+
+        force_field1 = PDFFBondForceField('ASN', 'LEU')
+        force_field2 = PDFFBondForceField('GLY', 'TRP')
+        assert force_field1._energy_table is force_field2._energy_table
+        assert force_field1.name != force_field2.name
+
+        force_field1 = PDFFTorsionForceField('ASN', 'LEU')
+        force_field2 = PDFFTorsionForceField('ASN', 'LEU')
+        assert force_field1._force_table is force_field2._force_table
+        assert getForceFieldCacheSize() == 3
+
+    def test_clearForceFieldCache(self):
+        force_field1 = PDFFNonBondedForceField('ASN', 'LEU')
+        clearForceFieldCache()
+        assert getForceFieldCacheSize() == 0
+        force_field2 = PDFFNonBondedForceField('ASN', 'LEU')
+        assert force_field1._energy_table is not force_field2._energy_table
+
+    def test_setForceFieldCacheLimit(self):
+        assert getForceFieldCacheLimit() == None
+        for name in ['ASN', 'ASP', 'GLN']:
+            loadForceFieldTables(os.path.join(force_field_dir, 'bond', name + '.npz'))
+        # ASN becomes the most recently used one, ASP is dropped first
+        energy_table = loadForceFieldTables(os.path.join(force_field_dir, 'bond', 'ASN.npz'))[1]
+        setForceFieldCacheLimit(2)
+        assert getForceFieldCacheLimit() == 2
+        assert getForceFieldCacheSize() == 2
+        assert loadForceFieldTables(os.path.join(force_field_dir, 'bond', 'ASN.npz'))[1] is energy_table
+        loadForceFieldTables(os.path.join(force_field_dir, 'bond', 'GLY.npz'))
+        assert getForceFieldCacheSize() == 2
@@ -1,6 +1,6 @@
 import pytest
 import numpy as np
-from .. import convertToNdArray, getBond, getUnitVec, getNormVec, getAngle, getTorsion
+from .. import convertToNdArray, getBond, getUnitVec, getNormVec, getAngle, getTorsion, getTorsionAndGradient
 from .. import isArrayEqual, isArrayAlmostEqual, isAlmostEqual
 from ..unit import * 
 from ..unit import Quantity
@@ -126,4 +126,27 @@ def test_getTorsion():
     coord2 = np.array([1, 0, 0]) * angstrom
     coord3 = np.array([1, -1, 0]) * angstrom
     assert getTorsion(coord0, coord1, coord2, coord3) == pytest.approx(np.pi*-3/4)
-    assert getTorsion(coord0, coord1, coord2, coord3, is_angular=False) == pytest.approx(-135)
\ No newline at end of file
+    assert getTorsion(coord0, coord1, coord2, coord3, is_angular=False) == pytest.approx(-135)
+
+def test_getTorsionAndGradient():
+    coord = np.array([
+        [0, 1, 1], [0, 0, 0], [1, 0, 0], [1, 1, 0], [1, 0, -1], [1, -1, 0]
+    ], dtype=np.float64)
+    torsion_index = np.array([[0, 1, 2, 3], [0, 1, 2, 4], [0, 1, 2, 5]])
+    torsion_angle, gradient = getTorsionAndGradient(coord, torsion_index)
+    assert np.allclose(torsion_angle, [np.pi/4, np.pi*3/4, np.pi*-3/4])
+    assert gradient.shape == (3, 4, 3)
+    # Rigid translation does not change the torsion angle
+    assert np.allclose(gradient.sum(1), 0)
+
+    derivative_width = 1e-6
+    for atom in range(4):
+        for dim in range(3):
+            coord[torsion_index[0, atom], dim] += derivative_width
+            angle_forward = getTorsionAndGradient(coord, torsion_index[:1, :])[0][0]
+            coord[torsion_index[0, atom], dim] -= 2 * derivative_width
+            angle_backward = getTorsionAndGradient(coord, torsion_index[:1, :])[0][0]
+            coord[torsion_index[0, atom], dim] += derivative_width
+            assert gradient[0, atom, dim] == pytest.approx(
+                (angle_forward - angle_backward) / (2 * derivative_width), abs=1e-6
+            )
@@ -1,5 +1,7 @@
 import pytest, os
+import numpy as np
 from .. import Integrator, SequenceLoader, ForceEncoder
+from .. import VerletIntegrator, VelocityVerletIntegrator, LeapFrogIntegrator, RESPAIntegrator
 from ..unit import *
 from ..exceptions import NonboundError, RebindError, DismatchedDimensionError
 
@@ -50,6 +52,50 @@ class TestIntegrator:
         self.integrator.setVelocityToTemperature(298)
         assert self.integrator.calculateTemperature() == 298 * kelvin
 
+    def test_seed(self):
+        for integrator_class in [
+            VerletIntegrator, VelocityVerletIntegrator, LeapFrogIntegrator, RESPAIntegrator
+        ]:
+            velocities = []
+            for seed in [1, 1, 2]:
+                integrator = integrator_class(1, seed=seed)
+                integrator._bindEnsemble(ForceEncoder(self.system, bonded_force_group=1).createEnsemble())
+                integrator.setVelocityToTemperature(300)
+                velocities.append(self.system.velocity_array.copy())
+            assert np.array_equal(velocities[0], velocities[1])
+            assert not np.array_equal(velocities[0], velocities[2])
+
+    def test_updateCachedForce(self):
+        force_groups = []
+        calculate_forces = self.integrator._calculateForces
+        def _calculateForces(force_group):
+            force_groups.append(force_group)
+            return calculate_forces(force_group)
+        self.integrator._calculateForces = _calculateForces
+        self.integrator._updateCachedForce()
+        self.integrator._updateCachedForce()
+        assert force_groups == [[0]]
+        self.integrator._updateCachedForce([0, 1])
+        assert force_groups == [[0], [0, 1]]
+        self.system.updateCoordinateVersion()
+        self.integrator._updateCachedForce([0, 1])
+        assert len(force_groups) == 3
+        assert np.allclose(self.system.force_array, self.ensemble.calculateForces([0, 1]))
+
     def test_step(self):
         with pytest.raises(NotImplementedError):
-            self.integrator.step(100)
\ No newline at end of file
+            self.integrator.step(100)
+
+    def test_workerPool(self):
+        assert self.integrator.worker_pool == None
+        with pytest.raises(ValueError):
+            Integrator(1, 2, 'gpu')
+
+        integrator = Integrator(1, 2, 'thread')
+        integrator._bindEnsemble(self.ensemble)
+        assert integrator.num_workers == 2
+        assert integrator.pool_type == 'thread'
+        integrator.updateForce()
+        assert np.allclose(self.system.force_array, self.ensemble.calculateForces())
+        integrator.worker_pool.close()
+
@@ -0,0 +1,62 @@
+import pytest, os
+import numpy as np
+from .. import LangevinIntegrator, SequenceLoader, ForceEncoder, Ensemble, isArrayEqual
+from ..unit import *
+from ..exceptions import DismatchedDimensionError
+
+cur_dir = os.path.abspath(os.path.dirname(os.path.abspath(__file__)))
+
+class TestLangevinIntegrator:
+    def setup(self):
+        self.integrator = LangevinIntegrator(1, 0.01, 300, seed=1)
+        self.system = SequenceLoader(os.path.join(cur_dir, 'data/testForceEncoder.json')).createSystem()
+        ensemble = ForceEncoder(self.system).createEnsemble()
+        self.integrator._bindEnsemble(ensemble)
+
+    def teardown(self):
+        self.integrator = None
+
+    def test_attributes(self):
+        assert self.integrator.sim_interval == 1 * femtosecond
+        assert self.integrator.dumpping_factor == 0.01 / femtosecond
+        assert self.integrator.temperature == 300 * kelvin
+        assert self.integrator._is_bound == True
+        assert self.integrator.calculateTemperature() == 300 * kelvin
+
+    def test_exceptions(self):
+        with pytest.raises(DismatchedDimensionError):
+            LangevinIntegrator(1, 0.01*kelvin, 300)
+
+        with pytest.raises(DismatchedDimensionError):
+            LangevinIntegrator(1, 0.01, 300*angstrom)
+
+    def test_step(self):
+        version = self.system.coordinate_version
+        self.integrator.step(10)
+        assert self.system.coordinate_version == version + 10
+        assert np.isfinite(self.system.velocity_array).all()
+
+    def test_seed(self):
+        velocities = []
+        for _ in range(2):
+            # The initial coordinate of a SequenceLoader system is random
+            system = SequenceLoader(os.path.join(cur_dir, 'data/testForceEncoder.json')).createSystem()
+            system.coordinate_array[:, :] = self.system.coordinate_array
+            integrator = LangevinIntegrator(1, 0.01, 300, seed=10)
+            integrator._bindEnsemble(ForceEncoder(system).createEnsemble())
+            integrator.step(10)
+            velocities.append(system.velocity_array.copy())
+        assert isArrayEqual(velocities[0], velocities[1])
+
+    def test_thermostat(self):
+        # Free atoms starting from 0 K are heated to the temperature of heat bath
+        system = SequenceLoader(os.path.join(cur_dir, 'data/testForceEncoder.json')).createSystem()
+        integrator = LangevinIntegrator(1, 0.05, 300, seed=1)
+        integrator._bindEnsemble(Ensemble(system))
+        system.velocity_array[:, :] = 0
+        integrator.step(200)
+        temperatures = []
+        for _ in range(2000):
+            integrator.step(1)
+            temperatures.append(integrator.calculateTemperature() / kelvin)
+        assert np.mean(temperatures) == pytest.approx(300, rel=0.1)
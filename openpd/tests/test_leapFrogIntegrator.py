@@ -0,0 +1,58 @@
+import pytest, os
+import numpy as np
+from .. import LeapFrogIntegrator, VelocityVerletIntegrator, SequenceLoader, ForceEncoder
+from ..unit import *
+from ..exceptions import DismatchedDimensionError
+
+cur_dir = os.path.abspath(os.path.dirname(os.path.abspath(__file__)))
+
+class TestLeapFrogIntegrator:
+    def setup(self):
+        self.integrator = LeapFrogIntegrator(1)
+        self.system = SequenceLoader(os.path.join(cur_dir, 'data/testForceEncoder.json')).createSystem()
+        self.ensemble = ForceEncoder(self.system).createEnsemble()
+        self.integrator._bindEnsemble(self.ensemble)
+
+    def teardown(self):
+        self.integrator = None
+
+    def test_attributes(self):
+        assert self.integrator.sim_interval == 1 * femtosecond
+        assert self.integrator.temperature == 300 * kelvin
+        assert self.integrator._is_bound == True
+        assert self.integrator.calculateTemperature() == 300 * kelvin
+
+    def test_exceptions(self):
+        with pytest.raises(DismatchedDimensionError):
+            LeapFrogIntegrator(1*kilogram)
+
+        with pytest.raises(DismatchedDimensionError):
+            LeapFrogIntegrator(1, 300*kilogram)
+
+    def test_step(self):
+        force_groups = []
+        calculate_forces = self.integrator._calculateForces
+        def _calculateForces(force_group):
+            force_groups.append(force_group)
+            return calculate_forces(force_group)
+        self.integrator._calculateForces = _calculateForces
+        version = self.system.coordinate_version
+        self.integrator.step(10)
+        self.integrator.step(10)
+        assert self.system.coordinate_version == version + 20
+        assert len(force_groups) == 20 + 1
+        assert np.allclose(self.system.force_array, self.ensemble.calculateForces())
+
+    def test_velocityVerlet(self):
+        # Leap-frog started from v(-dt/2) = v(0) - a(0)*dt/2 follows the trajectory of velocity verlet
+        system = SequenceLoader(os.path.join(cur_dir, 'data/testForceEncoder.json')).createSystem()
+        system.coordinate_array[:, :] = self.system.coordinate_array
+        velocity_verlet = VelocityVerletIntegrator(1)
+        velocity_verlet._bindEnsemble(ForceEncoder(system).createEnsemble())
+        inv_mass = force_over_mass_factor / self.system.mass_array
+        self.system.velocity_array[:, :] = (
+            system.velocity_array - 0.5 * self.ensemble.calculateForces() * inv_mass
+        )
+        self.integrator.step(20)
+        velocity_verlet.step(20)
+        assert np.allclose(system.coordinate_array, self.system.coordinate_array)
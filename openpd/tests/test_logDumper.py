@@ -56,4 +56,39 @@ class TestLogDumper:
         integrator = VelocityVerletIntegrator(1)
         simulation = Simulation(ensemble, integrator)
         self.dumper.bindSimulation(simulation)
-        self.dumper.dump()
\ No newline at end of file
+        self.dumper.dump()
+    def test_dumpForceTime(self):
+        output_file = os.path.join(cur_dir, 'output/outputLogDumper.log')
+        system = SequenceLoader(os.path.join(cur_dir, 'data/testSimulation.json')).createSystem()
+        ensemble = ForceEncoder(system).createEnsemble()
+        simulation = Simulation(ensemble, VelocityVerletIntegrator(1))
+        simulation.addDumpers(LogDumper(output_file, 10, get_steps=True, get_force_time=True))
+        assert ensemble.is_profiling
+        simulation.step(20)
+        with open(output_file, 'r') as io:
+            lines = io.readlines()
+        assert 'Force Time (s)' in lines[1]
+        assert len(lines[-1].split()) == 1 + ensemble.num_forces
+        assert float(lines[-1].split()[1]) > 0
+
+    def test_columnWidth(self):
+        output_file = os.path.join(cur_dir, 'output/outputLogDumper.log')
+        dumper = LogDumper(
+            output_file, 1, get_steps=True,
+            get_nonbonded_energy=True, get_torsion_energy=True,
+            get_total_energy=True, get_mass_center=True
+        )
+        system = SequenceLoader(os.path.join(cur_dir, 'data/testSimulation.json')).createSystem()
+        simulation = Simulation(ForceEncoder(system).createEnsemble(), VelocityVerletIntegrator(1))
+        simulation.addDumpers(dumper)
+        simulation.step(1)
+        simulation.closeDumpers()
+        with open(output_file, 'r') as io:
+            lines = io.readlines()
+        # Each value starts at the column of its title
+        offset = 0
+        for key in ['Steps', 'Nonbonded Energy (kj/mol)', 'Torsion Energy (kj/mol)', 'Total Energy (kj/mol)', 'Mass Center']:
+            assert lines[1][offset:].startswith(key)
+            assert lines[-1][offset] != ' '
+            assert lines[-1][offset-1] == ' ' or offset == 0
+            offset += dumper.flag_dict[key][1]
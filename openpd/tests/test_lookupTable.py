@@ -0,0 +1,90 @@
+import pytest, os
+import numpy as np
+from numpy import pi
+from scipy.interpolate import interp1d
+from .. import LookupTable, loadForceFieldTables
+
+cur_dir = os.path.abspath(os.path.dirname(os.path.abspath(__file__)))
+force_field_dir = os.path.join(cur_dir, '../data/pdff')
+
+class TestLookupTable:
+    def setup(self):
+        self.coord = np.linspace(0, 10, 1001)
+        self.table = LookupTable(self.coord, np.sin(self.coord))
+
+    def teardown(self):
+        self.table = None
+
+    def test_attributes(self):
+        assert self.table.spacing == pytest.approx(0.01)
+        assert self.table.num_intervals == 1000
+        assert self.table.period == None
+
+    def test_exceptions(self):
+        with pytest.raises(AttributeError):
+            self.table.spacing = 1
+
+        with pytest.raises(AttributeError):
+            self.table.num_intervals = 1
+
+        with pytest.raises(ValueError):
+            LookupTable([0, 1, 2, 3], [0, 1, 2])
+
+    def test_call(self):
+        assert self.table(1) == pytest.approx(np.sin(1))
+        x = np.random.rand(2, 100) * 10
+        assert self.table(x).shape == (2, 100)
+        assert np.allclose(self.table(x), np.sin(x), atol=1e-8)
+
+    def test_extrapolation(self):
+        # Constant outside [0, 10] without derivative
+        assert self.table(-1) == pytest.approx(0, abs=1e-6)
+        assert self.table(11) == pytest.approx(np.sin(10), abs=1e-6)
+        # Linear with the edge value and the given slopes
+        assert np.allclose(self.table.edge_values, [0, np.sin(10)])
+        table = LookupTable(self.coord, np.sin(self.coord), edge_slopes=[1, np.cos(10)])
+        assert table(-1) == pytest.approx(-1, abs=1e-6)
+        assert table(11) == pytest.approx(np.sin(10) + np.cos(10), abs=1e-6)
+        # Force is the opposite of the derivative of energy outside the range
+        for file_name in ['ASN.npz', 'CA-CA.npz']:
+            origin_data, energy_table, force_table = loadForceFieldTables(
+                os.path.join(force_field_dir, 'bond', file_name)
+            )
+            for edge, direction in [
+                [origin_data['energy_coord'][0], -1], [origin_data['energy_coord'][-1], 1]
+            ]:
+                x = edge + direction * np.array([0.5, 1, 1.5, 5])
+                energy, force = energy_table(x), force_table(x)
+                assert np.isfinite(energy).all()
+                assert np.isfinite(force).all()
+                delta = 1e-4
+                derivative = (energy_table(x + delta) - energy_table(x - delta)) / (2 * delta)
+                assert np.allclose(force, -derivative, rtol=1e-6, atol=1e-6)
+
+    def test_accuracy(self):
+        for sub_dir, file_name in [
+            ['nonbonded', 'ASN-LEU.npz'],
+            ['bond', 'ASN.npz'],
+            ['bond', 'CA-CA.npz']
+        ]:
+            data = np.load(os.path.join(force_field_dir, sub_dir, file_name))
+            for key in ['energy', 'force']:
+                reference = interp1d(data[key+'_coord'], data[key+'_data'], kind='cubic')
+                table = LookupTable(data[key+'_coord'], data[key+'_data'])
+                x = np.linspace(data[key+'_coord'][0], data[key+'_coord'][-1], 100001)
+                scale = np.abs(data[key+'_data']).max()
+                assert np.abs(table(x) - reference(x)).max() < 1e-8 * scale
+
+    def test_periodic(self):
+        data = np.load(os.path.join(force_field_dir, 'torsion', 'ASN-LEU.npz'))
+        for key in ['energy', 'force']:
+            reference = interp1d(data[key+'_coord'], data[key+'_data'], kind='cubic')
+            table = LookupTable(data[key+'_coord'], data[key+'_data'], period=2*pi)
+            assert table.period == 2*pi
+            x = np.linspace(-pi + 0.001, pi - 0.001, 100001)
+            scale = np.abs(data[key+'_data']).max()
+            assert np.abs(table(x) - reference(x)).max() < 1e-4 * scale
+            # Wrap at ±pi
+            assert np.allclose(table(x + 2*pi), table(x))
+            assert np.allclose(table(x - 4*pi), table(x))
+            assert table(pi) == pytest.approx(table(-pi))
@@ -0,0 +1,102 @@
+import pytest, os
+import numpy as np
+from .. import MCMCIntegrator, PDBLoader, ForceEncoder, isArrayEqual
+from ..unit import *
+from ..exceptions import DismatchedDimensionError
+
+cur_dir = os.path.abspath(os.path.dirname(os.path.abspath(__file__)))
+
+class TestMCMCIntegrator:
+    def setup(self):
+        self.integrator = MCMCIntegrator(1, 300, seed=1)
+        self.system = PDBLoader(os.path.join(cur_dir, 'data/normal.pdb')).createSystem()
+        self.ensemble = ForceEncoder(self.system).createEnsemble()
+        self.integrator._bindEnsemble(self.ensemble)
+
+    def teardown(self):
+        self.integrator = None
+
+    def test_attributes(self):
+        assert self.integrator.temperature == 300 * kelvin
+        assert self.integrator._is_bound == True
+        assert self.integrator.step_size['sc'] == 0.1
+        assert self.integrator.step_size['pivot'] == 0.1
+        assert self.integrator.total_acceptance_ratio == 0
+        assert self.integrator._crankshaft_index.shape == (self.system.num_molecules - 2, 3)
+
+    def test_exceptions(self):
+        with pytest.raises(ValueError):
+            MCMCIntegrator(move_weights={'rotation': 1})
+
+        with pytest.raises(ValueError):
+            MCMCIntegrator(move_weights={'sc': 0})
+
+        with pytest.raises(DismatchedDimensionError):
+            MCMCIntegrator(temperature=300*angstrom)
+
+    def test_proposeMove(self):
+        coord = self.system.coordinate_array
+        ca_index = self.integrator._ca_index
+        bond = lambda i, j: np.sqrt(((coord[i, :] - coord[j, :])**2).sum())
+        for _ in range(10):
+            atom_ids, trial_coord = self.integrator._proposeMove('crankshaft')
+            peptide_id = np.where(ca_index == atom_ids[0])[0][0]
+            origin_bonds = [bond(ca_index[peptide_id-1], atom_ids[0]), bond(atom_ids[0], ca_index[peptide_id+1])]
+            origin_coord = coord[atom_ids, :].copy()
+            coord[atom_ids, :] = trial_coord
+            assert bond(ca_index[peptide_id-1], atom_ids[0]) == pytest.approx(origin_bonds[0])
+            assert bond(atom_ids[0], ca_index[peptide_id+1]) == pytest.approx(origin_bonds[1])
+            coord[atom_ids, :] = origin_coord
+
+            # Pivot keeps the shape of the rotated side
+            atom_ids, trial_coord = self.integrator._proposeMove('pivot')
+            origin_dist = np.sqrt(((coord[atom_ids, np.newaxis, :] - coord[np.newaxis, atom_ids, :])**2).sum(2))
+            trial_dist = np.sqrt(((trial_coord[:, np.newaxis, :] - trial_coord[np.newaxis, :, :])**2).sum(2))
+            assert np.allclose(origin_dist, trial_dist)
+            assert atom_ids.shape[0] <= self.system.num_atoms // 2
+
+    def test_step(self):
+        self.integrator.step(10)
+        num_trials = self.integrator.num_trials
+        assert sum(num_trials.values()) == 10 * self.system.num_molecules
+        for move_type, num_accepted in self.integrator.num_accepted.items():
+            assert num_accepted <= num_trials[move_type]
+        assert 0 < self.integrator.total_acceptance_ratio <= 1
+        self.integrator.resetStatistics()
+        assert self.integrator.total_acceptance_ratio == 0
+
+    def test_localEnergy(self):
+        # Only downhill moves are accepted at low temperature
+        integrator = MCMCIntegrator(1, 1e-8, seed=1)
+        system = PDBLoader(os.path.join(cur_dir, 'data/normal.pdb')).createSystem()
+        ensemble = ForceEncoder(system, is_hydro_field=True).createEnsemble()
+        integrator._bindEnsemble(ensemble)
+        energy = ensemble.calculateReducedPotentialEnergy()
+        for _ in range(5):
+            integrator.step(2)
+            cur_energy = ensemble.calculateReducedPotentialEnergy()
+            assert cur_energy <= energy + 1e-8
+            energy = cur_energy
+
+    def test_autoTune(self):
+        self.integrator.step(100)
+        assert self.integrator.step_size['sc'] != 0.1
+        for ratio in self.integrator.acceptance_ratio.values():
+            assert ratio == pytest.approx(0.5, abs=0.2)
+
+        integrator = MCMCIntegrator(1, 300, is_auto_tune=False, seed=1)
+        integrator._bindEnsemble(ForceEncoder(
+            PDBLoader(os.path.join(cur_dir, 'data/normal.pdb')).createSystem()
+        ).createEnsemble())
+        integrator.step(100)
+        assert integrator.step_size['sc'] == 0.1
+
+    def test_seed(self):
+        coordinates = []
+        for _ in range(2):
+            system = PDBLoader(os.path.join(cur_dir, 'data/normal.pdb')).createSystem()
+            integrator = MCMCIntegrator(1, 300, seed=10)
+            integrator._bindEnsemble(ForceEncoder(system).createEnsemble())
+            integrator.step(10)
+            coordinates.append(system.coordinate_array.copy())
+        assert isArrayEqual(coordinates[0], coordinates[1])
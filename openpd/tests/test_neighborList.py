@@ -0,0 +1,82 @@
+import pytest, os
+import numpy as np
+from .. import NeighborList, PDBLoader, Ensemble, PDFFNonBondedForce
+from ..unit import *
+
+cur_dir = os.path.abspath(os.path.dirname(os.path.abspath(__file__)))
+
+def getAllPairs(coordinate, radius):
+    index = np.array(np.triu_indices(coordinate.shape[0], k=1))
+    dist = np.sqrt(((coordinate[index[1, :], :] - coordinate[index[0, :], :])**2).sum(1))
+    return index[:, dist <= radius]
+
+class TestNeighborList:
+    def setup(self):
+        self.neighbor_list = NeighborList(cutoff_radius=5, skin_width=1)
+        self.coordinate = np.random.rand(500, 3) * 40
+
+    def teardown(self):
+        self.neighbor_list = None
+
+    def test_attributes(self):
+        assert self.neighbor_list.cutoff_radius == 5 * angstrom
+        assert self.neighbor_list.skin_width == 1 * angstrom
+        assert self.neighbor_list.num_pairs == 0
+        assert self.neighbor_list.num_builds == 0
+        assert self.neighbor_list.num_checks == 0
+        assert self.neighbor_list.build_ratio == 0
+
+    def test_exceptions(self):
+        with pytest.raises(AttributeError):
+            self.neighbor_list.num_builds = 1
+
+        with pytest.raises(ValueError):
+            NeighborList(cutoff_radius=0)
+
+        with pytest.raises(ValueError):
+            NeighborList(skin_width=-1)
+
+    def test_rebuild(self):
+        self.neighbor_list.rebuild(self.coordinate)
+        assert np.array_equal(self.neighbor_list.pair_index, getAllPairs(self.coordinate, 6))
+        assert self.neighbor_list.num_builds == 1
+
+        neighbor_list = NeighborList(cutoff_radius=5*angstrom, skin_width=0)
+        neighbor_list.rebuild(self.coordinate)
+        assert np.array_equal(neighbor_list.pair_index, getAllPairs(self.coordinate, 5))
+
+    def test_update(self):
+        assert self.neighbor_list.update(self.coordinate) == True
+        # Move less than half of skin width
+        self.coordinate[0, :] += [0.4, 0, 0]
+        assert self.neighbor_list.update(self.coordinate) == False
+        assert self.neighbor_list.max_displacement / angstrom == pytest.approx(0.4)
+        # All pairs within cutoff are still in the list
+        pairs = set(map(tuple, self.neighbor_list.pair_index.T))
+        assert set(map(tuple, getAllPairs(self.coordinate, 5).T)) <= pairs
+
+        self.coordinate[1, :] += [0, 0.6, 0]
+        assert self.neighbor_list.update(self.coordinate) == True
+        assert self.neighbor_list.num_builds == 2
+        assert self.neighbor_list.num_checks == 3
+        assert self.neighbor_list.build_ratio == pytest.approx(2 / 3)
+
+        self.neighbor_list.resetStatistics()
+        assert self.neighbor_list.num_builds == 0
+        assert self.neighbor_list.num_checks == 0
+
+    def test_nonBondedForce(self):
+        system = PDBLoader(os.path.join(cur_dir, 'data/normal.pdb')).createSystem()
+        ensemble = Ensemble(system)
+        force = PDFFNonBondedForce(cutoff_radius=8, skin_width=1)
+        ensemble.addForces(force)
+        assert force.neighbor_list.num_builds == 1
+        for _ in range(5):
+            system.coordinate_array[:, :] += (np.random.rand(system.num_atoms, 3) - 0.5) * 0.4
+            energy = force.calculatePotentialEnergy()
+            reference = 0
+            for i in range(force.num_peptides):
+                for j in range(i+1, force.num_peptides):
+                    reference += force.calculatePairEnergy(i, j) / kilojoule_permol
+            assert energy / kilojoule_permol == pytest.approx(reference)
+        assert force.neighbor_list.num_checks == 5
@@ -37,7 +37,7 @@ class TestPDBLoader:
         system = self.loader.createSystem()
 
         assert system.num_atoms == 20
-        assert system.num_peptides == 10
+        assert system.num_molecules == 10
         assert system.num_chains == 1
 
         assert system.topology.num_atoms == 20
@@ -1,7 +1,7 @@
 import pytest, os
 import numpy as np
 from .. import PDFFBondForce, SequenceLoader, Ensemble
-from .. import isAlmostEqual, isArrayEqual, getBond, getUnitVec
+from .. import isAlmostEqual, isArrayEqual, isArrayAlmostEqual, getBond, getUnitVec
 from ..unit import *
 from ..exceptions import NonboundError, RebindError
 
@@ -124,28 +124,50 @@ class TestPDFFBondForce:
             self.system.topology.bonds[2][1].coordinate
         )
 
-        assert isArrayEqual(
+        assert isArrayAlmostEqual(
             self.force.calculateAtomForce(0), (
                 0.5 * self.force.force_field_vector[0].getForce(bond_length0) * vec0 +
                 0.5 * self.force.force_field_vector[1].getForce(bond_length1) * vec1   
             )
         )
 
-        assert isArrayEqual(
+        assert isArrayAlmostEqual(
             self.force.calculateAtomForce(1), (
                 0.5 * self.force.force_field_vector[0].getForce(bond_length0) * -vec0 
             )
         )
 
-        assert isArrayEqual(
+        assert isArrayAlmostEqual(
             self.force.calculateAtomForce(2), (
                 0.5 * self.force.force_field_vector[1].getForce(bond_length1) * -vec1 +
                 0.5 * self.force.force_field_vector[2].getForce(bond_length2) * vec2
             )
         )
 
-        assert isArrayEqual(
+        assert isArrayAlmostEqual(
             self.force.calculateAtomForce(3), (
                 0.5 * self.force.force_field_vector[2].getForce(bond_length2) * -vec2
             )
-        )
\ No newline at end of file
+        )
+
+    def test_calculateEnergyAndForces(self):
+        self.force.bindEnsemble(self.ensemble)
+        energy, forces = self.force.calculateEnergyAndForces()
+
+        assert isAlmostEqual(energy, self.force.calculatePotentialEnergy())
+        assert forces.shape == (self.system.num_atoms, 3)
+        for atom in self.system.atoms:
+            assert np.allclose(
+                forces[atom.atom_id, :],
+                [i / kilojoule_permol_over_angstrom for i in self.force.calculateAtomForce(atom.atom_id)]
+            )
+        assert np.allclose(forces.sum(0), 0)
+
+    def test_sharedForceField(self):
+        system = SequenceLoader(os.path.join(cur_dir, 'data/testForceEncoder.json')).createSystem()
+        self.force.bindEnsemble(Ensemble(system))
+        # All Ca-Ca bonds share the same tables
+        assert len(self.force._group_force_fields) < self.force.num_bonds
+        for force_field, group_index in zip(self.force._group_force_fields, self.force._group_bond_index):
+            for bond_id in group_index:
+                assert self.force.force_field_vector[bond_id]._energy_table is force_field._energy_table
@@ -0,0 +1,114 @@
+import pytest, os
+import numpy as np
+from .. import PDFFHydroFieldForce, PDBLoader, SequenceLoader, Ensemble
+from .. import isAlmostEqual, isArrayEqual, getBond
+from ..unit import *
+from ..exceptions import NonboundError, RebindError, NotincludedInteractionError
+
+cur_dir = os.path.abspath(os.path.dirname(os.path.abspath(__file__)))
+
+class TestPDFFHydroFieldForce:
+    def setup(self):
+        self.system = PDBLoader(os.path.join(cur_dir, 'data/normal.pdb')).createSystem()
+        self.ensemble = Ensemble(self.system)
+        self.force = PDFFHydroFieldForce()
+
+    def teardown(self):
+        self.system = None
+        self.ensemble = None
+        self.force = None
+
+    def test_attributes(self):
+        assert self.force.num_peptides == 0
+        assert self.force.cutoff_radius == 12 * angstrom
+        assert self.force._potential_energy == 0
+        assert self.force.force_field_vector == None
+
+    def test_exceptions(self):
+        with pytest.raises(AttributeError):
+            self.force.num_peptides = 1
+
+        with pytest.raises(AttributeError):
+            self.force.force_field_vector = 1
+
+        with pytest.raises(NonboundError):
+            self.force.calculateAtomForce(0)
+
+        with pytest.raises(RebindError):
+            self.force.bindEnsemble(self.ensemble)
+            self.force.bindEnsemble(self.ensemble)
+
+        with pytest.raises(AttributeError):
+            system = SequenceLoader(os.path.join(cur_dir, 'data/testPDFFNonBondedForceException.json')).createSystem()
+            PDFFHydroFieldForce().bindEnsemble(Ensemble(system))
+
+        # Fitted parameters need to cover all peptide types of the system
+        with pytest.raises(NotincludedInteractionError):
+            PDFFHydroFieldForce(parameters={'ASN': PDFFHydroFieldForce.DEFAULT_PARAMETERS}).bindEnsemble(
+                Ensemble(PDBLoader(os.path.join(cur_dir, 'data/normal.pdb')).createSystem())
+            )
+
+    def test_bindEnsemble(self):
+        self.force.bindEnsemble(self.ensemble)
+        assert self.force.num_peptides == self.system.num_molecules
+        for peptide, force_field in zip(self.system.molecules, self.force.force_field_vector):
+            assert force_field.name == peptide.peptide_type
+        # Peptides of the same type share one force field
+        num_types = len(set([peptide.peptide_type for peptide in self.system.molecules]))
+        assert self.force._gaussian_parameters.shape[0] == num_types
+        for force_field in self.force.force_field_vector:
+            assert force_field.parameters == PDFFHydroFieldForce.DEFAULT_PARAMETERS
+
+        # Fitted parameters of each peptide type
+        parameters = {
+            peptide.peptide_type: {'gaussian_1': {'h': i, 'mu': 4.0, 'sigma': 0.5}, 'switching_1': {'zeta': 4.0, 'r_s': 3.0}}
+            for i, peptide in enumerate(self.system.molecules)
+        }
+        force = PDFFHydroFieldForce(parameters=parameters)
+        force.bindEnsemble(Ensemble(self.system))
+        for peptide, force_field in zip(self.system.molecules, force.force_field_vector):
+            assert force_field.parameters == parameters[peptide.peptide_type]
+
+    def test_calculatePotentialEnergy(self):
+        self.force.bindEnsemble(self.ensemble)
+        energy = 0 * kilojoule_permol
+        peptides = self.system.molecules
+        for i, peptide1 in enumerate(peptides):
+            for j, peptide2 in enumerate(peptides[i+2:]):
+                dist = getBond(peptide1.atoms[1].coordinate, peptide2.atoms[1].coordinate)
+                if dist <= 12 * angstrom:
+                    energy += 0.5 * (
+                        self.force.force_field_vector[i].getEnergy(dist) + 
+                        self.force.force_field_vector[i+j+2].getEnergy(dist)
+                    )
+        assert energy != 0 * kilojoule_permol
+        assert isAlmostEqual(self.force.calculatePotentialEnergy(), energy)
+
+    def test_calculateEnergyAndForces(self):
+        self.force.bindEnsemble(self.ensemble)
+        energy, forces = self.force.calculateEnergyAndForces()
+        assert isAlmostEqual(energy, self.force.calculatePotentialEnergy())
+        assert forces.shape == (self.system.num_atoms, 3)
+        assert np.allclose(forces.sum(0), 0)
+        for atom in self.system.atoms:
+            assert np.allclose(
+                forces[atom.atom_id, :],
+                [i / kilojoule_permol_over_angstrom for i in self.force.calculateAtomForce(atom.atom_id)]
+            )
+        # CA has no hydration field
+        assert isArrayEqual(forces[self.system.atoms[0].atom_id, :], [0, 0, 0])
+
+    def test_forceConsistency(self):
+        self.force.bindEnsemble(self.ensemble)
+        _, forces = self.force.calculateReducedEnergyAndForces()
+        derivative_width = 1e-6
+        for atom in self.system.atoms[1::2]:
+            for dim in range(3):
+                self.system.coordinate_array[atom.atom_id, dim] += derivative_width
+                energy_forward = self.force.calculateReducedEnergyAndForces()[0]
+                self.system.coordinate_array[atom.atom_id, dim] -= 2 * derivative_width
+                energy_backward = self.force.calculateReducedEnergyAndForces()[0]
+                self.system.coordinate_array[atom.atom_id, dim] += derivative_width
+                assert forces[atom.atom_id, dim] == pytest.approx(
+                    -(energy_forward - energy_backward) / (2 * derivative_width), abs=1e-5
+                )
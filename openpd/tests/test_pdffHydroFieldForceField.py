@@ -0,0 +1,60 @@
+import pytest, os
+import numpy as np
+from .. import PDFFHydroFieldForceField, PDFFHydroFieldForce
+from ..unit import *
+from ..unit import QuantityArray
+from ..exceptions import PeptideTypeError
+
+class TestPDFFHydroFieldForceField:
+    def setup(self):
+        self.force_field = PDFFHydroFieldForceField('ASN')
+
+    def teardown(self):
+        self.force_field = None
+
+    def test_attributes(self):
+        assert self.force_field.name == 'ASN'
+        assert self.force_field._gaussian_parameters.shape == (2, 3)
+        assert self.force_field._switching_parameters.shape == (1, 3)
+        assert self.force_field.parameters == PDFFHydroFieldForce.DEFAULT_PARAMETERS
+
+        parameters = {'gaussian_1': {'h': 0.5, 'mu': 4.5, 'sigma': 0.7}, 'switching_1': {'zeta': 3.0, 'r_s': 3.5}}
+        force_field = PDFFHydroFieldForceField('ALA', parameters)
+        assert force_field.name == 'ALA'
+        assert force_field.parameters == parameters
+        assert np.allclose(force_field._gaussian_parameters, [[0.5, 4.5, 0.7]])
+        assert np.allclose(force_field._switching_parameters, [[1, 3.0, 3.5]])
+
+    def test_exceptions(self):
+        with pytest.raises(AttributeError):
+            self.force_field.name = 1
+
+        with pytest.raises(PeptideTypeError):
+            PDFFHydroFieldForceField('AS')
+
+    def test_getEnergy(self):
+        h, mu, sigma = self.force_field._gaussian_parameters.T
+        _, zeta, r_s = self.force_field._switching_parameters[0, :]
+        r = 4
+        energy = (h * np.exp(-((r - mu) / sigma)**2)).sum() + 1 / (1 + np.exp(-zeta * (r - r_s))) - 1
+        assert self.force_field.getEnergy(r) / kilojoule_permol == pytest.approx(energy)
+        assert self.force_field.getEnergy(0.4 * nanometer) / kilojoule_permol == pytest.approx(energy)
+        # Far from SC, the field vanishes
+        assert self.force_field.getEnergy(30) / kilojoule_permol == pytest.approx(0, abs=1e-8)
+
+        energies = self.force_field.getEnergy(np.array([3, 4, 5]))
+        assert isinstance(energies, QuantityArray)
+        assert energies.shape == (3, )
+        assert energies[1] / kilojoule_permol == pytest.approx(energy)
+
+    def test_getForce(self):
+        derivative_width = 1e-6
+        for r in [2.5, 3.8, 5, 7]:
+            force = self.force_field.getForce(r) / kilojoule_permol_over_angstrom
+            assert force == pytest.approx(
+                -(
+                    self.force_field.getEnergy(r + derivative_width) -
+                    self.force_field.getEnergy(r - derivative_width)
+                ) / kilojoule_permol / (2 * derivative_width), 
+                abs=1e-6
+            )
@@ -1,6 +1,6 @@
 import pytest, os
 import numpy as np
-from .. import PDFFNonBondedForceField, PDFFNonBondedForce, SequenceLoader, Ensemble
+from .. import PDFFNonBondedForceField, PDFFNonBondedForce, SequenceLoader, PDBLoader, Ensemble
 from .. import isAlmostEqual, isArrayEqual, isArrayAlmostEqual, getBond, getUnitVec
 from ..unit import *
 from ..exceptions import NonboundError, RebindError
@@ -62,6 +62,21 @@ class TestPDFFNonBondedForce:
              pytest.approx(asn_leu_potential_data['energy_data'][50], 1e-3)
         )
 
+        # Peptide pairs of the same type pair share one force field
+        system = SequenceLoader(os.path.join(cur_dir, 'data/testIntegrator.json')).createSystem()
+        force = PDFFNonBondedForce()
+        force.bindEnsemble(Ensemble(system))
+        assert force.force_field_matrix[0, 1] is force.force_field_matrix[4, 3]
+        assert force.force_field_matrix[0, 3] is force.force_field_matrix[6, 9]
+        assert force.force_field_matrix[0, 3].name == 'ASN-ASN'
+        assert force.force_field_matrix[2, 0].name == 'ASN-TYR'
+        assert force.force_field_matrix[3, 3] == 0
+        assert len(force._group_force_fields) == 6
+        for i, j in np.array(np.triu_indices(system.num_molecules, k=1)).T:
+            assert force._group_force_fields[force._group_matrix[i, j]] is force.force_field_matrix[i, j]
+        # The file name of reversed type pair is resolved once
+        assert PDFFNonBondedForceField('LEU', 'ASN').name == 'ASN-LEU'
+
     def test_calculatePairEnergy(self):
         self.force.bindEnsemble(self.ensemble)
         
@@ -159,3 +174,25 @@ class TestPDFFNonBondedForce:
         force = (force13+force15) 
         assert isArrayAlmostEqual(self.force.calculateAtomForce(atom_id=1), force)
 
+
+    def test_calculateEnergyAndForces(self):
+        system = PDBLoader(os.path.join(cur_dir, 'data/normal.pdb')).createSystem()
+        self.force.bindEnsemble(Ensemble(system))
+
+        for is_scale_14 in [True, False]:
+            self.force._is_scale_14 = is_scale_14
+            energy, forces = self.force.calculateEnergyAndForces()
+            assert forces.shape == (system.num_atoms, 3)
+            assert isAlmostEqual(energy, self.force.calculatePotentialEnergy())
+            pair_energy = 0
+            for i in range(self.force.num_peptides):
+                for j in range(i+1, self.force.num_peptides):
+                    pair_energy += self.force.calculatePairEnergy(i, j)
+            assert isAlmostEqual(energy, pair_energy)
+            for atom_id in range(system.num_atoms):
+                assert isArrayAlmostEqual(
+                    forces[atom_id, :] * kilojoule_permol_over_angstrom, 
+                    self.force.calculateAtomForce(atom_id)
+                )
+            # Pair forces are antisymmetric
+            assert np.abs(forces.sum(0)).max() < 1e-8
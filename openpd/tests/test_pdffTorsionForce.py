@@ -110,8 +110,8 @@ class TestPDFFTorsionForce:
             self.force._torsions[1][3].coordinate
         )
         
-        assert (
-            self.force.calculatePotentialEnergy() == (
+        assert isAlmostEqual(
+            self.force.calculatePotentialEnergy(), (
                 self.force.force_field_vector[0].getEnergy(torsion_angle0) +
                 self.force.force_field_vector[1].getEnergy(torsion_angle1)
             )
@@ -122,10 +122,15 @@ class TestPDFFTorsionForce:
         ensemble = Ensemble(system)
         self.force.bindEnsemble(ensemble)
         
-        assert isArrayEqual(
+        # CA atoms of torsion are also under force, and the net force is zero
+        assert not isArrayEqual(
             np.array([0, 0, 0]),
             convertToNdArray(self.force.calculateAtomForce(0))
         )
+        net_force = sum([
+            convertToNdArray(self.force.calculateAtomForce(atom.atom_id)) for atom in system.atoms
+        ])
+        assert np.allclose(net_force, 0)
         
         force1 = self.force.calculateAtomForce(1)
         vec1 = system.atoms[0].coordinate - system.atoms[1].coordinate
@@ -162,4 +167,39 @@ class TestPDFFTorsionForce:
                 system.topology.torsions[0][3].coordinate,
             )) == pytest.approx(np.pi)
         )
-        
\ No newline at end of file
+        
+
+    def test_calculateEnergyAndForces(self):
+        system = SequenceLoader(os.path.join(cur_dir, 'data/testForceEncoder.json')).createSystem()
+        ensemble = Ensemble(system)
+        self.force.bindEnsemble(ensemble)
+        energy, forces = self.force.calculateEnergyAndForces()
+
+        assert isAlmostEqual(energy, self.force.calculatePotentialEnergy())
+        assert forces.shape == (system.num_atoms, 3)
+        for atom in system.atoms:
+            assert np.allclose(
+                forces[atom.atom_id, :],
+                [i / kilojoule_permol_over_angstrom for i in self.force.calculateAtomForce(atom.atom_id)]
+            )
+
+    def test_forceConsistency(self):
+        system = SequenceLoader(os.path.join(cur_dir, 'data/testPDFFTorsionForce.json')).createSystem()
+        ensemble = Ensemble(system)
+        self.force.bindEnsemble(ensemble)
+        _, forces = self.force.calculateReducedEnergyAndForces()
+        getAngle = lambda: getTorsion(*[atom.coordinate for atom in self.force._torsions[0]])
+        torque = self.force.force_field_vector[0].getForce(getAngle()) / kilojoule_permol_over_angstrom
+
+        # Forces are the tabulated -dE/dphi times the finite difference of torsion angle
+        derivative_width = 1e-6
+        for atom_id in range(system.num_atoms):
+            for dim in range(3):
+                system.coordinate_array[atom_id, dim] += derivative_width
+                angle_forward = getAngle()
+                system.coordinate_array[atom_id, dim] -= 2 * derivative_width
+                angle_backward = getAngle()
+                system.coordinate_array[atom_id, dim] += derivative_width
+                assert forces[atom_id, dim] == pytest.approx(
+                    torque * (angle_forward - angle_backward) / (2 * derivative_width), abs=1e-6
+                )
@@ -0,0 +1,235 @@
+import pytest, os
+import numpy as np
+
+from ..unit import *
+from ..unit import Quantity, QuantityArray
+from .. import isArrayEqual, isArrayAlmostEqual, SequenceLoader
+from ..exceptions import DismatchedDimensionError
+
+cur_dir = os.path.abspath(os.path.dirname(os.path.abspath(__file__)))
+
+class TestQuantityArray:
+    def setup(self):
+        pass
+
+    def teardown(self):
+        pass
+
+    def test_attributes(self):
+        quantity_array = QuantityArray([1, 2, 3], angstrom)
+        assert quantity_array.value.dtype == np.float64
+        assert quantity_array.unit == angstrom.unit
+        assert quantity_array.shape == (3, )
+        assert quantity_array.ndim == 1
+        assert quantity_array.size == 3
+        assert len(quantity_array) == 3
+
+        quantity_array = QuantityArray(np.ones([2, 3]), 2 * angstrom)
+        assert isArrayEqual(quantity_array.value, np.ones([2, 3]) * 2)
+        assert quantity_array.T.shape == (3, 2)
+
+        value = np.ones(3)
+        quantity_array = QuantityArray(value, angstrom)
+        value[0] = 2
+        assert quantity_array.value[0] == 1
+
+    def test_exceptions(self):
+        quantity_array = QuantityArray([1, 2, 3], angstrom)
+        with pytest.raises(DismatchedDimensionError):
+            quantity_array + QuantityArray([1, 2, 3], second)
+
+        with pytest.raises(DismatchedDimensionError):
+            quantity_array.convertTo(second)
+
+        with pytest.raises(DismatchedDimensionError):
+            quantity_array[0] = 1 * second
+
+        with pytest.raises(ValueError):
+            quantity_array ** quantity_array
+
+    def test_fromQuantities(self):
+        quantity_array = QuantityArray.fromQuantities([1 * angstrom, 1 * nanometer])
+        assert quantity_array.unit == angstrom.unit
+        assert isArrayAlmostEqual(quantity_array.value, [1, 10])
+
+        quantity_array = QuantityArray.fromQuantities(np.ones([2, 2]) * angstrom, nanometer)
+        assert quantity_array.shape == (2, 2)
+        assert isArrayAlmostEqual(quantity_array.value.flatten(), [0.1] * 4)
+
+        with pytest.raises(DismatchedDimensionError):
+            QuantityArray.fromQuantities([1 * angstrom, 1 * second])
+
+    def test_toQuantities(self):
+        quantities = QuantityArray([1, 2], angstrom).toQuantities()
+        assert quantities.dtype == object
+        assert quantities[1] == 2 * angstrom
+
+    def test_convertTo(self):
+        quantity_array = QuantityArray([1, 2, 3], nanometer)
+        quantity_array_angstrom = quantity_array.convertTo(angstrom)
+        assert quantity_array_angstrom.unit == angstrom.unit
+        assert isArrayAlmostEqual(quantity_array_angstrom.value, [10, 20, 30])
+        assert quantity_array_angstrom.convertTo(nanometer).unit == nanometer.unit
+        assert isArrayEqual(quantity_array == quantity_array_angstrom, [True] * 3)
+
+    def test_getitem(self):
+        quantity_array = QuantityArray(np.arange(6).reshape(2, 3), angstrom)
+        assert isinstance(quantity_array[0, 1], Quantity)
+        assert quantity_array[0, 1] == 1 * angstrom
+        assert isinstance(quantity_array[1], QuantityArray)
+        assert quantity_array[1][2] == 5 * angstrom
+        assert quantity_array[:, 0].shape == (2, )
+        assert [i for i in quantity_array[0]][2] == 2 * angstrom
+
+    def test_setitem(self):
+        quantity_array = QuantityArray(np.zeros([2, 3]), angstrom)
+        quantity_array[0, 0] = 1 * nanometer
+        assert quantity_array.value[0, 0] == pytest.approx(10)
+        quantity_array[1, :] = QuantityArray([1, 2, 3], nanometer)
+        assert isArrayAlmostEqual(quantity_array.value[1, :], [10, 20, 30])
+        quantity_array[1, :] = np.array([1, 2, 3]) * angstrom
+        assert isArrayAlmostEqual(quantity_array.value[1, :], [1, 2, 3])
+        quantity_array[0, :] = [4, 5, 6]
+        assert isArrayEqual(quantity_array.value[0, :], [4, 5, 6])
+
+        view = quantity_array[0]
+        view[0] = 0
+        assert quantity_array.value[0, 0] == 0
+
+    def test_add(self):
+        quantity_array = QuantityArray([1, 2, 3], angstrom)
+        result = quantity_array + QuantityArray([1, 1, 1], nanometer)
+        assert result.unit == angstrom.unit
+        assert isArrayAlmostEqual(result.value, [11, 12, 13])
+
+        result = quantity_array + 1 * nanometer
+        assert isArrayAlmostEqual(result.value, [11, 12, 13])
+        result = 1 * nanometer + quantity_array
+        assert isArrayAlmostEqual(result.convertTo(angstrom).value, [11, 12, 13])
+
+        result = quantity_array + 1
+        assert isArrayEqual(result.value, [2, 3, 4])
+
+        quantity_array += QuantityArray([1, 1, 1], angstrom)
+        assert isArrayEqual(quantity_array.value, [2, 3, 4])
+
+        result = np.array([1, 2, 3]) * angstrom + quantity_array
+        assert result.dtype == object
+        assert result[0] == 3 * angstrom
+
+    def test_sub(self):
+        quantity_array = QuantityArray([11, 12, 13], angstrom)
+        result = quantity_array - QuantityArray([1, 1, 1], nanometer)
+        assert isArrayAlmostEqual(result.value, [1, 2, 3])
+        result = 2 * nanometer - quantity_array
+        assert isArrayAlmostEqual(result.convertTo(angstrom).value, [9, 8, 7])
+        assert isArrayEqual((-quantity_array).value, [-11, -12, -13])
+
+    def test_mul(self):
+        quantity_array = QuantityArray([1, 2, 3], angstrom)
+        result = quantity_array * 2
+        assert result.unit == angstrom.unit
+        assert isArrayEqual(result.value, [2, 4, 6])
+
+        result = np.array([1, 2, 3]) * quantity_array
+        assert isArrayEqual(result.value, [1, 4, 9])
+
+        result = quantity_array * (2 * amu)
+        assert result.unit.base_dimension == (angstrom * amu).unit.base_dimension
+        result = 2 * amu * quantity_array
+        assert result.unit.base_dimension == (angstrom * amu).unit.base_dimension
+
+        result = quantity_array * quantity_array
+        assert result.unit == (angstrom * angstrom).unit
+
+        # Broadcasting
+        result = QuantityArray(np.ones([4, 3]), angstrom) * np.arange(4).reshape(4, 1)
+        assert result.shape == (4, 3)
+        assert isArrayEqual(result.value[:, 0], [0, 1, 2, 3])
+
+    def test_div(self):
+        quantity_array = QuantityArray([2, 4, 6], angstrom)
+        result = quantity_array / 2
+        assert isArrayEqual(result.value, [1, 2, 3])
+
+        result = quantity_array / angstrom
+        assert isinstance(result, np.ndarray)
+        assert isArrayAlmostEqual(result, [2, 4, 6])
+
+        result = quantity_array / nanometer
+        assert isinstance(result, np.ndarray)
+        assert isArrayAlmostEqual(result, [0.2, 0.4, 0.6])
+
+        result = 1 / QuantityArray([1, 2], femtosecond)
+        assert result.unit == (1 / femtosecond).unit
+        assert isArrayAlmostEqual(result.value, [1, 0.5])
+
+    def test_pow(self):
+        quantity_array = QuantityArray([1, 2, 3], angstrom)
+        result = quantity_array ** 2
+        assert result.unit == (angstrom**2).unit
+        assert isArrayEqual(result.value, [1, 4, 9])
+
+        result = np.sqrt(result)
+        assert result.unit == angstrom.unit
+        assert isArrayAlmostEqual(result.value, [1, 2, 3])
+        assert np.square(quantity_array).unit == (angstrom**2).unit
+
+    def test_comparison(self):
+        quantity_array = QuantityArray([1, 2, 3], angstrom)
+        assert isArrayEqual(quantity_array > 2 * angstrom, [False, False, True])
+        assert isArrayEqual(quantity_array <= QuantityArray([1, 1, 1], angstrom), [True, False, False])
+        assert isArrayEqual(quantity_array < 1 * nanometer, [True] * 3)
+        assert isArrayEqual(1 * nanometer > quantity_array, [True] * 3)
+        assert isArrayEqual(quantity_array == 2 * angstrom, [False, True, False])
+        assert isArrayEqual(quantity_array != 0.2 * nanometer, [True, False, True])
+
+    def test_reduction(self):
+        quantity_array = QuantityArray(np.arange(6).reshape(2, 3), angstrom)
+        assert quantity_array.sum() == 15 * angstrom
+        assert isinstance(quantity_array.sum(0), QuantityArray)
+        assert isArrayEqual(quantity_array.sum(0).value, [3, 5, 7])
+        assert quantity_array.max() == 5 * angstrom
+        assert quantity_array.min() == 0 * angstrom
+        assert isArrayEqual(quantity_array.mean(1).value, [1, 4])
+        assert isArrayEqual(abs(-quantity_array).value.flatten(), np.arange(6))
+        assert quantity_array.reshape(3, 2).shape == (3, 2)
+        assert quantity_array.flatten().shape == (6, )
+
+    def test_out(self):
+        quantity_array = QuantityArray([1, 2, 3], angstrom)
+        out = np.zeros(3)
+        np.multiply(quantity_array, 1 / angstrom, out=out)
+        assert isArrayEqual(out, [1, 2, 3])
+
+        out = QuantityArray(np.zeros(3), nanometer)
+        np.add(quantity_array, quantity_array, out=out)
+        assert out.unit == nanometer.unit
+        assert isArrayAlmostEqual(out.value, [0.2, 0.4, 0.6])
+
+    def test_copy(self):
+        quantity_array = QuantityArray([1, 2, 3], angstrom)
+        copy = quantity_array.copy()
+        copy[0] = 0
+        assert quantity_array.value[0] == 1
+
+    def test_system(self):
+        system = SequenceLoader(os.path.join(cur_dir, 'data/testForceEncoder.json')).createSystem()
+        coordinate = system.coordinate
+        assert isinstance(coordinate, QuantityArray)
+        assert coordinate.shape == (system.num_atoms, 3)
+        assert isArrayEqual(coordinate.value.flatten(), system.coordinate_array.flatten())
+
+        system.coordinate = coordinate.convertTo(nanometer) + 1 * angstrom
+        assert isArrayAlmostEqual(
+            system.coordinate_array.flatten(), (coordinate.value + 1).flatten()
+        )
+        with pytest.raises(DismatchedDimensionError):
+            system.velocity = coordinate
+
+        atom = system.atoms[0]
+        assert isinstance(atom.coordinate, QuantityArray)
+        atom.velocity = QuantityArray([1, 2, 3], nanometer / picosecond)
+        assert isArrayAlmostEqual(system.velocity_array[0, :], [0.01, 0.02, 0.03])
+        with pytest.raises(ValueError):
+            atom.force = QuantityArray([1, 2, 3], angstrom)
@@ -0,0 +1,69 @@
+import pytest, os
+import numpy as np
+from .. import RESPAIntegrator, VelocityVerletIntegrator, SequenceLoader, ForceEncoder
+from ..unit import *
+from ..exceptions import DismatchedDimensionError
+
+cur_dir = os.path.abspath(os.path.dirname(os.path.abspath(__file__)))
+
+class TestRESPAIntegrator:
+    def setup(self):
+        self.integrator = RESPAIntegrator(4, 4)
+        self.system = SequenceLoader(os.path.join(cur_dir, 'data/testForceEncoder.json')).createSystem()
+        self.ensemble = ForceEncoder(self.system, bonded_force_group=1).createEnsemble()
+        self.integrator._bindEnsemble(self.ensemble)
+
+    def teardown(self):
+        self.integrator = None
+
+    def test_attributes(self):
+        assert self.integrator.sim_interval == 4 * femtosecond
+        assert self.integrator.num_inner_steps == 4
+        assert self.integrator.fast_force_group == [1]
+        assert self.integrator.slow_force_group == [0]
+        assert self.integrator.temperature == 300 * kelvin
+        assert self.integrator.calculateTemperature() == 300 * kelvin
+
+    def test_exceptions(self):
+        with pytest.raises(ValueError):
+            RESPAIntegrator(4, 0)
+
+        with pytest.raises(ValueError):
+            RESPAIntegrator(4, 4, fast_force_group=[0, 1], slow_force_group=[0])
+
+        with pytest.raises(DismatchedDimensionError):
+            RESPAIntegrator(4*kelvin)
+
+        # Default ForceEncoder puts all forces in group 0, leaving the fast group empty
+        system = SequenceLoader(os.path.join(cur_dir, 'data/testForceEncoder.json')).createSystem()
+        with pytest.raises(ValueError):
+            RESPAIntegrator(4)._bindEnsemble(ForceEncoder(system).createEnsemble())
+        with pytest.raises(ValueError):
+            RESPAIntegrator(4, slow_force_group=[2])._bindEnsemble(self.ensemble)
+
+    def test_step(self):
+        force_groups = []
+        calculate_forces = self.integrator._calculateForces
+        def _calculateForces(force_group):
+            force_groups.append(force_group)
+            return calculate_forces(force_group)
+        self.integrator._calculateForces = _calculateForces
+        self.integrator.step(10)
+        # Slow forces are calculated once per outer step, fast forces once per inner step
+        assert force_groups.count([0]) == 10 + 1
+        assert force_groups.count([1]) == 10 * 4 + 1
+        assert np.allclose(self.system.force_array, self.ensemble.calculateForces([0, 1]))
+
+    def test_velocityVerlet(self):
+        # RESPA with one inner step is identical to velocity verlet
+        integrator = RESPAIntegrator(1, 1)
+        integrator._bindEnsemble(self.ensemble)
+        system = SequenceLoader(os.path.join(cur_dir, 'data/testForceEncoder.json')).createSystem()
+        system.coordinate_array[:, :] = self.system.coordinate_array
+        velocity_verlet = VelocityVerletIntegrator(1)
+        velocity_verlet._bindEnsemble(ForceEncoder(system).createEnsemble())
+        system.velocity_array[:, :] = self.system.velocity_array
+        integrator.step(20)
+        velocity_verlet.step(20)
+        assert np.allclose(system.coordinate_array, self.system.coordinate_array)
+        assert np.allclose(system.velocity_array, self.system.velocity_array)
@@ -1,6 +1,8 @@
 import pytest, os
 
+import numpy as np
 from .. import SequenceLoader, ForceEncoder, VelocityVerletIntegrator, Simulation, LogDumper, SnapshotDumper
+from .. import Ensemble, CenterConstraintForce, RESPAIntegrator
 from ..unit import *
 
 cur_dir = os.path.abspath(os.path.dirname(os.path.abspath(__file__)))
@@ -53,7 +55,7 @@ class TestSimulation:
         dumper2 = LogDumper(os.path.join(cur_dir, 'output/outputSimulation.log'), 20)
         self.simulation.addDumpers(dumper1, dumper2)
         assert self.simulation.num_dumpers == 2
-        assert self.simulation._gcd_interval == 10
+        assert self.simulation._dumper_intervals == [10, 20]
         
     def test_dump(self):
         log_dumper = LogDumper(
@@ -69,6 +71,53 @@ class TestSimulation:
         self.simulation._integrator._sim_interval = 0.1 * femtosecond
         self.simulation.step(30)
 
+    def test_step(self):
+        dumper1 = LogDumper(os.path.join(cur_dir, 'output/outputSimulation.log'), 7, get_steps=True)
+        dumper2 = SnapshotDumper(os.path.join(cur_dir, 'output/outputSimulation.pds'), 5)
+        self.simulation.addDumpers(dumper1, dumper2)
+        callback_steps = []
+        self.simulation.addCallback(lambda simulation: callback_steps.append(simulation.cur_step), 4)
+        with pytest.raises(ValueError):
+            self.simulation.addCallback(print, 0)
+        num_steps = []
+        step = self.integrator.step
+        def countedStep(num_step):
+            num_steps.append(num_step)
+            step(num_step)
+        self.integrator.step = countedStep
+        self.simulation.step(23)
+        # Integrator runs exactly to the next event instead of the gcd of intervals
+        assert num_steps == [4, 1, 2, 1, 2, 2, 2, 1, 1, 4, 1, 2]
+        assert sum(num_steps) == 23
+        assert self.simulation.cur_step == 23
+        assert self.simulation.remain_step == 0
+        assert callback_steps == [4, 8, 12, 16, 20]
+        with open(os.path.join(cur_dir, 'output/outputSimulation.log'), 'r') as io:
+            steps = [int(line) for line in io.readlines()[2:]]
+        assert steps == [0, 7, 14, 21, 23]
+        with open(os.path.join(cur_dir, 'output/outputSimulation.pds'), 'r') as io:
+            assert io.read().count('ENDFRAME') == 6
+
+        num_steps.clear()
+        self.simulation.step(10)
+        assert num_steps == [1, 1, 3, 2, 2, 1]
+        assert callback_steps[5:] == [24, 28, 32]
+
+    def test_profile(self):
+        dumper = SnapshotDumper(os.path.join(cur_dir, 'output/outputSimulation.pds'), 5)
+        self.simulation.addDumpers(dumper)
+        self.simulation.addCallback(lambda simulation: None, 10)
+        self.ensemble.enableProfiling()
+        self.simulation.step(20)
+        profile = self.ensemble.getProfile()
+        assert profile['phases']['integrator']['num_calls'] == 4
+        assert profile['phases']['SnapshotDumper 0']['num_calls'] == 5
+        assert profile['phases']['callback 0']['num_calls'] == 2
+        assert profile['phases']['integrator']['time'] > 0
+        # Forces of the initial coordinate and once per step
+        for force in self.ensemble.forces:
+            assert profile['forces'][force.force_id]['num_calls'] == 21
+
     def test_minimizeEnergy(self):
         with pytest.raises(ValueError):
             self.simulation.minimizeEnergy('aa')
@@ -79,4 +128,85 @@ class TestSimulation:
 
         cur_energy = self.simulation._ensemble.calculatePotentialEnergy()
         self.simulation.minimizeEnergy('sd', max_iteration=2)
-        assert cur_energy > self.simulation._ensemble.calculatePotentialEnergy()
\ No newline at end of file
+        assert cur_energy > self.simulation._ensemble.calculatePotentialEnergy()
+        result = self.simulation.minimizeEnergy('gd', max_iteration=5)
+        assert result['method'] == 'gd'
+        assert result['num_iterations'] <= 5
+        assert result['num_evaluations'] == result['num_iterations'] * 2
+
+    def test_minimizeEnergyGradient(self):
+        for method in ['cg', 'lbfgs', 'fire']:
+            self.setup()
+            cur_energy = self.simulation._ensemble.calculatePotentialEnergy() / kilojoule_permol
+            result = self.simulation.minimizeEnergy(method, max_iteration=20)
+            assert result['method'] == method
+            assert result['initial_energy'] == pytest.approx(cur_energy)
+            assert result['final_energy'] < cur_energy
+            assert result['final_energy'] == pytest.approx(
+                self.simulation._ensemble.calculatePotentialEnergy() / kilojoule_permol
+            )
+            assert result['num_iterations'] <= 20
+            assert result['num_evaluations'] >= result['num_iterations']
+
+        # Loose tolerance stops at the first iteration
+        self.setup()
+        result = self.simulation.minimizeEnergy('cg', force_tolerance=1e10)
+        assert result['is_converged'] == True
+        assert result['num_iterations'] == 0
+
+        # Forces consistent with energy converge by force tolerance
+        for method in ['cg', 'lbfgs']:
+            system = SequenceLoader(os.path.join(cur_dir, 'data/testSimulation.json')).createSystem()
+            ensemble = Ensemble(system)
+            ensemble.addForces(CenterConstraintForce(origin_center=[0, 0, 0]))
+            system.coordinate_array[:, :] += 1
+            system.updateCoordinateVersion()
+            simulation = Simulation(ensemble, VelocityVerletIntegrator(1))
+            result = simulation.minimizeEnergy(method, force_tolerance=1e-6, max_displacement=1)
+            assert result['is_converged'] == True
+            assert result['max_force'] < 1e-6
+            mass_center = (system.coordinate_array * system.mass_array).sum(0) / system.mass_array.sum()
+            assert np.allclose(mass_center, 0, atol=1e-5)
+
+    def test_minimizeEnergyFire(self):
+        velocity = self.system.velocity_array.copy()
+        result = self.simulation.minimizeEnergy('fire', max_iteration=50)
+        assert result['num_iterations'] == 50
+        assert result['num_evaluations'] == 51
+        assert result['final_energy'] < result['initial_energy']
+        # Velocity of system is kept for the following simulation
+        assert np.array_equal(self.system.velocity_array, velocity)
+
+        system = SequenceLoader(os.path.join(cur_dir, 'data/testSimulation.json')).createSystem()
+        ensemble = Ensemble(system)
+        ensemble.addForces(CenterConstraintForce(origin_center=[0, 0, 0]))
+        system.coordinate_array[:, :] += 1
+        system.updateCoordinateVersion()
+        simulation = Simulation(ensemble, VelocityVerletIntegrator(1))
+        result = simulation.minimizeEnergy('fire', force_tolerance=1e-4)
+        assert result['is_converged'] == True
+        assert result['max_force'] < 1e-4
+
+    def test_respaForceGroups(self):
+        # Bonded forces are in group 1 for RESPA, logged and minimized energy should contain all groups
+        system = SequenceLoader(os.path.join(cur_dir, 'data/testSimulation.json')).createSystem()
+        ensemble = ForceEncoder(system, bonded_force_group=1).createEnsemble()
+        assert ensemble.force_groups == [0, 1]
+        simulation = Simulation(ensemble, RESPAIntegrator(4, 4))
+        dumper = LogDumper(
+            os.path.join(cur_dir, 'output/outputSimulation.log'), 1, get_potential_energy=True
+        )
+        simulation.addDumpers(dumper)
+        simulation.step(1)
+        simulation.flushDumpers()
+        with open(os.path.join(cur_dir, 'output/outputSimulation.log'), 'r') as io:
+            logged_energy = float(io.readlines()[-1])
+        energy = ensemble.calculateReducedPotentialEnergy([0, 1])
+        assert energy != pytest.approx(ensemble.calculateReducedPotentialEnergy([0]))
+        assert logged_energy == pytest.approx(energy, abs=1e-5)
+
+        result = simulation.minimizeEnergy('fire', max_iteration=10)
+        assert result['initial_energy'] == pytest.approx(energy)
+        assert result['final_energy'] < energy
+        assert result['final_energy'] == pytest.approx(ensemble.calculateReducedPotentialEnergy([0, 1]))
+        simulation.closeDumpers()
@@ -1,5 +1,6 @@
 import pytest, os
-from .. import SnapshotVisualizer
+import numpy as np
+from .. import SnapshotVisualizer, convertPDSToPDT
 
 cur_dir = os.path.abspath(os.path.dirname(os.path.abspath(__file__)))
 
@@ -42,4 +43,21 @@ class TestSnapshotVisualizer:
         assert self.visualizer._sim_time_vec[-1] == 0.0002
         assert self.visualizer._frame_vec[-1] == 10
         
-        
\ No newline at end of file
+        
+
+    def test_readPDTFile(self):
+        pdt_file = os.path.join(cur_dir, 'output/outputSnapshotVisualizer.pdt')
+        convertPDSToPDT(os.path.join(cur_dir, 'data/test_snapshotVisualizer.pds'), pdt_file)
+        visualizer = SnapshotVisualizer(pdt_file)
+        assert visualizer.num_frames == 11
+        assert visualizer.num_atoms == 6
+        assert visualizer.num_bonds == 5
+        assert len(visualizer._atom_info[-1]) == 6
+        assert len(visualizer._bond_info[-1]) == 5
+        assert visualizer._sim_time_vec[-1] == pytest.approx(0.0002)
+        assert visualizer._frame_vec[-1] == 10
+        for frame in [0, -1]:
+            for atom, pdt_atom in zip(self.visualizer._atom_info[frame], visualizer._atom_info[frame]):
+                assert atom[:5] == pdt_atom[:5]
+                assert np.allclose(atom[-1], pdt_atom[-1], atol=1e-5)
+            assert np.allclose(self.visualizer._bond_info[frame], visualizer._bond_info[frame], atol=1e-5)
@@ -1,7 +1,8 @@
 import pytest
 import numpy as np
 
-from .. import Atom, Molecule, Chain, System
+from .. import Atom, Molecule, Chain, System, isArrayEqual, isArrayAlmostEqual
+from ..unit import *
 
 class TestSystem:
     def setup(self):
@@ -108,4 +109,36 @@ class TestSystem:
         for i in range(50):
             self.system.addChains(chain0)
             for molecule in self.system.chains[-1].molecules:
-                assert molecule.chain_id == i + 2
\ No newline at end of file
+                assert molecule.chain_id == i + 2
+
+    def test_stateBuffer(self):
+        molecule = Molecule('ASN')
+        atom1 = Atom('CA', 12)
+        atom2 = Atom('SC', 192)
+        atom1.coordinate = [1, 2, 3]
+        molecule.addAtoms(atom1, atom2)
+        chain = Chain(0)
+        chain.addMolecules(molecule, molecule)
+        self.system.addChains(chain)
+
+        assert self.system.coordinate_array.shape == (4, 3)
+        assert self.system.mass_array.shape == (4, 1)
+        assert isArrayEqual(self.system.mass_array[:, 0], [12, 192, 12, 192])
+        assert isArrayEqual(self.system.coordinate_array[0, :], [1, 2, 3])
+        assert isArrayEqual(self.system.coordinate_array[2, :], [1, 2, 3])
+        # Atoms are views of the state buffer
+        self.system.atoms[1].coordinate = [4, 5, 6]
+        assert isArrayEqual(self.system.coordinate_array[1, :], [4, 5, 6])
+        self.system.coordinate_array[3, :] += 1
+        assert self.system.atoms[3].coordinate[0] == 1 * angstrom
+        self.system.velocity = np.ones([4, 3]) * nanometer / picosecond
+        assert isArrayAlmostEqual(self.system.atoms[0].velocity, np.ones(3) * 0.01 * angstrom / femtosecond)
+        self.system.force = np.ones([4, 3])
+        assert isArrayEqual(self.system.force_array, np.ones([4, 3]))
+        # State is kept while adding new chains
+        self.system.addChains(chain)
+        assert self.system.coordinate_array.shape == (8, 3)
+        assert isArrayEqual(self.system.coordinate_array[1, :], [4, 5, 6])
+        assert isArrayEqual(self.system.atoms[1]._coordinate, [4, 5, 6])
+        self.system.coordinate_array[1, :] = 0
+        assert isArrayEqual(self.system.atoms[1]._coordinate, [0, 0, 0])
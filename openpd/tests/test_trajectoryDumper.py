@@ -0,0 +1,67 @@
+import pytest, os
+import numpy as np
+from .. import TrajectoryDumper, TrajectoryFile
+from .. import SequenceLoader, ForceEncoder, VelocityVerletIntegrator, Simulation
+from ..unit import *
+from ..exceptions import NonboundError
+
+cur_dir = os.path.abspath(os.path.dirname(os.path.abspath(__file__)))
+output_file = os.path.join(cur_dir, 'output/outputTrajectoryDumper.pdt')
+
+class TestTrajectoryDumper:
+    def setup(self):
+        self.dumper = TrajectoryDumper(output_file, 10)
+        self.system = SequenceLoader(os.path.join(cur_dir, 'data/testSimulation.json')).createSystem()
+        self.ensemble = ForceEncoder(self.system).createEnsemble()
+        self.simulation = Simulation(self.ensemble, VelocityVerletIntegrator(1))
+
+    def teardown(self):
+        self.dumper = None
+
+    def test_attributes(self):
+        assert self.dumper.dump_interval == 10
+        assert self.dumper.precision == 'float32'
+
+    def test_exceptions(self):
+        with pytest.raises(NonboundError):
+            self.dumper._test_bound()
+
+        with pytest.raises(ValueError):
+            TrajectoryDumper(os.path.join(cur_dir, 'output/outputTrajectoryDumper.pds'), 10)
+
+        with pytest.raises(ValueError):
+            TrajectoryDumper(output_file, 10, precision='float16')
+
+    def test_dump(self):
+        self.simulation.addDumpers(self.dumper)
+        self.simulation.step(30)
+        trajectory = TrajectoryFile(output_file)
+        assert trajectory.num_frames == 4
+        assert trajectory.num_atoms == self.system.num_atoms
+        assert trajectory.num_bonds == self.system.topology.num_bonds
+        assert trajectory.precision == 'float32'
+        assert trajectory.atoms[1][1] == 'SC'
+        assert np.allclose(trajectory.sim_time, np.arange(4) * 10 * (femtosecond / nanosecond))
+        assert trajectory.coordinate.shape == (4, self.system.num_atoms, 3)
+        assert np.allclose(trajectory.getFrame(-1), self.system.coordinate_array, atol=1e-4)
+
+    def test_append(self):
+        self.simulation.addDumpers(self.dumper)
+        self.simulation.step(10)
+        # A crashed run leaves an incomplete frame
+        with open(output_file, 'ab') as io:
+            io.write(b'\x00' * 10)
+        assert TrajectoryFile(output_file).num_frames == 2
+
+        dumper = TrajectoryDumper(output_file, 10, is_overwrite=False)
+        simulation = Simulation(self.ensemble, VelocityVerletIntegrator(1))
+        simulation.addDumpers(dumper)
+        assert dumper.cur_frame == 2
+        simulation.step(10)
+        trajectory = TrajectoryFile(output_file)
+        assert trajectory.num_frames == 4
+        assert np.allclose(trajectory.getFrame(3), self.system.coordinate_array, atol=1e-4)
+
+        with pytest.raises(ValueError):
+            dumper = TrajectoryDumper(output_file, 10, is_overwrite=False, precision='float64')
+            Simulation(self.ensemble, VelocityVerletIntegrator(1)).addDumpers(dumper)
@@ -0,0 +1,88 @@
+import pytest, os
+import numpy as np
+from .. import TrajectoryDumper, TrajectoryFile, SnapshotDumper, convertPDSToPDT, convertPDTToPDS
+from .. import SequenceLoader, ForceEncoder, VelocityVerletIntegrator, Simulation
+from ..dumper.trajectoryFile import getFrameDtype
+
+cur_dir = os.path.abspath(os.path.dirname(os.path.abspath(__file__)))
+pdt_file = os.path.join(cur_dir, 'output/outputTrajectoryFile.pdt')
+pds_file = os.path.join(cur_dir, 'output/outputTrajectoryFile.pds')
+
+class TestTrajectoryFile:
+    def setup(self):
+        self.system = SequenceLoader(os.path.join(cur_dir, 'data/testSimulation.json')).createSystem()
+        ensemble = ForceEncoder(self.system).createEnsemble()
+        simulation = Simulation(ensemble, VelocityVerletIntegrator(1))
+        simulation.addDumpers(
+            TrajectoryDumper(pdt_file, 5, precision='float64'), SnapshotDumper(pds_file, 5)
+        )
+        simulation.step(20)
+        self.trajectory = TrajectoryFile(pdt_file)
+
+    def teardown(self):
+        self.trajectory = None
+
+    def test_attributes(self):
+        assert self.trajectory.pdt_file == pdt_file
+        assert self.trajectory.num_frames == 5
+        assert self.trajectory.precision == 'float64'
+        assert self.trajectory.bond_index.shape == (self.system.topology.num_bonds, 2)
+        assert isinstance(self.trajectory.coordinate, np.memmap)
+
+    def test_exceptions(self):
+        with pytest.raises(ValueError):
+            TrajectoryFile(pds_file)
+
+        invalid_file = os.path.join(cur_dir, 'output/outputTrajectoryFileInvalid.pdt')
+        with open(invalid_file, 'wb') as io:
+            io.write(b'OPENPDS\x00' + b'\x00' * 8)
+        with pytest.raises(ValueError):
+            TrajectoryFile(invalid_file)
+
+    def test_frameLayout(self):
+        # Frames can be mapped directly with np.memmap
+        frame_dtype = getFrameDtype(self.system.num_atoms, 'float64')
+        offset = os.path.getsize(pdt_file) - 5 * frame_dtype.itemsize
+        frames = np.memmap(pdt_file, dtype=frame_dtype, mode='r', offset=offset)
+        assert np.allclose(frames['coordinate'][-1], self.system.coordinate_array)
+        assert np.allclose(frames['sim_time'], self.trajectory.sim_time)
+
+    def test_convert(self):
+        converted_pdt_file = os.path.join(cur_dir, 'output/outputTrajectoryFileConverted.pdt')
+        converted_pds_file = os.path.join(cur_dir, 'output/outputTrajectoryFileConverted.pds')
+        assert convertPDSToPDT(pds_file, converted_pdt_file) == 5
+        converted = TrajectoryFile(converted_pdt_file)
+        assert converted.precision == 'float32'
+        assert converted.atoms == self.trajectory.atoms
+        assert np.allclose(converted.bond_index, self.trajectory.bond_index)
+        assert np.allclose(converted.sim_time, self.trajectory.sim_time)
+        assert np.allclose(converted.coordinate, self.trajectory.coordinate, atol=1e-5)
+
+        assert convertPDTToPDS(pdt_file, converted_pds_file) == 5
+        with open(pds_file, 'r') as io:
+            origin_lines = io.readlines()[1:]
+        with open(converted_pds_file, 'r') as io:
+            converted_lines = io.readlines()[1:]
+        assert converted_lines == origin_lines
+
+    def test_convertExceptions(self):
+        converted_pdt_file = os.path.join(cur_dir, 'output/outputTrajectoryFileConverted.pdt')
+        converted_pds_file = os.path.join(cur_dir, 'output/outputTrajectoryFileConverted.pds')
+        with open(pds_file, 'r') as io:
+            lines = io.readlines()
+        atom_index = [i for i, line in enumerate(lines) if line.startswith('ATOM')]
+        bond_index = [i for i, line in enumerate(lines) if line.startswith('BOND')]
+        # Bond atom at a coordinate without atom
+        data = lines[bond_index[0]].split()
+        data[2] = '%.6f' %(float(data[2]) + 0.01)
+        with open(converted_pds_file, 'w') as io:
+            io.writelines(lines[:bond_index[0]] + [' '.join(data) + '\n'] + lines[bond_index[0]+1:])
+        with pytest.raises(ValueError):
+            convertPDSToPDT(converted_pds_file, converted_pdt_file)
+        # Two atoms at the same coordinate
+        data = lines[atom_index[1]].split()
+        data[6:9] = lines[atom_index[0]].split()[6:9]
+        with open(converted_pds_file, 'w') as io:
+            io.writelines(lines[:atom_index[1]] + [' '.join(data) + '\n'] + lines[atom_index[1]+1:])
+        with pytest.raises(ValueError):
+            convertPDSToPDT(converted_pds_file, converted_pdt_file)
@@ -1,4 +1,5 @@
-import pytest
+import pytest, pickle
+from copy import deepcopy
 from ..unit import BaseDimension, Unit
 from ..exceptions import DismatchedDimensionError
 
@@ -28,9 +29,22 @@ class TestUnit:
         assert not self.unit.isDimensionLess()
         assert BaseDimension().isDimensionLess()
 
-    def test_setRelativeValueToOne(self):
-        self.unit.setRelativeValueToOne()
-        assert self.unit.relative_value == 1
+    def test_immutable(self):
+        with pytest.raises(AttributeError):
+            self.unit._relative_value = 1
+
+        with pytest.raises(AttributeError):
+            self.unit._base_dimension = BaseDimension()
+
+    def test_interned(self):
+        assert self.unit is Unit(BaseDimension(length_dimension=1), 1e-10)
+        assert deepcopy(self.unit) is self.unit
+        assert pickle.loads(pickle.dumps(self.unit)) is self.unit
+        gram = Unit(BaseDimension(mass_dimension=1), 1e-3)
+        assert self.unit * gram is self.unit * gram
+        assert self.unit / gram is self.unit / gram
+        assert self.unit + self.unit is self.unit
+        assert 1 * self.unit is self.unit
 
     def test_eq(self):
         assert self.unit == Unit(BaseDimension(length_dimension=1), 1e-10)
@@ -0,0 +1,43 @@
+import pytest, os
+import numpy as np
+from .. import PDBLoader, ForceEncoder, VelocityVerletIntegrator
+from ..benchmark import UnitModeBenchmark
+
+cur_dir = os.path.abspath(os.path.dirname(os.path.abspath(__file__)))
+
+class TestUnitModeBenchmark:
+    def setup(self):
+        self.benchmark = UnitModeBenchmark(os.path.join(cur_dir, 'data/normal.pdb'), seed=0)
+
+    def teardown(self):
+        self.benchmark = None
+
+    def test_attributes(self):
+        assert self.benchmark.system.num_atoms == 20
+
+    def test_seed(self):
+        benchmark = UnitModeBenchmark(os.path.join(cur_dir, 'data/normal.pdb'), seed=0)
+        assert np.array_equal(benchmark.runReducedMode(3)[1], self.benchmark.runReducedMode(3)[1])
+
+    def test_runReducedMode(self):
+        # Reduced mode is a plain VelocityVerletIntegrator run
+        _, reduced_coord, reduced_energies = self.benchmark.runReducedMode(5)
+        system = PDBLoader(os.path.join(cur_dir, 'data/normal.pdb')).createSystem()
+        ensemble = ForceEncoder(system).createEnsemble()
+        integrator = VelocityVerletIntegrator(1, 300, seed=self.benchmark._seed)
+        integrator._bindEnsemble(ensemble)
+        integrator.step(5)
+        assert np.allclose(reduced_coord, system.coordinate_array)
+        assert reduced_energies[-1] == pytest.approx(ensemble.calculateReducedPotentialEnergy())
+        assert not np.allclose(reduced_coord, self.benchmark._origin_coordinate)
+
+    def test_run(self):
+        _, reduced_coord, reduced_energies = self.benchmark.runReducedMode(5)
+        _, unit_coord, unit_energies = self.benchmark.runUnitMode(5)
+        assert len(unit_energies) == 5
+        assert np.allclose(reduced_coord, unit_coord, atol=1e-8)
+        assert np.allclose(reduced_energies, unit_energies, atol=1e-8)
+
+        result = self.benchmark.run(5)
+        assert result['max_deviation'] < 1e-8
+        assert result['max_energy_deviation'] < 1e-8
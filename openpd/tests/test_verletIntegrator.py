@@ -1,5 +1,6 @@
 import pytest, os
-from .. import VerletIntegrator, SequenceLoader, ForceEncoder
+import numpy as np
+from .. import VerletIntegrator, VelocityVerletIntegrator, SequenceLoader, ForceEncoder
 from ..unit import *
 from ..exceptions import DismatchedDimensionError
 
@@ -27,4 +28,33 @@ class TestVerletIntegrator:
             self.integrator.sim_interval = 1 * kilogram
 
     def test_step(self):
-        self.integrator.step(100)
\ No newline at end of file
+        self.integrator.step(100)
+
+    def test_numForceEvaluations(self):
+        force_groups = []
+        calculate_forces = self.integrator._calculateForces
+        def _calculateForces(force_group):
+            force_groups.append(force_group)
+            return calculate_forces(force_group)
+        self.integrator._calculateForces = _calculateForces
+        self.integrator.step(10)
+        assert len(force_groups) == 10 + 1
+        # Forces of the last step are reused
+        self.integrator.step(10)
+        assert len(force_groups) == 20 + 1
+        self.integrator._system.updateCoordinateVersion()
+        self.integrator.step(1)
+        assert len(force_groups) == 21 + 2
+
+    def test_velocityVerlet(self):
+        # Position verlet started from x(t-dt) = x - v*dt + a*dt**2/2 follows the trajectory of velocity verlet
+        system = self.integrator._system
+        velocity_verlet = VelocityVerletIntegrator(1)
+        velocity_system = SequenceLoader(os.path.join(cur_dir, 'data/testForceEncoder.json')).createSystem()
+        velocity_system.coordinate_array[:, :] = system.coordinate_array
+        velocity_verlet._bindEnsemble(ForceEncoder(velocity_system).createEnsemble())
+        system.velocity_array[:, :] = velocity_system.velocity_array
+        self.integrator.step(10)
+        self.integrator.step(10)
+        velocity_verlet.step(20)
+        assert np.allclose(system.coordinate_array, velocity_system.coordinate_array)
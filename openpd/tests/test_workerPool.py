@@ -0,0 +1,53 @@
+import pytest, os
+import numpy as np
+from .. import WorkerPool, SequenceLoader, ForceEncoder
+from ..unit import *
+
+cur_dir = os.path.abspath(os.path.dirname(os.path.abspath(__file__)))
+
+class TestWorkerPool:
+    def setup(self):
+        self.system = SequenceLoader(os.path.join(cur_dir, 'data/testForceEncoder.json')).createSystem()
+        self.ensemble = ForceEncoder(self.system).createEnsemble()
+
+    def teardown(self):
+        self.system = None
+        self.ensemble = None
+
+    def test_attributes(self):
+        pool = WorkerPool(self.ensemble, 2, 'thread')
+        assert pool.num_workers == 2
+        assert pool.pool_type == 'thread'
+        assert pool.is_closed == False
+        pool.close()
+        assert pool.is_closed == True
+
+        # Each force is one task, workers more than forces are not started
+        pool = WorkerPool(self.ensemble, 16, 'thread')
+        assert pool.num_workers == self.ensemble.num_forces
+        pool.close()
+
+    def test_exceptions(self):
+        with pytest.raises(ValueError):
+            WorkerPool(self.ensemble, 2, 'gpu')
+
+        pool = WorkerPool(self.ensemble, 2, 'thread')
+        pool.close()
+        with pytest.raises(RuntimeError):
+            pool.calculateForces()
+
+    def test_calculateEnergyAndForces(self):
+        energy, forces = self.ensemble.calculateEnergyAndForces()
+        for pool_type in ['thread', 'process']:
+            pool = WorkerPool(self.ensemble, 2, pool_type)
+            pool_energy, pool_forces = pool.calculateEnergyAndForces()
+            assert pool_energy / kilojoule_permol == pytest.approx(energy / kilojoule_permol)
+            assert np.allclose(pool_forces, forces)
+
+            # Workers see coordinates updated by the main process
+            self.system.coordinate_array[:, :] += 0.1
+            self.system.updateCoordinateVersion()
+            assert np.allclose(pool.calculateForces(), self.ensemble.calculateForces())
+            self.system.coordinate_array[:, :] -= 0.1
+            self.system.updateCoordinateVersion()
+            pool.close()
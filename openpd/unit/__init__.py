@@ -7,6 +7,7 @@ __license__ = "GPLv3"
 from .baseDimension import BaseDimension
 from .unit import Unit
 from .quantity import Quantity
+from .quantityArray import QuantityArray
 
 from .unitDefinition import length, mass, time, temperature, charge, mol_dimension
 from .unitDefinition import force, energy, power, velocity, accelration
@@ -23,6 +24,8 @@ from .unitDefinition import joule, kilojoule, joule_permol, kilojoule_permol, ca
 from .unitDefinition import newton, kilonewton
 from .unitDefinition import kilojoule_permol_over_angstrom, kilojoule_permol_over_nanometer, kilocalorie_permol_over_angstrom, kilocalorie_permol_over_nanometer
 from .unitDefinition import watt, kilowatt
+from .unitDefinition import internal_length, internal_time, internal_mass, internal_energy, internal_velocity, internal_force
+from .unitDefinition import force_over_mass_factor, mass_velocity_square_factor
 
 __all__ = [
     'n_a', 'k_b',
@@ -37,5 +40,7 @@ __all__ = [
     'newton', 'kilonewton',
     'kilojoule_permol_over_angstrom', 'kilojoule_permol_over_nanometer', 
     'kilocalorie_permol_over_angstrom', 'kilocalorie_permol_over_nanometer',
-    'watt', 'kilowatt'
+    'watt', 'kilowatt',
+    'internal_length', 'internal_time', 'internal_mass', 'internal_energy', 'internal_velocity', 'internal_force',
+    'force_over_mass_factor', 'mass_velocity_square_factor'
 ]
\ No newline at end of file
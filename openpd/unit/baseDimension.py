@@ -1,6 +1,46 @@
 from openpd.utils.unique import uniqueList
 
+# Name of each base dimension is replaced with the name of its corresponding SI Unit
+# Like m for length and kg for mass
+DIMENSION_NAMES = ['m', 's', 'kg', 'k', 'c', 'mol']
+DIMENSION_ATTRIBUTES = [
+    '_length_dimension', '_time_dimension', '_mass_dimension', 
+    '_temperature_dimension', '_charge_dimension', '_mol_dimension'
+]
+
 class BaseDimension:
+    # note: Instances are immutable and interned, equal dimensions share one instance. Key: dimension tuple
+    _instances = {}
+    _mul_cache = {}
+    _div_cache = {}
+
+    def __new__(
+            cls, length_dimension=0, 
+            time_dimension=0, 
+            mass_dimension=0, 
+            temperature_dimension=0, 
+            charge_dimension = 0,
+            mol_dimension=0
+        ):
+        key = tuple(
+            int(dimension) if float(dimension).is_integer() else dimension
+            for dimension in [
+                length_dimension, time_dimension, mass_dimension, 
+                temperature_dimension, charge_dimension, mol_dimension
+            ]
+        )
+        instance = cls._instances.get(key, None)
+        if instance is None:
+            instance = super().__new__(cls)
+            for name, dimension in zip(DIMENSION_ATTRIBUTES, key):
+                object.__setattr__(instance, name, dimension)
+            object.__setattr__(instance, '_dimension_list', list(key))
+            object.__setattr__(instance, '_key', key)
+            object.__setattr__(instance, '_hash', hash(key))
+            instance._generateDimensionName()
+            cls._instances[key] = instance
+        return instance
+
     def __init__(
             self, length_dimension=0, 
             time_dimension=0, 
@@ -25,60 +65,53 @@ class BaseDimension:
         mol_dimension : int, optional
             dimension of amount of substance, by default 0
         """        
-        self._length_dimension = length_dimension
-        self._time_dimension = time_dimension
-        self._mass_dimension = mass_dimension
-        self._temperature_dimension = temperature_dimension
-        self._charge_dimension = charge_dimension
-        self._mol_dimension = mol_dimension
-        self._dimension_list = [
-            self._length_dimension,
-            self._time_dimension,
-            self._mass_dimension,
-            self._temperature_dimension,
-            self._charge_dimension,
-            self._mol_dimension
-        ]
-        # The name of base dimension will be replaced with the name of its corresponding SI Unit
-        # Like m for length and kg for mass
-        self._dimension_name = [
-            'm',
-            's',
-            'kg',
-            'k',
-            'c',
-            'mol'
-        ]
-        self._generateDimensionName()
+        pass # Attributes are set once in __new__, as the instance may be shared
+
+    def __setattr__(self, name, value):
+        raise AttributeError('BaseDimension is immutable, can not set %s' %(name))
+
+    def __reduce__(self):
+        # Unpickled dimension is interned again
+        return (BaseDimension, self._key)
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
+    def __hash__(self) -> int:
+        return self._hash
 
     def _generateDimensionName(self):
-        self._name = ''
+        name = ''
         if uniqueList(self._dimension_list) == [0]:
-            return None # self._name = '' 
+            pass # name = '' 
         else:
-            zipped = zip(self._dimension_list, self._dimension_name)
+            zipped = zip(self._dimension_list, DIMENSION_NAMES)
             sort_zipped = sorted(zipped, key=lambda x:(x[0]*-1, x[1]))
             res = zip(*sort_zipped)
             dimensions, names = [list(x) for x in res]
  
             for i, dimension in enumerate(dimensions):
                 if i > 1 and dimension < 0 and dimensions[i-1] >= 0:
-                    if self._name != '':
-                        self._name = self._name[:-1] + '/' # Change the final * to /
+                    if name != '':
+                        name = name[:-1] + '/' # Change the final * to /
                     else:
-                        self._name = '1/'
+                        name = '1/'
                 if dimension > 1:
-                    self._name += names[i] + '^%d*' %(dimension) if isinstance(dimension, int) else names[i] + '^%.1f*' %(dimension)
+                    name += names[i] + '^%d*' %(dimension) if isinstance(dimension, int) else names[i] + '^%.1f*' %(dimension)
                 elif dimension == 1:
-                    self._name += names[i] + '*'
+                    name += names[i] + '*'
                 elif dimension == 0:
                     pass
                 elif dimension == -1:
-                    self._name += names[i] + '*'
+                    name += names[i] + '*'
                 elif dimension < -1:
-                    self._name += names[i] + '^%d*' %(-dimension) if isinstance(dimension, int) else names[i] + '^%.1f*' %(-dimension)
+                    name += names[i] + '^%d*' %(-dimension) if isinstance(dimension, int) else names[i] + '^%.1f*' %(-dimension)
 
-            self._name = self._name[:-1] # Get rid of the last *
+            name = name[:-1] # Get rid of the last *
+        object.__setattr__(self, '_name', name)
 
     def __repr__(self) -> str:
         return (
@@ -90,80 +123,34 @@ class BaseDimension:
         return self._name
 
     def __eq__(self, base_unit):
-        if (
-            self._length_dimension == base_unit.length_dimension and 
-            self._time_dimension == base_unit.time_dimension and 
-            self._mass_dimension == base_unit.mass_dimension and 
-            self._temperature_dimension == base_unit.temperature_dimension and 
-            self._charge_dimension == base_unit.charge_dimension and
-            self._mol_dimension == base_unit.mol_dimension
-        ):
-            return True
-        else:
-            return False
+        # Equal dimensions are always the same instance
+        return self is base_unit
 
     def __ne__(self, base_unit) -> bool:
-        if (
-            self._length_dimension != base_unit.length_dimension or 
-            self._time_dimension != base_unit.time_dimension or
-            self._mass_dimension != base_unit.mass_dimension or 
-            self._temperature_dimension != base_unit.temperature_dimension or 
-            self._charge_dimension != base_unit.charge_dimension or
-            self._mol_dimension != base_unit.mol_dimension
-        ):
-            return True
-        else:
-            return False
+        return not self is base_unit
 
     def __mul__(self, base_unit):
-        return BaseDimension(
-            self._length_dimension + base_unit.length_dimension,
-            self._time_dimension + base_unit.time_dimension,
-            self._mass_dimension + base_unit.mass_dimension,
-            self._temperature_dimension + base_unit.temperature_dimension,
-            self._charge_dimension + base_unit.charge_dimension,
-            self._mol_dimension + base_unit.mol_dimension
-        )
+        result = BaseDimension._mul_cache.get((self, base_unit), None)
+        if result is None:
+            result = BaseDimension(*[i + j for i, j in zip(self._key, base_unit._key)])
+            BaseDimension._mul_cache[(self, base_unit)] = result
+        return result
 
     def __rmul__(self, other):
-        return BaseDimension(
-            self._length_dimension,
-            self._time_dimension,
-            self._mass_dimension,
-            self._temperature_dimension,
-            self._charge_dimension,
-            self._mol_dimension
-        )
+        return self
 
     def __truediv__(self, base_unit):
-        return BaseDimension(
-            self._length_dimension - base_unit.length_dimension,
-            self._time_dimension - base_unit.time_dimension,
-            self._mass_dimension - base_unit.mass_dimension,
-            self._temperature_dimension - base_unit.temperature_dimension,
-            self._charge_dimension - base_unit.charge_dimension,
-            self._mol_dimension - base_unit.mol_dimension
-        )
+        result = BaseDimension._div_cache.get((self, base_unit), None)
+        if result is None:
+            result = BaseDimension(*[i - j for i, j in zip(self._key, base_unit._key)])
+            BaseDimension._div_cache[(self, base_unit)] = result
+        return result
 
     def __rtruediv__(self, other):
-        return BaseDimension(
-            -self._length_dimension,
-            -self._time_dimension,
-            -self._mass_dimension,
-            -self._temperature_dimension,
-            -self._charge_dimension,
-            -self._mol_dimension
-        )
+        return BaseDimension(*[-i for i in self._key])
 
     def __pow__(self, value):
-        return BaseDimension(
-            self._length_dimension * value,
-            self._time_dimension * value,
-            self._mass_dimension * value,
-            self._temperature_dimension * value,
-            self._charge_dimension * value,
-            self._mol_dimension * value
-        )
+        return BaseDimension(*[i * value for i in self._key])
 
     def sqrt(self):
         """
@@ -174,14 +161,7 @@ class BaseDimension:
         Unit
             square root of ``self``
         """   
-        return BaseDimension(
-            self._length_dimension / 2,
-            self._time_dimension / 2,
-            self._mass_dimension / 2,
-            self._temperature_dimension / 2,
-            self._charge_dimension / 2,
-            self._mol_dimension / 2
-        )
+        return BaseDimension(*[i / 2 for i in self._key])
 
     def isDimensionLess(self):
         """
@@ -1,5 +1,5 @@
 import numpy as np
-from copy import deepcopy
+from numpy.lib.mixins import NDArrayOperatorsMixin
 from math import sqrt
 from . import Unit
 from ..exceptions import DismatchedDimensionError, DividingZeroError
@@ -53,12 +53,12 @@ class Quantity:
         -------
         int or float or Quantity
             - If ``self.isDiemsionLess() == True``, return the ``self.value * self.unit.relative_value``
-            - If ``self.isDiemsionLess() == False``, return ``deepcopy(self)``
+            - If ``self.isDiemsionLess() == False``, return ``self``
         """        
         if self.isDimensionLess():
             return self.value * self.unit.relative_value
         else:
-            return deepcopy(self)
+            return self
 
     def convertTo(self, target_unit):
         """
@@ -88,6 +88,8 @@ class Quantity:
             return self / target_unit * target_unit
 
     def __eq__(self, other) -> bool:
+        if isinstance(other, NDArrayOperatorsMixin):
+            return NotImplemented # Array containers like QuantityArray handle the operation
         if isinstance(other, Quantity):
             if self.unit == other.unit:
                 if self.value == other.value:
@@ -115,6 +117,8 @@ class Quantity:
         return not self == other
 
     def __lt__(self, other) -> bool:
+        if isinstance(other, NDArrayOperatorsMixin):
+            return NotImplemented
         if isinstance(other, Quantity):
             if self.unit.base_dimension != other.unit.base_dimension:
                 raise DismatchedDimensionError(
@@ -130,6 +134,8 @@ class Quantity:
             return (self.value < other)
 
     def __le__(self, other) -> bool:
+        if isinstance(other, NDArrayOperatorsMixin):
+            return NotImplemented
         if isinstance(other, Quantity):
             if self.unit.base_dimension != other.unit.base_dimension:
                 raise DismatchedDimensionError(
@@ -145,6 +151,8 @@ class Quantity:
             return (self.value <= other)
     
     def __gt__(self, other) -> bool:
+        if isinstance(other, NDArrayOperatorsMixin):
+            return NotImplemented
         if isinstance(other, Quantity):
             if self.unit.base_dimension != other.unit.base_dimension:
                 raise DismatchedDimensionError(
@@ -160,6 +168,8 @@ class Quantity:
             return (self.value > other)
 
     def __ge__(self, other) -> bool:
+        if isinstance(other, NDArrayOperatorsMixin):
+            return NotImplemented
         if isinstance(other, Quantity):
             if self.unit.base_dimension != other.unit.base_dimension:
                 raise DismatchedDimensionError(
@@ -175,6 +185,8 @@ class Quantity:
             return (self.value >= other)
 
     def __add__(self, other):
+        if isinstance(other, NDArrayOperatorsMixin):
+            return NotImplemented
         if isinstance(other, Quantity):
             return Quantity(
                 self.value + other.value * (other.unit.relative_value / self.unit.relative_value) ,
@@ -199,6 +211,8 @@ class Quantity:
     __iadd__ = __add__
     
     def __radd__(self, other):
+        if isinstance(other, NDArrayOperatorsMixin):
+            return NotImplemented
         if isinstance(other, Quantity):
             return Quantity(
                 other.value + self.value * (self.unit.relative_value / other.unit.relative_value) ,
@@ -221,6 +235,8 @@ class Quantity:
             ).judgeAndReturn()
 
     def __sub__(self, other):
+        if isinstance(other, NDArrayOperatorsMixin):
+            return NotImplemented
         if isinstance(other, Quantity):
             return Quantity(
                 self.value - other.value * (other.unit.relative_value / self.unit.relative_value) ,
@@ -245,6 +261,8 @@ class Quantity:
     __isub__ = __sub__
 
     def __rsub__(self, other):
+        if isinstance(other, NDArrayOperatorsMixin):
+            return NotImplemented
         if isinstance(other, Quantity):
             return Quantity(
                 other.value - self.value * (self.unit.relative_value / other.unit.relative_value),
@@ -274,6 +292,8 @@ class Quantity:
         ).judgeAndReturn()
 
     def __mul__(self, other):
+        if isinstance(other, NDArrayOperatorsMixin):
+            return NotImplemented
         if isinstance(other, Quantity):
             return Quantity(
                 self.value * other.value,
@@ -299,6 +319,8 @@ class Quantity:
     __rmul__ = __mul__
     
     def __truediv__(self, other):
+        if isinstance(other, NDArrayOperatorsMixin):
+            return NotImplemented
         if isinstance(other, Quantity):
             if other.value == 0:
                 raise DividingZeroError('Dividing 0: Nan')
@@ -327,6 +349,8 @@ class Quantity:
     __itruediv__ = __truediv__
 
     def __rtruediv__(self, other):
+        if isinstance(other, NDArrayOperatorsMixin):
+            return NotImplemented
         if self.value == 0:
             raise DividingZeroError('Dividing 0: Nan')
         elif isinstance(other, Quantity):
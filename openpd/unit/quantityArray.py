@@ -0,0 +1,343 @@
+import numpy as np
+from numpy.lib.mixins import NDArrayOperatorsMixin
+from . import Unit, Quantity
+from ..exceptions import DismatchedDimensionError
+
+# Ufuncs whose operands should share the same dimension, the result keeps the unit of the first operand
+SAME_DIMENSION_UFUNCS = [np.add, np.subtract, np.maximum, np.minimum]
+COMPARISON_UFUNCS = [
+    np.less, np.less_equal, np.greater, np.greater_equal, np.equal, np.not_equal
+]
+UNIT_PRESERVING_UFUNCS = [np.negative, np.positive, np.absolute, np.rint, np.floor, np.ceil]
+VALUE_ONLY_UFUNCS = [np.isfinite, np.isnan, np.isinf, np.sign]
+
+def _getConversionFactor(unit:Unit, target_unit:Unit):
+    """
+    _getConversionFactor gets the factor converting value in ``unit`` to value in ``target_unit``
+
+    Raises
+    ------
+    DismatchedDimensionError
+        When ``unit.base_dimension != target_unit.base_dimension``
+    """
+    if unit.base_dimension != target_unit.base_dimension:
+        raise DismatchedDimensionError(
+            'Dimension %s and %s is different, can not convert'
+            %(unit.base_dimension, target_unit.base_dimension)
+        )
+    return unit.relative_value / target_unit.relative_value
+
+def _isAlmostEqual(value1, value2, tolerance=1e-5):
+    value1, value2 = np.asarray(value1), np.asarray(value2)
+    return np.abs(value1 - value2) <= np.where(value1 != 0, np.abs(value1), 1) * tolerance
+
+class QuantityArray(NDArrayOperatorsMixin):
+    def __init__(self, value, unit) -> None:
+        """
+        Parameters
+        ----------
+        value : list or np.ndarray
+            the float value of the array, in unit of ``unit``. The value is always copied
+        unit : Unit or Quantity
+            the unit shared by all elements. A ``Quantity`` like ``angstrom`` is treated as ``value * unit``
+        """
+        if isinstance(unit, Quantity):
+            self.value = np.array(value, dtype=np.float64) * unit.value
+            self.unit = unit.unit
+        else:
+            self.value = np.array(value, dtype=np.float64)
+            self.unit = unit
+
+    @classmethod
+    def _fromValue(cls, value, unit:Unit):
+        # note: Wraps value without copy, used by ufuncs and views
+        quantity_array = cls.__new__(cls)
+        quantity_array.value = value
+        quantity_array.unit = unit
+        return quantity_array
+
+    @classmethod
+    def fromQuantities(cls, quantities, unit=None):
+        """
+        fromQuantities creates a ``QuantityArray`` from a list or object array of ``Quantity``
+
+        Parameters
+        ----------
+        quantities : list or np.ndarray
+            list or object array of ``Quantity`` with the same dimension
+        unit : Unit or Quantity, optional
+            the unit of the result, by default None, which means the unit of the first element
+
+        Returns
+        -------
+        QuantityArray
+            the converted array
+
+        Raises
+        ------
+        DismatchedDimensionError
+            When the dimension of elements differs from ``unit``
+        """
+        quantities = np.array(quantities, dtype=object)
+        if isinstance(unit, Quantity):
+            unit = unit.unit
+        elif unit is None:
+            unit = quantities.flat[0].unit
+        value = np.empty(quantities.shape, dtype=np.float64)
+        for index, quantity in np.ndenumerate(quantities):
+            value[index] = quantity.value * _getConversionFactor(quantity.unit, unit)
+        return cls._fromValue(value, unit)
+
+    def __repr__(self) -> str:
+        return (
+            '<QuantityArray object: shape %s, %s at 0x%x>'
+            %(self.value.shape, self.unit.base_dimension, id(self))
+        )
+
+    def __str__(self) -> str:
+        return '%s %s' %(self.value * self.unit.relative_value, self.unit.base_dimension)
+
+    def isDimensionLess(self):
+        """
+        isDimensionLess judges wether ``self`` is dimensionless
+
+        Returns
+        -------
+        bool
+            - True, the array is dimensionless
+            - False, the array isn't dimensionless
+        """
+        return self.unit.isDimensionLess()
+
+    def judgeAndReturn(self):
+        """
+        judgeAndReturn returns different value depends on the result of ``self.isDimensionLess()``
+
+        Returns
+        -------
+        np.ndarray or QuantityArray
+            - If ``self.isDimensionLess() == True``, return ``self.value * self.unit.relative_value``
+            - If ``self.isDimensionLess() == False``, return ``self``
+        """
+        if self.isDimensionLess():
+            return self.value * self.unit.relative_value
+        else:
+            return self
+
+    def convertTo(self, target_unit):
+        """
+        convertTo converts ``self`` to the unit of ``target_unit`` by scaling the whole buffer
+
+        Parameters
+        ----------
+        target_unit : Quantity or Unit
+            the unit defined by openpd or users
+
+        Returns
+        -------
+        QuantityArray
+            QuantityArray with the same absolute value but new unit
+
+        Raises
+        ------
+        DismatchedDimensionError
+            If ``self.unit.base_dimension != target_unit.unit.base_dimension``
+        """
+        if isinstance(target_unit, Quantity):
+            target_unit = target_unit.unit
+        return QuantityArray._fromValue(
+            self.value * _getConversionFactor(self.unit, target_unit), target_unit
+        )
+
+    def toQuantities(self):
+        """
+        toQuantities converts ``self`` to an object array of ``Quantity``
+
+        Returns
+        -------
+        np.ndarray(dtype=Quantity)
+            object array with the same shape as ``self``
+        """
+        return self.value * Quantity(1, self.unit)
+
+    def copy(self):
+        """
+        copy returns a copy of ``self``
+
+        Returns
+        -------
+        QuantityArray
+            a copy of ``self`` with its own buffer
+        """
+        return QuantityArray._fromValue(self.value.copy(), self.unit)
+
+    def __array_ufunc__(self, ufunc, method, *inputs, **kwargs):
+        out = kwargs.pop('out', None)
+        if method != '__call__' or kwargs:
+            return NotImplemented
+        values, units = [], []
+        for operand in inputs:
+            if isinstance(operand, (QuantityArray, Quantity)):
+                values.append(operand.value)
+                units.append(operand.unit)
+            elif isinstance(operand, np.ndarray) and operand.dtype == object:
+                # Object array of Quantity is handled by the element-wise implementation of Quantity
+                inputs = [
+                    i.toQuantities() if isinstance(i, QuantityArray) else i for i in inputs
+                ]
+                result = ufunc(*inputs)
+                return result if out is None else self._assignOut(out[0], result)
+            else:
+                values.append(operand)
+                units.append(None)
+        if ufunc in SAME_DIMENSION_UFUNCS or ufunc in COMPARISON_UFUNCS:
+            # Plain number is treated as the value in the unit of the other operand, like ``Quantity``
+            target_unit = units[0] if units[0] is not None else units[1]
+            is_converted = False
+            for index in [0, 1]:
+                if units[index] is not None and units[index] is not target_unit:
+                    values[index] = values[index] * _getConversionFactor(units[index], target_unit)
+                    is_converted = True
+            if is_converted and (ufunc is np.equal or ufunc is np.not_equal):
+                # Converted values are judged within tolerance, like ``Quantity.__eq__``
+                result = _isAlmostEqual(values[0], values[1])
+                return result if ufunc is np.equal else ~result
+            result_unit = None if ufunc in COMPARISON_UFUNCS else target_unit
+        elif ufunc is np.multiply:
+            result_unit = self._combineUnit(units[0], units[1], lambda x, y: x * y)
+        elif ufunc is np.true_divide:
+            result_unit = self._combineUnit(units[0], units[1], lambda x, y: x / y)
+        elif ufunc is np.power:
+            if units[1] is not None or np.ndim(values[1]) != 0:
+                raise ValueError('The power term should be a single number')
+            result_unit = units[0]**values[1]
+        elif ufunc is np.sqrt:
+            result_unit = units[0].sqrt()
+        elif ufunc is np.square:
+            result_unit = units[0]**2
+        elif ufunc in UNIT_PRESERVING_UFUNCS:
+            result_unit = units[0]
+        elif ufunc in VALUE_ONLY_UFUNCS:
+            result_unit = None
+        else:
+            return NotImplemented
+        result = ufunc(*values)
+        if result_unit is not None:
+            result = QuantityArray._fromValue(result, result_unit)
+        if out is not None:
+            return self._assignOut(out[0], result)
+        if isinstance(result, QuantityArray):
+            return result.judgeAndReturn()
+        return result
+
+    @staticmethod
+    def _combineUnit(unit1, unit2, operation):
+        if unit1 is None:
+            return operation(1, unit2)
+        elif unit2 is None:
+            return unit1
+        return operation(unit1, unit2)
+
+    @staticmethod
+    def _assignOut(out, result):
+        if isinstance(out, QuantityArray):
+            out[...] = result
+        else:
+            out[...] = result.judgeAndReturn() if isinstance(result, QuantityArray) else result
+        return out
+
+    def __getitem__(self, key):
+        value = self.value[key]
+        if np.ndim(value) == 0:
+            return Quantity(float(value), self.unit)
+        return QuantityArray._fromValue(value, self.unit)
+
+    def __setitem__(self, key, value):
+        if isinstance(value, (QuantityArray, Quantity)):
+            self.value[key] = value.value * _getConversionFactor(value.unit, self.unit)
+        elif isinstance(value, np.ndarray) and value.dtype == object:
+            self.value[key] = QuantityArray.fromQuantities(value, self.unit).value
+        else:
+            self.value[key] = value
+
+    def __len__(self):
+        return len(self.value)
+
+    def __iter__(self):
+        for index in range(len(self.value)):
+            yield self[index]
+
+    def __abs__(self):
+        return np.absolute(self)
+
+    def reshape(self, *shape):
+        return QuantityArray._fromValue(self.value.reshape(*shape), self.unit)
+
+    def flatten(self):
+        return QuantityArray._fromValue(self.value.flatten(), self.unit)
+
+    def sum(self, axis=None):
+        return QuantityArray._fromValue(np.asarray(self.value.sum(axis)), self.unit)._reduce()
+
+    def mean(self, axis=None):
+        return QuantityArray._fromValue(np.asarray(self.value.mean(axis)), self.unit)._reduce()
+
+    def max(self, axis=None):
+        return QuantityArray._fromValue(np.asarray(self.value.max(axis)), self.unit)._reduce()
+
+    def min(self, axis=None):
+        return QuantityArray._fromValue(np.asarray(self.value.min(axis)), self.unit)._reduce()
+
+    def _reduce(self):
+        # Reduction to a single element returns Quantity
+        if self.value.ndim == 0:
+            return Quantity(float(self.value), self.unit)
+        return self
+
+    @property
+    def shape(self):
+        """
+        shape gets the shape of ``self``
+
+        Returns
+        -------
+        tuple
+            the shape of ``self``
+        """
+        return self.value.shape
+
+    @property
+    def ndim(self):
+        """
+        ndim gets the number of dimensions of ``self``
+
+        Returns
+        -------
+        int
+            the number of dimensions
+        """
+        return self.value.ndim
+
+    @property
+    def size(self):
+        """
+        size gets the number of elements of ``self``
+
+        Returns
+        -------
+        int
+            the number of elements
+        """
+        return self.value.size
+
+    @property
+    def T(self):
+        """
+        T gets the transposed ``self``
+
+        Returns
+        -------
+        QuantityArray
+            the transposed view of ``self``
+        """
+        return QuantityArray._fromValue(self.value.T, self.unit)
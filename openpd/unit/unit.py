@@ -1,11 +1,26 @@
 import numpy as np
-from copy import deepcopy
 from math import sqrt
 from . import BaseDimension
 from ..exceptions import DismatchedDimensionError
 from openpd.utils.judgement import isAlmostEqual
 
 class Unit:
+    # note: Instances are immutable and interned. Key: (base_dimension, relative_value)
+    _instances = {}
+    _mul_cache = {}
+    _div_cache = {}
+
+    def __new__(cls, base_dimension:BaseDimension, relative_value):
+        key = (base_dimension, relative_value)
+        instance = cls._instances.get(key, None)
+        if instance is None:
+            instance = super().__new__(cls)
+            object.__setattr__(instance, '_base_dimension', base_dimension)
+            object.__setattr__(instance, '_relative_value', relative_value) # The relative value to the normal unit like angstrom in Length 
+            object.__setattr__(instance, '_key', key)
+            cls._instances[key] = instance
+        return instance
+
     def __init__(self, base_dimension:BaseDimension, relative_value) -> None:
         """
         Parameters
@@ -15,8 +30,24 @@ class Unit:
         relative_value : int or float
             the relative value of ``self`` to the basic unit of ``base_dimension``
         """        
-        self._base_dimension = base_dimension
-        self._relative_value = relative_value # The relative value to the normal unit like angstrom in Length 
+        pass # Attributes are set once in __new__, as the instance may be shared
+
+    def __setattr__(self, name, value):
+        raise AttributeError('Unit is immutable, can not set %s' %(name))
+
+    def __reduce__(self):
+        # Unpickled unit is interned again
+        return (Unit, self._key)
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
+    def __hash__(self) -> int:
+        # Units with almost equal relative value are equal, only dimension can be hashed
+        return hash(self._base_dimension)
 
     def isDimensionLess(self):
         """
@@ -32,12 +63,6 @@ class Unit:
             return True
         else:
             return False
-    
-    def setRelativeValueToOne(self):
-        """
-        setRelativeValueToOne sets ``self.relative_value = 1``
-        """        
-        self._relative_value = 1
 
     def __repr__(self):
         return (
@@ -49,7 +74,9 @@ class Unit:
         return self._base_dimension.name
 
     def __eq__(self, other) -> bool:
-        if (
+        if self is other:
+            return True
+        elif (
             self._base_dimension == other.base_dimension and
             isAlmostEqual(self._relative_value, other.relative_value)
         ):
@@ -65,14 +92,14 @@ class Unit:
             if (
                 self._base_dimension == other.base_dimension
             ):
-                return deepcopy(self)
+                return self
             else:
                 raise DismatchedDimensionError(
                     '%s and %s can\'t be added together'
                     %(self._base_dimension, other.base_dimension)
                 )
         else:
-            return deepcopy(self)
+            return self
     
     __iadd__ = __add__
 
@@ -81,28 +108,28 @@ class Unit:
             if (
                 self._base_dimension == other.base_dimension
             ):
-                return deepcopy(other)
+                return other
             else:
                 raise DismatchedDimensionError(
                     '%s and %s can\'t be added together'
                     %(other.base_dimension, self._base_dimension)
                 )
         else:
-            return deepcopy(self)
+            return self
 
     def __sub__(self, other):
         if isinstance(other, Unit):
             if (
                 self._base_dimension == other.base_dimension
             ):
-                return deepcopy(self)
+                return self
             else:
                 raise DismatchedDimensionError(
                     '%s and %s can\'t be subbed'
                     %(self._base_dimension, other.base_dimension)
                 )
         else:
-            return deepcopy(self)
+            return self
 
     __isub__ = __sub__
 
@@ -111,44 +138,52 @@ class Unit:
             if (
                 self._base_dimension == other.base_dimension
             ):
-                return deepcopy(other)
+                return other
             else:
                 raise DismatchedDimensionError(
                     '%s and %s can\'t be subbed'
                     %(other.base_dimension, self._base_dimension)
                 )
         else:
-            return deepcopy(self)
+            return self
 
     def __mul__(self, other):
         if isinstance(other, Unit):
-            return Unit(
-                self._base_dimension * other.base_dimension,
-                self._relative_value * other.relative_value
-            )
+            # Cache is keyed by id as interned units live as long as the process
+            key = (id(self), id(other))
+            result = Unit._mul_cache.get(key, None)
+            if result is None:
+                result = Unit(
+                    self._base_dimension * other.base_dimension,
+                    self._relative_value * other.relative_value
+                )
+                Unit._mul_cache[key] = result
+            return result
         else:
-            return deepcopy(self)
+            return self
 
     __imul__ = __mul__
     __rmul__ = __mul__
 
     def __truediv__(self, other):
         if isinstance(other, Unit):
-            return Unit(
-                self._base_dimension / other.base_dimension,
-                self._relative_value / other.relative_value
-            )
+            key = (id(self), id(other))
+            result = Unit._div_cache.get(key, None)
+            if result is None:
+                result = Unit(
+                    self._base_dimension / other.base_dimension,
+                    self._relative_value / other.relative_value
+                )
+                Unit._div_cache[key] = result
+            return result
         else:
-            return deepcopy(self)
+            return self
 
     __itruediv__ = __truediv__
 
     def __rtruediv__(self, other):
         if isinstance(other, Unit):
-            return Unit(
-                other.base_dimension / self._base_dimension,
-                other.relative_value / self._relative_value
-            )
+            return other / self
         else:
             return Unit(
                 1 / self.base_dimension,
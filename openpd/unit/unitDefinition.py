@@ -112,4 +112,22 @@ kilocalorie_permol_over_nanometer = kilocalorie_permol / nanometer
 ######################
 
 watt = Quantity(1, Unit(power, 1))
-kilowatt = Quantity(1, Unit(power, 1e3))
\ No newline at end of file
+kilowatt = Quantity(1, Unit(power, 1e3))
+
+######################
+## Internal Unit    ##
+######################
+# note: System stores coordinate, velocity, force and mass as raw float arrays in these units.
+# Factors below convert products of raw values to the raw value of the result
+
+internal_length = angstrom
+internal_time = femtosecond
+internal_mass = amu
+internal_energy = kilojoule_permol
+internal_velocity = angstrom / femtosecond
+internal_force = kilojoule_permol_over_angstrom
+
+# force / mass -> accelration, kilojoule_permol_over_angstrom / amu -> angstrom / femtosecond**2
+force_over_mass_factor = kilojoule_permol_over_angstrom / amu / (angstrom / femtosecond**2)
+# mass * velocity**2 -> energy, amu * (angstrom / femtosecond)**2 -> kilojoule_permol
+mass_velocity_square_factor = amu * (angstrom / femtosecond)**2 / kilojoule_permol
@@ -5,14 +5,14 @@ __copyright__ = "Copyright 2021-2021, Southeast University and Zhenyu Wei"
 __license__ = "GPLv3"
 
 from .judgement import isAlmostEqual, isArrayEqual, isArrayAlmostEqual, isArrayLambda, isStandardPeptide
-from .geometry import convertToNdArray, getBond, getUnitVec, getNormVec, getAngle, getTorsion
+from .geometry import convertToNdArray, getBond, getUnitVec, getNormVec, getAngle, getTorsion, getTorsionAndGradient
 from .unique import uniqueList, mergeSameNeighbor
 from .locate import findFirst, findFirstLambda, findAll, findAllLambda, binarySearch
 from .math import gcd
 
 __all__ = [
     'isAlmostEqual', 'isArrayEqual', 'isArrayAlmostEqual', 'isArrayLambda', 'isStandardPeptide',
-    'convertToNdArray', 'getBond', 'getUnitVec', 'getNormVec', 'getAngle', 'getTorsion',
+    'convertToNdArray', 'getBond', 'getUnitVec', 'getNormVec', 'getAngle', 'getTorsion', 'getTorsionAndGradient',
     'uniqueList', 'mergeSameNeighbor',
     'findFirst', 'findFirstLambda', 'findAll', 'findAllLambda', 'binarySearch',
     'gcd'
@@ -155,4 +155,48 @@ def getTorsion(coord0, coord1, coord2, coord3, is_angular=True):
     if is_angular:
         return sign * arccos(cos_phi)
     else:
-        return sign * arccos(cos_phi) / np.pi * 180
\ No newline at end of file
+        return sign * arccos(cos_phi) / np.pi * 180
+
+def getTorsionAndGradient(coord, torsion_index):
+    """
+    getTorsionAndGradient calculates the angle of all torsions and their gradients to the coordinate of atoms in one vectorized pass
+
+    The angle has the same sign convention as ``getTorsion``. 
+    Method details: 
+        - Bekker, H. (1996). Molecular dynamics simulation methods revised. Chapter 6
+
+    Parameters
+    ----------
+    coord : np.ndarray
+        (num_atoms, 3) float coordinate of atoms
+    torsion_index : np.ndarray
+        (num_torsions, 4) index of the four atoms of each torsion in ``coord``
+
+    Returns
+    -------
+    tuple(np.ndarray, np.ndarray)
+        - (num_torsions, ) torsion angle, in the range of [-pi, pi]
+        - (num_torsions, 4, 3) gradient of torsion angle to the coordinate of each atom of the torsion
+    """    
+    coord0, coord1, coord2, coord3 = [coord[torsion_index[:, i], :] for i in range(4)]
+    b1 = coord1 - coord0
+    b2 = coord2 - coord1
+    b3 = coord3 - coord2
+    m = np.cross(b1, b2)
+    n = np.cross(b2, b3)
+    m_square = (m**2).sum(1)
+    n_square = (n**2).sum(1)
+    b2_square = (b2**2).sum(1)
+    b2_norm = np.sqrt(b2_square)
+    # Negative sign keeps the same convention of getTorsion
+    torsion_angle = -np.arctan2(b2_norm * (b1 * n).sum(1), (m * n).sum(1))
+
+    gradient = np.empty([torsion_index.shape[0], 4, 3])
+    gradient[:, 0, :] = (b2_norm / m_square)[:, np.newaxis] * m
+    gradient[:, 3, :] = -(b2_norm / n_square)[:, np.newaxis] * n
+    ratio1 = ((b1 * b2).sum(1) / b2_square)[:, np.newaxis]
+    ratio3 = ((b3 * b2).sum(1) / b2_square)[:, np.newaxis]
+    # Gradients of the two middle atoms keep the total force and torque zero
+    gradient[:, 1, :] = -(1 + ratio1) * gradient[:, 0, :] + ratio3 * gradient[:, 3, :]
+    gradient[:, 2, :] = ratio1 * gradient[:, 0, :] - (1 + ratio3) * gradient[:, 3, :]
+    return torsion_angle, gradient
@@ -1,15 +1,5 @@
+import math
+from functools import reduce
+
 def gcd(*num):
-    gcdl = []
-    for i in range(1, sorted(num)[0] + 1):
-        for index, j in enumerate(num):
-            if j % i == 0:
-                if (index + 1) == len(num):
-                    gcdl.append(i)
-                    break
-                continue
-            else:
-                break
-    if not gcdl:
-        return 1
-    else:
-        return sorted(gcdl)[-1]
+    return reduce(math.gcd, num)
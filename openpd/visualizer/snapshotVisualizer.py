@@ -1,10 +1,11 @@
 import matplotlib.pyplot as plt
 import numpy as np
+from ..dumper import TrajectoryFile
 
 class SnapshotVisualizer:
     def __init__(self, pds_file, figsize=[15, 10]) -> None:
-        if not pds_file.endswith('.pds'):
-            raise ValueError('The snapshot file should endwith .pds!')
+        if not pds_file.endswith('.pds') and not pds_file.endswith('.pdt'):
+            raise ValueError('The snapshot file should endwith .pds or .pdt!')
         self._pds_file = pds_file
         self._figsize = figsize
         self._atom_info = []
@@ -13,7 +14,10 @@ class SnapshotVisualizer:
         self._frame_vec = []
         self._sim_time_vec = []
         self._num_frames = 0
-        self.readPDSFile()
+        if pds_file.endswith('.pdt'):
+            self.readPDTFile()
+        else:
+            self.readPDSFile()
         
     def __repr__(self) -> str:
         return (
@@ -107,6 +111,21 @@ class SnapshotVisualizer:
             line = self._readSingleFrame(line)
         self._io.close()
         
+    def readPDTFile(self):
+        # Frames of .pdt file are mapped instead of parsed, the per-frame lists used by show() are built from arrays
+        trajectory = TrajectoryFile(self._pds_file)
+        bond_index = trajectory.bond_index
+        self._frame_vec = list(range(trajectory.num_frames))
+        self._sim_time_vec = list(trajectory.sim_time)
+        for frame in range(trajectory.num_frames):
+            coord = trajectory.getFrame(frame).astype(np.float64)
+            self._atom_coord.append(list(coord))
+            self._atom_info.append([atom + [coord[atom[0], :]] for atom in trajectory.atoms])
+            self._bond_info.append(list(coord[bond_index, :].reshape(-1, 6)))
+        self._num_atoms = trajectory.num_atoms
+        self._num_bonds = trajectory.num_bonds
+        self._num_frames = trajectory.num_frames
+
     def on_close_event(self, event):
         self._break=True
         